@@ -0,0 +1,142 @@
+"""
+Columnar loader for the Activities log section of a sandbox log:
+
+    day;timestamp;product;bid_price_1;bid_volume_1;...;ask_volume_3;mid_price;profit_and_loss
+
+The section is parsed once into one float64 array per product, with a row per
+column of the csv (product excluded) and NaN for empty cells, and saved as .npy
+files in a "<log>.activities" directory next to the log. Later loads memory-map
+those files, so they cost a few file opens and no parsing or copying. The cache
+records the size and mtime of the log and is rebuilt when either changes.
+
+    from activities import load_activities
+    bananas = load_activities("4c7a1701-....log")["BANANAS"]
+    bananas["mid_price"], bananas["timestamp"]
+
+    python activities.py <sandbox.log>
+"""
+import json
+import os
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+from datamodel import Product
+
+COLUMNS = ("day", "timestamp",
+           "bid_price_1", "bid_volume_1", "bid_price_2", "bid_volume_2", "bid_price_3", "bid_volume_3",
+           "ask_price_1", "ask_volume_1", "ask_price_2", "ask_volume_2", "ask_price_3", "ask_volume_3",
+           "mid_price", "profit_and_loss")
+
+_HEADER = "Activities log:\n"
+_CSV_HEADER = ["day", "timestamp", "product"] + list(COLUMNS[2:])
+_META = "meta.json"
+_VERSION = 1
+_NAN = float("nan")
+
+
+class ProductActivity(dict):
+    """Column name -> 1-d view of the product's array, in timestamp order."""
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: np.ndarray) -> None:
+        super().__init__(zip(COLUMNS, array))
+        self.array = array
+
+    @property
+    def rows(self) -> int:
+        return self.array.shape[1]
+
+
+def cache_dir(path: str) -> str:
+    return path + ".activities"
+
+
+def _signature(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"version": _VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def parse(path: str) -> Dict[Product, np.ndarray]:
+    """(len(COLUMNS), rows) float64 array per product of the Activities log section."""
+    rows: Dict[Product, List[List[float]]] = {}
+    with open(path) as f:
+        for line in f:
+            if line == _HEADER:
+                break
+        header = f.readline()
+        if header and header.rstrip("\n").split(";") != _CSV_HEADER:
+            raise ValueError(path + ": unexpected Activities log header " + header.strip())
+        for line in f:
+            fields = line.rstrip("\n").split(";")
+            if len(fields) != len(_CSV_HEADER):
+                continue
+            product = fields.pop(2)
+            arr = rows.get(product)
+            if arr is None:
+                arr = rows[product] = []
+            arr.append([float(field) if field else _NAN for field in fields])
+    return {product: np.array(arr, dtype=np.float64).T.copy() for product, arr in rows.items()}
+
+
+def _write(directory: str, arrays: Dict[Product, np.ndarray], signature: Dict[str, int]) -> None:
+    os.makedirs(directory, exist_ok=True)
+    for product, array in arrays.items():
+        tmp = os.path.join(directory, product + ".npy.tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp, os.path.join(directory, product + ".npy"))
+    tmp = os.path.join(directory, _META + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(dict(signature, products=sorted(arrays)), f)
+    os.replace(tmp, os.path.join(directory, _META))
+
+
+def _read_meta(directory: str):
+    try:
+        with open(os.path.join(directory, _META)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_activities(path: str, cache: bool = True) -> Dict[Product, ProductActivity]:
+    """
+    Activities log of a sandbox log per product. With cache=True the arrays are
+    memory-mapped (read-only) from the cache next to the log, which is written
+    first if it is missing or stale; a cache that cannot be written is skipped.
+    """
+    if not cache:
+        return {product: ProductActivity(array) for product, array in parse(path).items()}
+
+    directory = cache_dir(path)
+    signature = _signature(path)
+    meta = _read_meta(directory)
+    if meta is None or any(meta.get(key) != value for key, value in signature.items()):
+        arrays = parse(path)
+        try:
+            _write(directory, arrays, signature)
+        except OSError:
+            return {product: ProductActivity(array) for product, array in arrays.items()}
+        products = sorted(arrays)
+    else:
+        products = meta["products"]
+
+    return {product: ProductActivity(np.load(os.path.join(directory, product + ".npy"), mmap_mode="r"))
+            for product in products}
+
+
+def main(argv: List[str]) -> None:
+    if len(argv) != 2:
+        print(__doc__.strip().splitlines()[-1].strip())
+        raise SystemExit(2)
+    for product, activity in sorted(load_activities(argv[1]).items()):
+        mid_price = activity["mid_price"]
+        print(f"{product:18s} {activity.rows:5d} rows  mid {np.nanmin(mid_price):9.1f} - {np.nanmax(mid_price):9.1f}"
+              f"  pnl {activity['profit_and_loss'][-1]:10.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,267 @@
+"""
+Offline backtester: replays a day of market data through any Trader.run and
+tracks positions, own trades and PnL per product.
+
+A MarketDay is built from the Activities log of a sandbox log (the order book,
+three levels a side, and the mid price of every product at every tick;
+products without a book, such as DOLPHIN_SIGHTINGS, become observations) and
+optionally the island-data-bottle trades of the same day as market trades. As
+in the sandbox, market_trades and own_trades hold the latest trades of every
+symbol from before the current tick, and orders sent at a tick fill at that
+tick's timestamp with "SUBMISSION" as our side.
+
+Orders are matched by matching.MatchingEngine against the visible book, under
+the exchange's position limits. They do not rest and do not match market
+trades.
+
+    python backtest.py <strategy.py> [sandbox.log ...]
+"""
+import contextlib
+import importlib.util
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from activities import load_activities
+from datamodel import Listing, OrderDepth, Product, Symbol, Trade, TradingState
+from matching import LIMITS, SUBMISSION, MatchingEngine
+from pnl import PnLTracker
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LOG = os.path.join(ROOT, "4c7a1701-ea04-4fd2-967b-4582ec0b953c.log")
+
+Levels = List[Tuple[int, int]]
+
+
+class MarketDay:
+    """
+    Everything a replay needs, converted to plain Python once: per tick the book
+    of every symbol as (bids, asks) lists of (price, volume), best level first
+    with ask volumes negative, the observations, the mid prices and the market
+    trades that become visible at the tick (those from the previous tick on).
+    """
+
+    def __init__(self, day: int, timestamps: List[int], books: List[Dict[Symbol, Tuple[Levels, Levels]]],
+                 observations: List[Dict[Product, Any]], mid_prices: List[Dict[Symbol, float]],
+                 market_trades: Optional[List[List[Trade]]] = None, source: str = "") -> None:
+        self.day = day
+        self.source = source
+        self.timestamps = timestamps
+        self.books = books
+        self.observations = observations
+        self.mid_prices = mid_prices
+        self.market_trades = market_trades or [[] for _ in timestamps]
+        self.symbols: List[Symbol] = sorted(books[0]) if books else []
+        self.products: List[Product] = sorted(set(self.symbols) | set(observations[0] if observations else ()))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def restrict(self, symbols) -> "MarketDay":
+        """The same day with only the books, mid prices and market trades of symbols; observations stay."""
+        keep = set(symbols)
+        return MarketDay(
+            self.day, self.timestamps,
+            [{symbol: book for symbol, book in books.items() if symbol in keep} for books in self.books],
+            self.observations,
+            [{symbol: mid for symbol, mid in mids.items() if symbol in keep} for mids in self.mid_prices],
+            [[trade for trade in trades if trade.symbol in keep] for trades in self.market_trades],
+            self.source,
+        )
+
+    @classmethod
+    def from_log(cls, path: str, trades=None) -> "MarketDay":
+        """
+        Day of the Activities log of a sandbox log. trades is a tradedata.TradeTable;
+        its trades of the same day (if any) are replayed as market trades.
+        """
+        activity = load_activities(path)
+        if not activity:
+            raise ValueError(path + " has no Activities log")
+        first = next(iter(activity.values()))
+        day = int(first["day"][0])
+        timestamps = first["timestamp"].astype(np.int64).tolist()
+        books: List[Dict[Symbol, Tuple[Levels, Levels]]] = [{} for _ in timestamps]
+        observations: List[Dict[Product, Any]] = [{} for _ in timestamps]
+        mid_prices: List[Dict[Symbol, float]] = [{} for _ in timestamps]
+
+        for product, columns in sorted(activity.items()):
+            if columns.rows != len(timestamps) or not np.array_equal(columns["timestamp"], first["timestamp"]):
+                raise ValueError(path + ": " + product + " is not quoted at every tick")
+            mids = columns["mid_price"].tolist()
+            if np.isnan(columns["bid_price_1"]).all() and np.isnan(columns["ask_price_1"]).all():
+                for tick, mid in zip(observations, mids):
+                    tick[product] = int(mid) if mid == mid and mid.is_integer() else mid
+                continue
+            sides = [[(columns[side + "_price_" + level].tolist(), columns[side + "_volume_" + level].tolist())
+                      for level in "123"] for side in ("bid", "ask")]
+            for i, mid in enumerate(mids):
+                bids = [(int(prices[i]), int(volumes[i])) for prices, volumes in sides[0] if prices[i] == prices[i]]
+                asks = [(int(prices[i]), -int(volumes[i])) for prices, volumes in sides[1] if prices[i] == prices[i]]
+                books[i][product] = (bids, asks)
+                if mid == mid:
+                    mid_prices[i][product] = mid
+
+        market_trades: List[List[Trade]] = [[] for _ in timestamps]
+        if trades is not None and day in trades.days():
+            day_trades = trades.select(day=day)
+            ticks = np.searchsorted(first["timestamp"], day_trades.timestamp, "right").tolist()
+            for tick, trade in sorted(zip(ticks, day_trades.trades()), key=lambda item: item[1].timestamp):
+                if tick < len(timestamps):
+                    market_trades[tick].append(trade)
+        return cls(day, timestamps, books, observations, mid_prices, market_trades, os.path.basename(path))
+
+
+class BacktestResult:
+    """
+    pnl[product] is the mark-to-market PnL (cash plus position at the mid price)
+    after every tick; trades are our fills in order; rejected counts the ticks
+    whose orders for a product were rejected for breaching its limit; tracker
+    has the realized / unrealized split, average cost and turnover at the end.
+    """
+
+    def __init__(self, day: int, timestamps: List[int], pnl: Dict[Product, np.ndarray],
+                 positions: Dict[Product, int], trades: List[Trade], seconds: float,
+                 rejected: Optional[Dict[Product, int]] = None, tracker: Optional[PnLTracker] = None) -> None:
+        self.day = day
+        self.timestamps = timestamps
+        self.pnl = pnl
+        self.positions = positions
+        self.trades = trades
+        self.seconds = seconds
+        self.rejected = rejected or {}
+        self.tracker = tracker or PnLTracker()
+
+    @property
+    def total(self) -> np.ndarray:
+        if not self.pnl:
+            return np.zeros(len(self.timestamps))
+        return np.sum(list(self.pnl.values()), axis=0)
+
+    def final_pnl(self) -> Dict[Product, float]:
+        return {product: float(pnl[-1]) if len(pnl) else 0.0 for product, pnl in self.pnl.items()}
+
+    def max_drawdown(self) -> float:
+        total = self.total
+        if not len(total):
+            return 0.0
+        return float(np.max(np.maximum.accumulate(total) - total))
+
+
+def load_strategy(path: str):
+    """The module of a strategy file, loaded under a private name."""
+    name = "_strategy_" + os.path.splitext(os.path.basename(path))[0].replace("(", "_").replace(")", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(_NULL):
+        spec.loader.exec_module(module)
+    return module
+
+
+def load_trader(path: str, **params):
+    """A fresh Trader from a strategy file, constructed with params."""
+    return load_strategy(path).Trader(**params)
+
+
+class _NullWriter:
+    def write(self, s: str) -> int:
+        return len(s)
+
+    def flush(self) -> None:
+        pass
+
+
+_NULL = _NullWriter()
+
+
+def run(trader, market: MarketDay, quiet: bool = True, limits: Dict[Product, int] = LIMITS) -> BacktestResult:
+    """
+    Replay market through trader.run, matching its orders with a MatchingEngine
+    under limits. With quiet=True whatever the strategy prints is dropped.
+    """
+    listings = {symbol: Listing(symbol, symbol, "SEASHELLS") for symbol in market.products}
+    products = market.products
+    index = {product: i for i, product in enumerate(products)}
+    pnl = np.zeros((len(products), len(market)))
+    engine = MatchingEngine(limits)
+    position = engine.position
+    tracker = PnLTracker()
+    market_trades: Dict[Symbol, List[Trade]] = {}
+    own_trades: Dict[Symbol, List[Trade]] = {}
+    fills: List[Trade] = []
+    pending: List[Trade] = []
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(_NULL) if quiet else contextlib.nullcontext():
+        for i, timestamp in enumerate(market.timestamps):
+            _latest(market_trades, market.market_trades[i])
+            _latest(own_trades, pending)
+
+            order_depths = {}
+            for symbol, (bids, asks) in market.books[i].items():
+                order_depth = OrderDepth()
+                order_depth.buy_orders = dict(bids)
+                order_depth.sell_orders = dict(asks)
+                order_depths[symbol] = order_depth
+            state = TradingState(timestamp, listings, order_depths,
+                                 {symbol: list(trades) for symbol, trades in own_trades.items()},
+                                 {symbol: list(trades) for symbol, trades in market_trades.items()},
+                                 dict(position), dict(market.observations[i]))
+
+            orders = trader.run(state) or {}
+
+            pending = engine.match(orders, market.books[i], timestamp)
+            for trade in pending:
+                tracker.on_fill(trade.symbol, trade.price,
+                                trade.quantity if trade.buyer == SUBMISSION else -trade.quantity)
+            fills.extend(pending)
+
+            for symbol, mid in market.mid_prices[i].items():
+                tracker.mark(symbol, mid)
+            for product, j in index.items():
+                pnl[j, i] = tracker.total(product)
+    seconds = time.perf_counter() - start
+
+    return BacktestResult(market.day, market.timestamps, {product: pnl[j] for product, j in index.items()},
+                          dict(position), fills, seconds, dict(engine.rejected), tracker)
+
+
+def _latest(latest: Dict[Symbol, List[Trade]], trades: List[Trade]) -> None:
+    """Replace the trades of every symbol that traded with its new trades."""
+    new: Dict[Symbol, List[Trade]] = {}
+    for trade in trades:
+        new.setdefault(trade.symbol, []).append(trade)
+    latest.update(new)
+
+
+def report(result: BacktestResult, name: str = "") -> str:
+    lines = [f"{name} day {result.day}: {len(result.timestamps)} ticks in {result.seconds:.2f}s, "
+             f"{len(result.trades)} fills, total PnL {float(result.total[-1]) if len(result.timestamps) else 0.0:.1f}, "
+             f"max drawdown {result.max_drawdown():.1f}"]
+    for product, pnl in sorted(result.final_pnl().items()):
+        if pnl or result.positions.get(product) or result.rejected.get(product):
+            inventory = result.tracker[product]
+            lines.append(f"    {product:18s} PnL {pnl:10.1f}  realized {inventory.realized:10.1f}"
+                         f"  position {inventory.position:5d} @ {inventory.average_cost:9.1f}"
+                         f"  turnover {inventory.turnover:11.0f}  rejected {result.rejected.get(product, 0):4d}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str]) -> None:
+    if len(argv) < 2:
+        print(__doc__.strip().splitlines()[-1].strip())
+        raise SystemExit(2)
+    from tradedata import load_trades
+
+    trades = load_trades()
+    for log in argv[2:] or [DEFAULT_LOG]:
+        market = MarketDay.from_log(log, trades)
+        result = run(load_trader(argv[1]), market)
+        print(report(result, os.path.basename(argv[1])))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
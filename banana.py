@@ -1,24 +1,8 @@
-import json
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState, OrderDepth
-from typing import Dict, List, Any
+from datamodel import Order, TradingState, OrderDepth
+from logger import Logger
+from typing import Dict, List
 
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": state,
-            "orders": orders,
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-logger = Logger()
+logger = Logger(compress=False)
 
 class Trader:
     def run(self, state: TradingState) -> Dict[str, List[Order]]:
@@ -46,7 +30,7 @@ class Trader:
                     spread = best_ask - best_bid
                     if spread < 3:
                         if len(order_depth.buy_orders.keys()) > 1:
-                            bid2 = max([x for x in order_depth.buy_orders.keys() if x < best_bid])
+                            bid2 = sorted(order_depth.buy_orders)[-2]
                             if best_bid - bid2 > 2:
                                 # weighted average of bid1 and bid2
                                 # acceptable_price = (best_bid * order_depth.buy_orders[best_bid] + bid2 * order_depth.buy_orders[bid2]) / (order_depth.buy_orders[best_bid] + order_depth.buy_orders[bid2])
@@ -56,7 +40,7 @@ class Trader:
                                 orders.append(Order(product, best_bid, -best_bid_volume))
 
                         if len(order_depth.sell_orders.keys()) > 1:
-                            ask2 = min([x for x in order_depth.sell_orders.keys() if x > best_ask])
+                            ask2 = sorted(order_depth.sell_orders)[1]
                             if ask2 - best_ask > 2:
                                 # weighted average of ask1 and ask2
                                 # acceptable_price = (best_ask * order_depth.sell_orders[best_ask] + ask2 * order_depth.sell_orders[ask2]) / (order_depth.sell_orders[best_ask] + order_depth.sell_orders[ask2])
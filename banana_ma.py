@@ -1,29 +1,16 @@
-import json
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState, OrderDepth
-from typing import Dict, List, Any
+from datamodel import Order, TradingState, OrderDepth
+from logger import Logger
+from rolling import RollingWindow
+from typing import Dict, List
 
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": state,
-            "orders": orders,
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-logger = Logger()
+logger = Logger(compress=False)
 
 class Trader:
 
     def __init__(self) -> None:
-        self.banana = []
+        # BANANAS mid prices: mean of the last 5 and the last 30, and the same one tick earlier
+        self.short = RollingWindow(5)
+        self.long = RollingWindow(30)
 
     def run(self, state: TradingState) -> Dict[str, List[Order]]:
         """
@@ -47,16 +34,16 @@ class Trader:
         if len(order_depth.sell_orders) > 0 and len(order_depth.buy_orders) > 0:
             best_ask = min(order_depth.sell_orders.keys())
             best_bid = max(order_depth.buy_orders.keys())
-            self.banana.append((best_ask+best_bid)/2)
-            if len(self.banana) > 35:
-                self.banana = self.banana[1:]
+            mid_price = (best_ask+best_bid)/2
+            self.short.push(mid_price)
+            self.long.push(mid_price)
         
-        if len(self.banana) > 32:
+        if self.long.count > 32:
 
-            ma_short = sum(self.banana[-5:])/5
-            ma_short_prev = sum(self.banana[-30:])/30
-            ma_long = sum(self.banana[-6:-1])/5
-            ma_long_prev = sum(self.banana[-31:-1])/30
+            ma_short = self.short.mean
+            ma_short_prev = self.long.mean
+            ma_long = self.short.prev_mean
+            ma_long_prev = self.long.prev_mean
 
 
             if ma_short_prev < ma_long_prev and ma_short > ma_long:
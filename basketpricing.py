@@ -0,0 +1,159 @@
+"""
+Executable premium curve of a synthetic basket, e.g. PICNIC_BASKET against
+2 BAGUETTE + 4 DIP + 1 UKULELE, over every level of the books.
+
+Each leg's book is expanded into the price of every unit it can trade
+(np.repeat of the level prices by their volumes, best first), all legs of both
+sides in one array. The premium of the n-th basket unit is then the signed sum,
+over the legs, of the units it consumes: weight w takes |w| units per basket,
+so a leg's contribution is a difference of one cumsum over the whole array.
+Selling the basket (hitting the bids of positive legs, lifting the asks of
+negative legs) gets a premium that only falls with size, buying it pays one
+that only rises, so the most baskets worth trading at a threshold is a
+searchsorted, for any number of thresholds at once. orders(n) turns a size
+into one order per leg at the price of the last unit it needs, which fills
+every level on the way. Books are read with dict operations only, so this
+runs on the exchange's OrderDepth; position limits come from the strategy.
+numpy is imported lazily (lazyimport.py): importing PICNIC_BASKET alone does
+not load it.
+
+    sell, buy = basket_curves(state.order_depths)
+    n = min(sell.size_at(430), sell.room(state.position, limits))   # limits: the strategy's own
+    result.update(sell.orders(n))
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Tuple
+
+from datamodel import Order, OrderDepth, Symbol
+from lazyimport import lazy_import
+
+# loaded on the first curve; strategies that price baskets prewarm it in Trader.__init__
+np = lazy_import("numpy")
+
+PICNIC_BASKET: Dict[Symbol, int] = {"PICNIC_BASKET": 1, "BAGUETTE": -2, "DIP": -4, "UKULELE": -1}
+
+SELL = 1
+BUY = -1
+
+
+def _levels(order_depth: OrderDepth, take_bids: bool) -> Tuple[List[int], List[int]]:
+    """Prices and (positive) volumes of the side of the book a leg trades against, best first."""
+    if take_bids:
+        levels = order_depth.buy_orders
+        prices = sorted(levels, reverse=True)
+        return prices, [levels[price] for price in prices]
+    levels = order_depth.sell_orders
+    prices = sorted(levels)
+    return prices, [-levels[price] for price in prices]
+
+
+class BasketCurve:
+    """
+    side is SELL (sell the basket, buy the components) or BUY. premiums[n] is
+    the premium of the n + 1-th basket unit, best first. The unit prices of a
+    leg start at units[offsets[symbol]], best first.
+    """
+
+    def __init__(self, side: int, weights: Mapping[Symbol, int], units: np.ndarray, offsets: Dict[Symbol, int],
+                 premiums: np.ndarray) -> None:
+        self.side = side
+        self.weights = weights
+        self.units = units
+        self.offsets = offsets
+        self.premiums = premiums
+        # non-decreasing in both directions, for searchsorted
+        self._sorted = -premiums if side == SELL else premiums
+
+    def __len__(self) -> int:
+        return len(self.premiums)
+
+    def size_at(self, threshold: float) -> int:
+        """Baskets whose premium is above threshold when selling, below it when buying."""
+        return int(np.searchsorted(self._sorted, -threshold if self.side == SELL else threshold, side="left"))
+
+    def sizes(self, thresholds) -> np.ndarray:
+        """size_at of every threshold, in one call."""
+        thresholds = np.asarray(thresholds, dtype=float)
+        return np.searchsorted(self._sorted, -thresholds if self.side == SELL else thresholds, side="left")
+
+    def value(self, n: int) -> float:
+        """Total premium of the first n baskets."""
+        return float(self.premiums[:n].sum())
+
+    def leg_units(self, symbol: Symbol) -> np.ndarray:
+        """Unit prices of one leg, best first."""
+        start = self.offsets[symbol]
+        return self.units[start:start + abs(self.weights[symbol]) * len(self)]
+
+    def room(self, positions: Mapping[Symbol, int], limits: Mapping[Symbol, int]) -> int:
+        """Most baskets that keep every leg within its position limit (limits[symbol], both ways)."""
+        room = None
+        for symbol, weight in self.weights.items():
+            # selling the basket sells the positive legs and buys the negative ones
+            direction = -self.side if weight > 0 else self.side
+            position = positions.get(symbol, 0)
+            free = limits[symbol] - position if direction > 0 else limits[symbol] + position
+            legs = max(free, 0) // abs(weight)
+            room = legs if room is None else min(room, legs)
+        return room or 0
+
+    def orders(self, n: int) -> Dict[Symbol, List[Order]]:
+        """One order per leg for n baskets, priced at the last unit it takes."""
+        if n <= 0:
+            return {}
+        n = min(n, len(self))
+        orders = {}
+        for symbol, weight in self.weights.items():
+            quantity = abs(weight) * n
+            direction = -self.side if weight > 0 else self.side
+            orders[symbol] = [Order(symbol, int(self.units[self.offsets[symbol] + quantity - 1]), direction * quantity)]
+        return orders
+
+
+def _layout(weights: Mapping[Symbol, int]) -> Tuple[List[Symbol], List[int], np.ndarray, np.ndarray]:
+    """Symbols, units per basket, and the sign row and size column of the weights (cached per basket)."""
+    key = tuple(weights.items())
+    layout = _LAYOUTS.get(key)
+    if layout is None:
+        symbols = list(weights)
+        sizes = [abs(weights[symbol]) for symbol in symbols]
+        signs = np.array([1 if weights[symbol] > 0 else -1 for symbol in symbols])
+        layout = _LAYOUTS[key] = (symbols, sizes, signs, np.array(sizes)[:, None])
+    return layout
+
+
+def basket_curves(order_depths: Mapping[Symbol, OrderDepth],
+                  weights: Mapping[Symbol, int] = PICNIC_BASKET) -> Tuple[BasketCurve, BasketCurve]:
+    """(sell, buy) premium curves of the basket over the whole books."""
+    symbols, sizes, signs, size_column = _layout(weights)
+    # every leg of both curves in one array of unit prices, sell legs first, then buy legs; the
+    # leading 0 (one unit of price 0) makes the cumsum start at 0, so units[i] is cumulative[i + 1] - cumulative[i]
+    prices: List[int] = [0]
+    volumes: List[int] = [1]
+    lengths: List[int] = []
+    for side in (SELL, BUY):
+        for symbol in symbols:
+            level_prices, level_volumes = _levels(order_depths[symbol], (weights[symbol] > 0) == (side == SELL))
+            prices += level_prices
+            volumes += level_volumes
+            lengths.append(sum(level_volumes))
+    units = np.repeat(np.array(prices, dtype=np.int64), volumes)
+    cumulative = np.cumsum(units)
+
+    curves = []
+    offset = 1
+    for side, leg_lengths in ((SELL, lengths[:len(symbols)]), (BUY, lengths[len(symbols):])):
+        offsets = {}
+        for symbol, length in zip(symbols, leg_lengths):
+            offsets[symbol] = offset
+            offset += length
+        size = min(length // weight for length, weight in zip(leg_lengths, sizes))
+        # units of basket n in leg k: units[starts[k, n] + 1:starts[k, n] + sizes[k] + 1]
+        starts = np.array(list(offsets.values()))[:, None] - 1 + size_column * np.arange(size)
+        premiums = signs @ (cumulative[starts + size_column] - cumulative[starts])
+        curves.append(BasketCurve(side, weights, units, offsets, premiums))
+    return curves[0], curves[1]
+
+
+_LAYOUTS: Dict[Tuple[Tuple[Symbol, int], ...], Tuple[List[Symbol], List[int], np.ndarray, np.ndarray]] = {}
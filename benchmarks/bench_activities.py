@@ -0,0 +1,59 @@
+"""
+Load time of the Activities log section: sandboxlog.activities (string rows),
+activities.parse, the first load_activities (parse and write the cache) and a
+cached load_activities (memory-mapped), plus a check that the cached columns
+equal the parsed ones.
+
+    python benchmarks/bench_activities.py [path/to/sandbox.log]
+"""
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from activities import cache_dir, load_activities, parse  # noqa: E402
+from backtest import DEFAULT_LOG  # noqa: E402
+from sandboxlog import activities  # noqa: E402
+
+
+def timed(fn, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def cold(path: str):
+    shutil.rmtree(cache_dir(path), ignore_errors=True)
+    return load_activities(path)
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+
+    rows, rows_time = timed(lambda: list(activities(path)))
+    parsed, parse_time = timed(lambda: parse(path))
+    _, cold_time = timed(lambda: cold(path))
+    cached, cached_time = timed(lambda: load_activities(path), repeat=50)
+
+    assert sorted(parsed) == sorted(cached)
+    for product, array in parsed.items():
+        assert isinstance(cached[product].array, np.memmap)
+        np.testing.assert_array_equal(array, cached[product].array)
+
+    print(f"{os.path.basename(path)}: {len(rows)} rows, {len(parsed)} products")
+    print(f"sandboxlog.activities  {rows_time * 1000:8.2f} ms")
+    print(f"activities.parse       {parse_time * 1000:8.2f} ms")
+    print(f"load_activities cold   {cold_time * 1000:8.2f} ms")
+    print(f"load_activities cached {cached_time * 1000:8.2f} ms  ({parse_time / cached_time:.0f}x faster than parse)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Replay speed of backtest.run: builds the MarketDay of a sandbox log once and
+replays it through every strategy in the repository, reporting ticks per
+second and the final PnL. A strategy that raises is reported and skipped.
+
+    python benchmarks/bench_backtest.py [path/to/sandbox.log]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG, MarketDay, load_trader, run  # noqa: E402
+from tradedata import load_trades  # noqa: E402
+
+STRATEGIES = ["ETF.py", "banana.py", "banana_ma.py", "berries.py", "movingAverage.py", "pairtrading.py",
+              "round3.py", "round4_v2.py", "round4_v2(5).py", "round5.py", "testtest.py"]
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    start = time.perf_counter()
+    market = MarketDay.from_log(path, load_trades())
+    print(f"{os.path.basename(path)}: day {market.day}, {len(market)} ticks, "
+          f"MarketDay built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for strategy in STRATEGIES:
+        try:
+            result = run(load_trader(os.path.join(ROOT, strategy)), market)
+        except Exception as e:
+            print(f"{strategy:18s} failed: {type(e).__name__}: {e}")
+            continue
+        print(f"{strategy:18s} {result.seconds * 1000:7.0f} ms  {len(market) / result.seconds:7.0f} ticks/s  "
+              f"{len(result.trades):5d} fills  PnL {float(result.total[-1]):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+basketpricing.basket_curves against the top-of-book basket pricing round5.py
+does unless basket_depth is set, on the recorded order depths of a sandbox
+day: per-tick cost of both, the best premium of the curves checked against the
+top-of-book one, and how many baskets each can trade at a few premium
+thresholds (top of book: the volume of the thinnest top level, if its premium
+clears the threshold; the curves: every level).
+
+    python benchmarks/bench_basketpricing.py [path/to/sandbox.log]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG  # noqa: E402
+from basketpricing import PICNIC_BASKET, basket_curves  # noqa: E402
+from sandboxlog import ticks  # noqa: E402
+
+SELL_THRESHOLDS = (400, 450, 500)
+BUY_THRESHOLDS = (400, 350, 300)
+
+
+def top_of_book(order_depths):
+    """(sell premium, sell volume, buy premium, buy volume) from the best level of each book, as round5.py does."""
+    depth = {symbol: order_depths[symbol] for symbol in PICNIC_BASKET}
+    pic, bag, dip, uku = (depth[s] for s in ("PICNIC_BASKET", "BAGUETTE", "DIP", "UKULELE"))
+    sell = buy = None
+    if pic.buy_orders and bag.sell_orders and dip.sell_orders and uku.sell_orders:
+        pic_bid, bag_ask, dip_ask, uku_ask = (max(pic.buy_orders), min(bag.sell_orders), min(dip.sell_orders),
+                                              min(uku.sell_orders))
+        volume = min(-bag.sell_orders[bag_ask] // 2, -dip.sell_orders[dip_ask] // 4, -uku.sell_orders[uku_ask],
+                     pic.buy_orders[pic_bid])
+        sell = (pic_bid - 2 * bag_ask - 4 * dip_ask - uku_ask, volume)
+    if pic.sell_orders and bag.buy_orders and dip.buy_orders and uku.buy_orders:
+        pic_ask, bag_bid, dip_bid, uku_bid = (min(pic.sell_orders), max(bag.buy_orders), max(dip.buy_orders),
+                                              max(uku.buy_orders))
+        volume = min(bag.buy_orders[bag_bid] // 2, dip.buy_orders[dip_bid] // 4, uku.buy_orders[uku_bid],
+                     -pic.sell_orders[pic_ask])
+        buy = (pic_ask - 2 * bag_bid - 4 * dip_bid - uku_bid, volume)
+    return sell, buy
+
+
+def per_tick_us(fn, depths):
+    start = time.perf_counter()
+    for order_depths in depths:
+        fn(order_depths)
+    return (time.perf_counter() - start) / len(depths) * 1e6
+
+
+def main() -> None:
+    log = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    depths = [tick.state.order_depths for tick in ticks(log)
+              if all(symbol in tick.state.order_depths for symbol in PICNIC_BASKET)]
+    if not depths:
+        sys.exit(f"no basket order depths in {log}")
+
+    top_us = min(per_tick_us(top_of_book, depths) for _ in range(3))
+    curves_us = min(per_tick_us(basket_curves, depths) for _ in range(3))
+
+    top_sizes = {("sell", t): 0 for t in SELL_THRESHOLDS}
+    top_sizes.update({("buy", t): 0 for t in BUY_THRESHOLDS})
+    curve_sizes = dict.fromkeys(top_sizes, 0)
+    for order_depths in depths:
+        sell, buy = top_of_book(order_depths)
+        sell_curve, buy_curve = basket_curves(order_depths)
+        for name, top, curve, thresholds in (("sell", sell, sell_curve, SELL_THRESHOLDS),
+                                             ("buy", buy, buy_curve, BUY_THRESHOLDS)):
+            if top is None:
+                assert len(curve) == 0, "curve without a top of book"
+                continue
+            premium, volume = top
+            # the first basket is priced at the best levels whenever each of them can fill it
+            if volume > 0:
+                assert curve.premiums[0] == premium, "best premium disagrees with the top of book"
+            for threshold, size in zip(thresholds, curve.sizes(thresholds)):
+                clears = premium > threshold if name == "sell" else premium < threshold
+                top_sizes[name, threshold] += volume if clears else 0
+                curve_sizes[name, threshold] += int(size)
+
+    print(f"{len(depths)} ticks of {os.path.basename(log)}")
+    print(f"top of book    {top_us:8.1f} us/tick")
+    print(f"basket_curves  {curves_us:8.1f} us/tick (both curves, every level)")
+    print(f"{'side':5s} {'premium':>8s} {'top of book':>12s} {'all levels':>11s}   baskets tradable, summed over ticks")
+    for (name, threshold), volume in top_sizes.items():
+        print(f"{name:5s} {('>' if name == 'sell' else '<') + str(threshold):>8s} {volume:12d} "
+              f"{curve_sizes[name, threshold]:11d}")
+
+
+if __name__ == "__main__":
+    main()
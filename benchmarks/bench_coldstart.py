@@ -0,0 +1,41 @@
+"""
+Cold-start latency of every strategy with lazy imports (lazyimport.py) and with
+LAZY_IMPORTS=0, each phase the median of fresh interpreters (see coldstart.py):
+import, Trader() and first run() in ms, and their sum.
+
+    python benchmarks/bench_coldstart.py [--repeat N] [--log path]
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from coldstart import DEFAULT_LOG, STRATEGIES, profile  # noqa: E402
+
+
+def cold_ms(phases):
+    return phases["import_ms"] + phases["construct_ms"] + phases["first_run_ms"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold start with lazy and with eager imports.")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    args = parser.parse_args()
+
+    print(f"{'strategy':20s} {'eager import':>13s} {'lazy import':>12s} {'eager cold':>11s} {'lazy cold':>10s}")
+    for strategy in STRATEGIES:
+        try:
+            eager, _ = profile(os.path.join(ROOT, strategy), args.log, args.repeat, eager=True)
+            lazy, _ = profile(os.path.join(ROOT, strategy), args.log, args.repeat)
+        except RuntimeError as e:
+            print(f"{strategy:20s} skipped: {e}")
+            continue
+        print(f"{strategy:20s} {eager['import_ms']:13.1f} {lazy['import_ms']:12.1f} "
+              f"{cold_ms(eager):11.1f} {cold_ms(lazy):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
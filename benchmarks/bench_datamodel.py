@@ -0,0 +1,137 @@
+"""
+Memory / allocation benchmark of the __slots__ datamodel classes against the
+same classes with an instance __dict__, as the exchange's datamodel has them.
+
+Every tick of the Activities log of a sandbox log is rebuilt into Listing,
+OrderDepth, Order and Trade objects and all of them are kept alive, as they
+are when a whole day is replayed through Trader.run.
+
+    python benchmarks/bench_datamodel.py [path/to/sandbox.log]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from datamodel import Listing, Order, OrderDepth, Trade  # noqa: E402
+
+DEFAULT_LOG = os.path.join(ROOT, "4c7a1701-ea04-4fd2-967b-4582ec0b953c.log")
+
+
+class DictListing:
+    def __init__(self, symbol, product, denomination):
+        self.symbol = symbol
+        self.product = product
+        self.denomination = denomination
+
+
+class DictOrder:
+    def __init__(self, symbol, price, quantity):
+        self.symbol = symbol
+        self.price = price
+        self.quantity = quantity
+
+
+class DictOrderDepth:
+    def __init__(self):
+        self.buy_orders = {}
+        self.sell_orders = {}
+
+
+class DictTrade:
+    def __init__(self, symbol, price, quantity, buyer=None, seller=None, timestamp=0):
+        self.symbol = symbol
+        self.price = price
+        self.quantity = quantity
+        self.buyer = buyer
+        self.seller = seller
+        self.timestamp = timestamp
+
+
+DICT = (DictListing, DictOrderDepth, DictOrder, DictTrade)
+SLOTS = (Listing, OrderDepth, Order, Trade)
+
+
+def read_activities(path: str) -> Dict[int, List[List[str]]]:
+    """Rows of the Activities log section grouped by timestamp."""
+    ticks: Dict[int, List[List[str]]] = {}
+    with open(path) as f:
+        for line in f:
+            if line.startswith("Activities log:"):
+                break
+        next(f)  # header
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = line.split(";")
+            ticks.setdefault(int(row[1]), []).append(row)
+    return ticks
+
+
+def replay(ticks: Dict[int, List[List[str]]], classes: Tuple[type, type, type, type]) -> list:
+    listing_cls, depth_cls, order_cls, trade_cls = classes
+    states = []
+    for timestamp, rows in ticks.items():
+        listings = {}
+        order_depths = {}
+        orders = {}
+        own_trades = {}
+        for row in rows:
+            product = row[2]
+            listings[product] = listing_cls(product, product, 1)
+            depth = depth_cls()
+            for i in range(3, 9, 2):
+                if row[i]:
+                    depth.buy_orders[int(row[i])] = int(row[i + 1])
+            for i in range(9, 15, 2):
+                if row[i]:
+                    depth.sell_orders[int(row[i])] = -int(row[i + 1])
+            order_depths[product] = depth
+            if depth.buy_orders and depth.sell_orders:
+                best_bid = max(depth.buy_orders.keys())
+                best_ask = min(depth.sell_orders.keys())
+                orders[product] = [order_cls(product, best_bid, 1), order_cls(product, best_ask, -1)]
+                own_trades[product] = [trade_cls(product, best_ask, 1, "SUBMISSION", "", timestamp)]
+        states.append((timestamp, listings, order_depths, orders, own_trades))
+    return states
+
+
+def measure(ticks, classes) -> Tuple[float, int, int]:
+    start = time.perf_counter()
+    replay(ticks, classes)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    states = replay(ticks, classes)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    size = sum(stat.size for stat in stats)
+    blocks = sum(stat.count for stat in stats)
+    del states
+    return elapsed, size, blocks
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    ticks = read_activities(path)
+    print(f"{os.path.basename(path)}: {len(ticks)} ticks, {sum(len(r) for r in ticks.values())} rows")
+
+    results = {}
+    for name, classes in (("__dict__", DICT), ("__slots__", SLOTS)):
+        results[name] = measure(ticks, classes)
+        elapsed, size, blocks = results[name]
+        print(f"{name:9s} build {elapsed * 1000:8.1f} ms  retained {size / 1024:9.1f} KiB  blocks {blocks:8d}")
+
+    regular, slots = results["__dict__"], results["__slots__"]
+    print(f"__slots__ / __dict__: time {slots[0] / regular[0]:.2f}x  "
+          f"memory {slots[1] / regular[1]:.2f}x  blocks {slots[2] / regular[2]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Log volume of the compressing Logger with and without delta encoding over a
+sandbox day, and a round trip check that StateDecoder rebuilds every state.
+With every > 1 both loggers sample every Nth tick, and delta states are
+encoded against the previously logged one.
+
+    python benchmarks/bench_delta_log.py [path/to/sandbox.log] [keyframe_every] [every]
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG  # noqa: E402
+from logger import Logger, StateDecoder  # noqa: E402
+from sandboxlog import ticks as log_ticks  # noqa: E402
+
+
+def run(logger: Logger, ticks) -> (str, float):
+    out = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out):
+        for state, orders in ticks:
+            logger.flush(state, orders)
+    return out.getvalue(), time.perf_counter() - start
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    keyframe_every = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    every = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    ticks = [(tick.state, tick.orders) for tick in log_ticks(path)]
+
+    full, full_time = run(Logger(every=every), ticks)
+    delta, delta_time = run(Logger(delta=True, keyframe_every=keyframe_every, every=every), ticks)
+
+    decoder = StateDecoder()
+    full_lines = full.splitlines()
+    delta_lines = delta.splitlines()
+    assert len(full_lines) == len(delta_lines)
+    for full_line, delta_line in zip(full_lines, delta_lines):
+        expected = json.loads(full_line)
+        actual = json.loads(delta_line)
+        assert decoder.decode(actual["state"]) == expected["state"], expected["state"]["t"]
+        assert actual["orders"] == expected["orders"]
+
+    print(f"{os.path.basename(path)}: {len(ticks)} ticks, every {every}, keyframe every {keyframe_every}, "
+          f"every state decoded")
+    print(f"compressed {len(full):10d} chars  {full_time * 1000:7.1f} ms")
+    print(f"delta      {len(delta):10d} chars  {delta_time * 1000:7.1f} ms  ({len(full) / len(delta):.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
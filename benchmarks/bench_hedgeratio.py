@@ -0,0 +1,89 @@
+"""
+Fixed PINA_COLADAS / COCONUTS ratio against the online hedgeratio.KalmanHedge
+in the pair strategies: PnL of COCONUTS and PINA_COLADAS over the recorded
+days of the sandbox logs (backtest.run, closed loop), and the per-tick cost
+of pricing and updating the hedge on the recorded mid prices, with the ratio
+and intercept each estimate ends on. A day recorded by several logs with the
+same books is counted once.
+
+    python benchmarks/bench_hedgeratio.py [strategy.py ...] [--logs sandbox.log ...]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import MarketDay, load_trader, run  # noqa: E402
+from hedgeratio import HEDGES, make_hedge  # noqa: E402
+from shards import default_logs  # noqa: E402
+
+PAIR = ("COCONUTS", "PINA_COLADAS")
+STRATEGIES = ("round5.py", "pairtrading.py")
+
+
+def mids(market: MarketDay):
+    return [(prices[PAIR[0]], prices[PAIR[1]]) for prices in market.mid_prices
+            if PAIR[0] in prices and PAIR[1] in prices]
+
+
+def distinct(markets):
+    """The markets with a replayed day dropped: sandbox logs of the same day can carry the same books."""
+    seen = set()
+    kept = []
+    for market in markets:
+        key = (market.day, tuple(market.timestamps), repr(market.books))
+        if key not in seen:
+            seen.add(key)
+            kept.append(market)
+    return kept
+
+
+def per_tick_us(kind: str, ticks):
+    best = None
+    for _ in range(3):
+        hedge = make_hedge(kind, 15 / 8)
+        start = time.perf_counter()
+        for x, y in ticks:
+            hedge.fair_prices(x, y)
+            hedge.update(x, y)
+        elapsed = (time.perf_counter() - start) / len(ticks) * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best, hedge
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fixed against online hedge ratio in the pair strategies.")
+    parser.add_argument("strategies", nargs="*", default=STRATEGIES)
+    parser.add_argument("--logs", nargs="*", default=None)
+    args = parser.parse_args()
+
+    markets = [MarketDay.from_log(log).restrict(PAIR) for log in args.logs or default_logs()]
+    markets = distinct([market for market in markets if len(market)])
+    if not markets:
+        sys.exit("no COCONUTS / PINA_COLADAS ticks in the logs")
+    ticks = [tick for market in markets for tick in mids(market)]
+    print(f"{len(markets)} days, {sum(len(market) for market in markets)} ticks")
+
+    print(f"{'hedge':8s} {'us/tick':>8s} {'ratio':>9s} {'intercept':>10s}")
+    for kind in HEDGES:
+        cost, hedge = per_tick_us(kind, ticks)
+        print(f"{kind:8s} {cost:8.2f} {hedge.ratio:9.5f} {hedge.intercept:10.2f}")
+
+    print(f"{'strategy':16s} {'hedge':8s} " + " ".join(f"{'day ' + str(m.day):>10s}" for m in markets)
+          + f" {'total':>10s}")
+    for strategy in args.strategies:
+        path = strategy if os.path.isabs(strategy) else os.path.join(ROOT, strategy)
+        for kind in HEDGES:
+            days = []
+            for market in markets:
+                result = run(load_trader(path, hedge=kind), market)
+                days.append(sum(result.final_pnl().values()))
+            print(f"{os.path.basename(path):16s} {kind:8s} " + " ".join(f"{pnl:10.0f}" for pnl in days)
+                  + f" {sum(days):10.0f}")
+
+
+if __name__ == "__main__":
+    main()
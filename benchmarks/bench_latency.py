@@ -0,0 +1,133 @@
+"""
+Per-tick latency of Trader.run for every strategy in the repository, replaying
+the recorded states of a sandbox log (output silenced, Logger.flush included as
+it is in the sandbox). Reports p50 / p99 run() time (best of the passes, to keep
+scheduler noise out), the max over all passes and the peak traced memory of a
+tick (tracemalloc peak above the memory traced before run(), averaged over the
+ticks; not the bytes allocated), and compares p50, p99 and the peak with the
+stored baseline.
+
+    python benchmarks/bench_latency.py [--log path] [--repeat N] [--save] [--tolerance 1.5]
+
+--save writes the results to latency_baseline.json next to this file. Without
+it, a strategy whose p50, p99 or peak is more than --tolerance times its
+baseline (and at least 20us or 1KiB over it) in two runs is flagged and the exit
+status is 1.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import _NULL, DEFAULT_LOG, load_strategy  # noqa: E402
+from sandboxlog import ticks  # noqa: E402
+
+STRATEGIES = ["round5.py", "round4_v2.py", "round4_v2(5).py", "ETF.py", "pairtrading.py", "berries.py", "banana.py",
+              "banana_ma.py", "testtest.py", "pearls.py"]
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "latency_baseline.json")
+# below these a change is noise, whatever the ratio
+NOISE = {"p50_us": 20.0, "p99_us": 20.0, "peak_kib": 1.0}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def measure(trader_class, path: str, repeat: int) -> Dict[str, float]:
+    passes = []
+    stdout = sys.stdout
+    sys.stdout = _NULL
+    try:
+        for _ in range(repeat):
+            trader = trader_class()
+            samples = []
+            for tick in ticks(path):
+                start = time.perf_counter_ns()
+                trader.run(tick.state)
+                samples.append(time.perf_counter_ns() - start)
+            passes.append(sorted(samples))
+
+        trader = trader_class()
+        peaks = []
+        tracemalloc.start()
+        for tick in ticks(path):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            trader.run(tick.state)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        tracemalloc.stop()
+    finally:
+        sys.stdout = stdout
+
+    return {
+        "p50_us": min(percentile(samples, 0.50) for samples in passes) / 1000,
+        "p99_us": min(percentile(samples, 0.99) for samples in passes) / 1000,
+        "max_us": max(samples[-1] for samples in passes) / 1000,
+        "peak_kib": sum(peaks) / len(peaks) / 1024,
+    }
+
+
+def compare(result: Dict[str, float], reference: Optional[Dict[str, float]], tolerance: float) -> List[str]:
+    flags = []
+    if reference:
+        for key, noise in NOISE.items():
+            if key in reference and result[key] > reference[key] * tolerance and result[key] - reference[key] > noise:
+                flags.append(f"{key} {reference[key]:.0f} -> {result[key]:.0f}")
+    return flags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Trader.run latency per tick for every strategy.")
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE) and not args.save:
+        with open(BASELINE) as f:
+            baseline = json.load(f)["strategies"]
+
+    results = {}
+    regressions = []
+    print(f"{os.path.basename(args.log)}, {args.repeat} passes")
+    print(f"{'strategy':18s} {'p50 us':>9s} {'p99 us':>9s} {'max us':>9s} {'peak KiB':>10s}")
+    for strategy in STRATEGIES:
+        try:
+            trader_class = load_strategy(os.path.join(ROOT, strategy)).Trader
+            result = measure(trader_class, args.log, args.repeat)
+            flags = compare(result, baseline.get(strategy), args.tolerance)
+            if flags:
+                # p99 of a 1000 tick day sits on the boundary of periodic slow ticks (delta
+                # keyframes every 100 ticks), so only a regression that survives a rerun counts
+                result = measure(trader_class, args.log, args.repeat)
+                flags = compare(result, baseline.get(strategy), args.tolerance)
+        except Exception as e:
+            print(f"{strategy:18s} skipped: {type(e).__name__}: {e}")
+            continue
+        results[strategy] = result
+        if flags:
+            regressions.append(strategy)
+        print(f"{strategy:18s} {result['p50_us']:9.1f} {result['p99_us']:9.1f} {result['max_us']:9.1f} "
+              f"{result['peak_kib']:10.1f}" + ("  REGRESSION " + ", ".join(flags) if flags else ""))
+
+    if args.save:
+        with open(BASELINE, "w") as f:
+            json.dump({"log": os.path.basename(args.log), "repeat": args.repeat, "strategies": results}, f,
+                      indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written to {BASELINE}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s) against {os.path.basename(BASELINE)}: {', '.join(regressions)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
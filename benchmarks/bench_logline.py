@@ -0,0 +1,79 @@
+"""
+Cost of the JSON log line of every tick of a sandbox day, state and orders:
+the datamodel objects through ProsperityEncoder with sorted keys (what
+TradingState.toJSON and the uncompressed Logger write), the compact schema
+through the same encoder (the compressing Logger before), and the compact
+schema as Logger writes it now, plain json.dumps. Every compact line is
+checked to read back (sandboxlog.to_trading_state) to the state of the full one.
+
+    python benchmarks/bench_logline.py [path/to/sandbox.log]
+"""
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG  # noqa: E402
+from datamodel import ProsperityEncoder  # noqa: E402
+from logger import Logger  # noqa: E402
+from sandboxlog import ticks, to_trading_state  # noqa: E402
+
+SEPARATORS = (",", ":")
+
+
+def full(logger, state, orders):
+    return json.dumps({"state": state, "orders": orders, "logs": ""}, cls=ProsperityEncoder, separators=SEPARATORS,
+                      sort_keys=True)
+
+
+def compact_encoder(logger, state, orders):
+    return json.dumps({"state": logger.compress_state(state), "orders": logger.compress_orders(orders), "logs": ""},
+                      cls=ProsperityEncoder, separators=SEPARATORS, sort_keys=True)
+
+
+def compact(logger, state, orders):
+    return logger._line(state, orders, "")
+
+
+def per_tick_us(fn, day):
+    best = float("inf")
+    for _ in range(5):
+        logger = Logger()
+        start = time.perf_counter()
+        for state, orders in day:
+            fn(logger, state, orders)
+        best = min(best, time.perf_counter() - start)
+    return best / len(day) * 1e6
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    day = [(tick.state, tick.orders) for tick in ticks(path)]
+
+    logger = Logger()
+    chars = dict.fromkeys(("full", "compact"), 0)
+    for state, orders in day:
+        expected = json.loads(full(logger, state, orders))
+        line = compact(logger, state, orders)
+        actual = json.loads(line)
+        reread = to_trading_state(actual["state"])
+        assert json.dumps(reread, cls=ProsperityEncoder, sort_keys=True) == \
+            json.dumps(to_trading_state(expected["state"]), cls=ProsperityEncoder, sort_keys=True), state.timestamp
+        chars["full"] += len(json.dumps(expected, separators=SEPARATORS))
+        chars["compact"] += len(line)
+
+    baseline = per_tick_us(full, day)
+    print(f"{os.path.basename(path)}: {len(day)} ticks, every compact state read back")
+    for name, fn in (("full, ProsperityEncoder", full), ("compact, ProsperityEncoder", compact_encoder),
+                     ("compact, json.dumps", compact)):
+        cost = baseline if fn is full else per_tick_us(fn, day)
+        print(f"{name:26s} {cost:7.1f} us/tick  {baseline / cost:4.1f}x")
+    print(f"{'full':26s} {chars['full'] / len(day):7.0f} chars/tick")
+    print(f"{'compact':26s} {chars['compact'] / len(day):7.0f} chars/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Throughput of matching.MatchingEngine over a sandbox day: every tick sends, for
+every symbol, a buy through the second ask level and a sell through the second
+bid level sized from the book, so orders walk several levels, fill partially
+and regularly breach the position limit.
+
+    python benchmarks/bench_matching.py [path/to/sandbox.log]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG, MarketDay  # noqa: E402
+from datamodel import Order  # noqa: E402
+from matching import MatchingEngine  # noqa: E402
+
+
+def order_sets(market: MarketDay):
+    ticks = []
+    for i, book in enumerate(market.books):
+        orders = {}
+        for symbol, (bids, asks) in book.items():
+            symbol_orders = []
+            if len(asks) > 1:
+                symbol_orders.append(Order(symbol, asks[1][0], -asks[0][1] - asks[1][1] // 2))
+            if len(bids) > 1 and i % 2:
+                symbol_orders.append(Order(symbol, bids[1][0], -bids[0][1] - bids[1][1] // 2))
+            orders[symbol] = symbol_orders
+        ticks.append(orders)
+    return ticks
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    market = MarketDay.from_log(path)
+    ticks = order_sets(market)
+    orders = sum(len(arr) for tick in ticks for arr in tick.values())
+
+    best = float("inf")
+    for _ in range(5):
+        engine = MatchingEngine()
+        fills = 0
+        start = time.perf_counter()
+        for timestamp, book, tick in zip(market.timestamps, market.books, ticks):
+            fills += len(engine.match(tick, book, timestamp))
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{os.path.basename(path)}: {len(market)} ticks, {orders} orders, {fills} fills, "
+          f"{sum(engine.rejected.values())} order sets rejected")
+    print(f"matched in {best * 1000:.1f} ms ({len(market) / best:.0f} ticks/s, {orders / best:.0f} orders/s)")
+
+
+if __name__ == "__main__":
+    main()
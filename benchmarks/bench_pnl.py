@@ -0,0 +1,89 @@
+"""
+Cost of pnl.PnLTracker: booking the fills of a round5.py backtest one by one,
+against recomputing cash plus marked positions from the whole fill list every
+tick, and PnLTracker.update on the recorded states of a sandbox log as a
+Trader.run would call it. Checks that the incremental PnL matches the recomputed
+one.
+
+    python benchmarks/bench_pnl.py [path/to/sandbox.log]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG, MarketDay, load_trader, run  # noqa: E402
+from matching import SUBMISSION  # noqa: E402
+from pnl import PnLTracker  # noqa: E402
+from sandboxlog import ticks  # noqa: E402
+
+
+def incremental(market: MarketDay, fills_by_tick):
+    tracker = PnLTracker()
+    totals = []
+    for mids, fills in zip(market.mid_prices, fills_by_tick):
+        for trade in fills:
+            tracker.on_fill(trade.symbol, trade.price,
+                            trade.quantity if trade.buyer == SUBMISSION else -trade.quantity)
+        for symbol, mid in mids.items():
+            tracker.mark(symbol, mid)
+        totals.append(tracker.total())
+    return totals
+
+
+def recomputed(market: MarketDay, fills_by_tick):
+    seen = []
+    totals = []
+    last_mid = {}
+    for mids, fills in zip(market.mid_prices, fills_by_tick):
+        seen.extend(fills)
+        last_mid.update(mids)
+        cash = {}
+        position = {}
+        for trade in seen:
+            sign = 1 if trade.buyer == SUBMISSION else -1
+            cash[trade.symbol] = cash.get(trade.symbol, 0.0) - sign * trade.quantity * trade.price
+            position[trade.symbol] = position.get(trade.symbol, 0) + sign * trade.quantity
+        totals.append(sum(cash.values()) + sum(held * last_mid[symbol] for symbol, held in position.items()))
+    return totals
+
+
+def best_of(fn, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    market = MarketDay.from_log(path)
+    result = run(load_trader(os.path.join(ROOT, "round5.py")), market)
+    index = {timestamp: i for i, timestamp in enumerate(market.timestamps)}
+    fills_by_tick = [[] for _ in market.timestamps]
+    for trade in result.trades:
+        fills_by_tick[index[trade.timestamp]].append(trade)
+
+    fast, totals = best_of(incremental, market, fills_by_tick)
+    slow, expected = best_of(recomputed, market, fills_by_tick, repeat=1)
+    error = max(abs(a - b) for a, b in zip(totals, expected))
+    print(f"{os.path.basename(path)}: {len(market)} ticks, {len(result.trades)} round5.py fills")
+    print(f"incremental {fast * 1000:8.2f} ms   recomputed {slow * 1000:8.2f} ms   "
+          f"max difference {error:.2e}   final PnL {totals[-1]:.1f}")
+
+    states = [tick.state for tick in ticks(path)]
+    tracker = PnLTracker()
+    start = time.perf_counter()
+    for state in states:
+        tracker.update(state)
+    elapsed = time.perf_counter() - start
+    print(f"update() on the recorded states: {elapsed / len(states) * 1e6:.1f} us per tick, "
+          f"realized {tracker.realized():.1f}, unrealized {tracker.unrealized():.1f}")
+
+
+if __name__ == "__main__":
+    main()
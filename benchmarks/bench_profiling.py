@@ -0,0 +1,64 @@
+"""
+Cost of the profiling hooks in round5.Trader and the per-block breakdown they
+produce: recorded states of a sandbox log replayed through Trader() (hooks
+disabled), Trader(profile=True) and Trader(profile=True, profile_allocations=True),
+plus the cost of one disabled block on its own.
+
+    python benchmarks/bench_profiling.py [path/to/sandbox.log]
+"""
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import _NULL, DEFAULT_LOG, load_strategy  # noqa: E402
+from profiling import BlockProfiler  # noqa: E402
+from sandboxlog import ticks  # noqa: E402
+
+
+def replay(trader, states) -> float:
+    stdout = sys.stdout
+    sys.stdout = _NULL
+    try:
+        start = time.perf_counter()
+        for state in states:
+            trader.run(state)
+        return time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    states = [tick.state for tick in ticks(path)]
+    Trader = load_strategy(os.path.join(ROOT, "round5.py")).Trader
+
+    profiler = BlockProfiler()
+    disabled = min(timeit.repeat("with profiler.block('x'): pass", globals={"profiler": profiler},
+                                 number=100000, repeat=5)) / 100000
+
+    runs = {}
+    for name, params in (("disabled", {}), ("timing", {"profile": True}),
+                         ("timing+allocations", {"profile": True, "profile_allocations": True})):
+        allocations = params.get("profile_allocations", False)
+        if allocations:
+            # started here rather than by the profiler, so it is stopped again before the next run
+            tracemalloc.start()
+        trader = Trader(**params)
+        runs[name] = min(replay(trader, states) for _ in range(3))
+        if allocations:
+            tracemalloc.stop()
+        print(f"{name:20s} {runs[name] / len(states) * 1e6:8.1f} us/tick")
+        if params:
+            print(trader.profiler.summary())
+
+    print(f"disabled block: {disabled * 1e9:.0f} ns per with statement, 5 blocks a tick "
+          f"= {5 * disabled / (runs['disabled'] / len(states)) * 100:.2f}% of a tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Dispatch cost of registry.Registry against the product if-chain it replaced in
+round5.Trader.run, as the number of products (and single-product strategies)
+grows, plus round5.py's own dispatch on the order depths of a sandbox day.
+Strategies are no-ops, so only picking the strategies to call is measured.
+
+    python benchmarks/bench_registry.py [path/to/sandbox.log]
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG, load_strategy  # noqa: E402
+from registry import Registry  # noqa: E402
+from sandboxlog import ticks  # noqa: E402
+
+REPEAT = 20000
+
+
+def noop(trader, state, result):
+    pass
+
+
+def if_chain(order_depths, names):
+    called = 0
+    for product in order_depths:
+        for name in names:
+            if product == name:
+                called += 1
+    return called
+
+
+def registry_plan(order_depths, registry):
+    called = 0
+    for _ in registry.plan(order_depths):
+        called += 1
+    return called
+
+
+def per_tick_us(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn(*args)
+    return (time.perf_counter() - start) / REPEAT * 1e6
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    print(f"{'products':>8s} {'if-chain us':>12s} {'registry us':>12s}")
+    for n in (3, 10, 30, 100):
+        names = [f"PRODUCT_{i}" for i in range(n)]
+        order_depths = dict.fromkeys(names)
+        registry = Registry()
+        for name in names:
+            registry.add(name, [name], noop)
+        assert if_chain(order_depths, names) == registry_plan(order_depths, registry) == n
+        print(f"{n:8d} {per_tick_us(if_chain, order_depths, names):12.2f} "
+              f"{per_tick_us(registry_plan, order_depths, registry):12.2f}")
+
+    strategies = load_strategy(os.path.join(ROOT, "round5.py")).strategies
+    depths = [tick.state.order_depths for tick in ticks(path)]
+    start = time.perf_counter()
+    for order_depths in depths:
+        strategies.plan(order_depths)
+    elapsed = time.perf_counter() - start
+    print(f"round5.py on {os.path.basename(path)}: {len(strategies.strategies)} strategies, "
+          f"{elapsed / len(depths) * 1e6:.2f} us per tick to plan")
+
+
+if __name__ == "__main__":
+    main()
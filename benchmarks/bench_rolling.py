@@ -0,0 +1,74 @@
+"""
+Per-tick cost of the moving averages of banana_ma.py (windows of 5 and 30
+mid prices, and the same one tick earlier) and movingAverage.py (1000 and 3000
+trade prices), computed as the strategies used to (slicing and re-summing a
+list every tick) and with rolling.RollingWindow. Both run over the same
+synthetic price series and must agree on every value.
+
+    python benchmarks/bench_rolling.py [--ticks N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rolling import RollingWindow  # noqa: E402
+
+
+def resummed(prices, short, long):
+    history = []
+    values = []
+    for price in prices:
+        history.append(price)
+        if len(history) > long + 5:
+            history = history[1:]
+        if len(history) > long:
+            values.append((sum(history[-short:]) / short, sum(history[-long:]) / long,
+                           sum(history[-short - 1:-1]) / short, sum(history[-long - 1:-1]) / long))
+    return values
+
+
+def rolled(prices, short, long):
+    short_window = RollingWindow(short)
+    long_window = RollingWindow(long)
+    values = []
+    for price in prices:
+        short_window.push(price)
+        long_window.push(price)
+        if long_window.count > long:
+            values.append((short_window.mean, long_window.mean, short_window.prev_mean, long_window.prev_mean))
+    return values
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List re-summing vs RollingWindow moving averages.")
+    parser.add_argument("--ticks", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    price = 5000.0
+    prices = []
+    for _ in range(args.ticks):
+        price += rng.choice((-1.0, -0.5, 0.0, 0.5, 1.0))
+        prices.append(price)
+
+    print(f"{args.ticks} prices")
+    print(f"{'windows':>12s} {'re-summed us':>13s} {'rolling us':>11s} {'speedup':>8s}")
+    for short, long in ((5, 30), (1000, 3000)):
+        start = time.perf_counter()
+        expected = resummed(prices, short, long)
+        slow = time.perf_counter() - start
+        start = time.perf_counter()
+        values = rolled(prices, short, long)
+        fast = time.perf_counter() - start
+        assert values == expected, f"windows {short}/{long} disagree"
+        print(f"{f'{short}/{long}':>12s} {slow / args.ticks * 1e6:13.2f} {fast / args.ticks * 1e6:11.2f} "
+              f"{slow / fast:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Parse throughput of sandboxlog in ticks per second on the largest sandbox log
+(or the one given), for the raw JSON payloads and TradingState, with the peak
+memory of each pass.
+
+    python benchmarks/bench_sandboxlog.py [path/to/sandbox.log]
+"""
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sandboxlog import activities, raw_ticks, ticks  # noqa: E402
+
+
+def consume(iterable) -> int:
+    count = 0
+    for _ in iterable:
+        count += 1
+    return count
+
+
+def measure(make) -> (int, float, int):
+    """Items, best time of three passes and peak traced memory of a separate pass."""
+    elapsed = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        count = consume(make())
+        elapsed = min(elapsed, time.perf_counter() - start)
+    tracemalloc.start()
+    consume(make())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        path = max(glob.glob(os.path.join(ROOT, "*.log")), key=os.path.getsize)
+    print(f"{os.path.basename(path)}: {os.path.getsize(path) / 1e6:.1f} MB")
+
+    for name, make in (("raw json", lambda: raw_ticks(path)),
+                       ("TradingState", lambda: ticks(path)),
+                       ("activities", lambda: activities(path))):
+        count, elapsed, peak = measure(make)
+        print(f"{name:13s} {count:6d} items  {elapsed * 1000:7.1f} ms  {count / elapsed:9.0f} /s  "
+              f"peak {peak / 1024:6.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Wall-clock scaling of shards.run_sharded with the number of processes, for
+whole-day shards and product-group shards, and a check that both give the
+same PnL per day and product.
+
+    python benchmarks/bench_shards.py [strategy.py] [max_processes]
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from shards import GROUPS, default_logs, load_markets, run_sharded  # noqa: E402
+
+
+def main() -> None:
+    strategy = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, "round5.py")
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    markets = load_markets(default_logs())
+    print(f"{os.path.basename(strategy)}: {len(markets)} days, {sum(len(m) for m in markets)} ticks, "
+          f"{os.cpu_count()} cpus")
+
+    counts = sorted({1, max_processes} | {n for n in (2, 4, 8, 16) if n < max_processes})
+    reference = None
+    for name, groups in (("whole days", None), ("product groups", GROUPS)):
+        base = None
+        for processes in counts:
+            report = run_sharded(strategy, markets, groups, processes)
+            pnl = {key: {product: round(value, 6) for product, value in day_pnl.items() if value}
+                   for key, day_pnl in report.pnl.items()}
+            reference = reference or pnl
+            assert pnl == reference, (name, processes)
+            base = base or report.wall_seconds
+            print(f"{name:15s} {processes:3d} processes  {report.wall_seconds:6.2f}s wall  "
+                  f"{report.shard_seconds:6.2f}s of replays  speedup {base / report.wall_seconds:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
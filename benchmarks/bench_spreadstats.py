@@ -0,0 +1,93 @@
+"""
+spreadstats.SpreadStats on the basket premium and the coconut spread of the
+recorded order depths of a sandbox log: per-tick cost of update() against
+recomputing the mean and standard deviation of a list of the last window
+spreads every tick (both must agree), and the per-tick cost of round5.py's
+basket and pair blocks with fixed and with z-score bands.
+
+    python benchmarks/bench_spreadstats.py [path/to/sandbox.log] [--window N]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+from backtest import DEFAULT_LOG, MarketDay, load_trader, run  # noqa: E402
+from basketpricing import PICNIC_BASKET  # noqa: E402
+from sandboxlog import ticks  # noqa: E402
+from spreadstats import SpreadStats  # noqa: E402
+
+SPREADS = {"basket": PICNIC_BASKET, "pair": {"PINA_COLADAS": 1, "COCONUTS": -15 / 8}}
+
+
+def recomputed(depths, weights, window):
+    spread = SpreadStats(weights, window)
+    history = []
+    moments = []
+    for order_depths in depths:
+        value = spread.spread(order_depths)
+        if value is None:
+            continue
+        history.append(value)
+        last = np.array(history[-window:])
+        moments.append((last.mean(), last.std()))
+    return moments
+
+
+def streamed(depths, weights, window):
+    spread = SpreadStats(weights, window)
+    moments = []
+    for order_depths in depths:
+        if spread.update(order_depths) is not None:
+            moments.append((spread.mean, spread.std))
+    return moments
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    values = fn(*args)
+    return (time.perf_counter() - start) / len(args[0]) * 1e6, values
+
+
+def block_us(log, **params):
+    """Mean per-tick time of the basket and pair blocks of round5.py in a backtest, best of 3."""
+    market = MarketDay.from_log(log)
+    best = {}
+    for _ in range(3):
+        trader = load_trader(os.path.join(ROOT, "round5.py"), profile=True, **params)
+        run(trader, market)
+        for name in ("basket", "pair"):
+            calls, nanoseconds = trader.profiler.totals[name][:2]
+            best[name] = min(best.get(name, math.inf), nanoseconds / calls / 1000)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming spread statistics against recomputing them.")
+    parser.add_argument("log", nargs="?", default=DEFAULT_LOG)
+    parser.add_argument("--window", type=int, default=400)
+    args = parser.parse_args()
+
+    depths = [tick.state.order_depths for tick in ticks(args.log)]
+    print(f"{len(depths)} ticks of {os.path.basename(args.log)}, window {args.window}")
+    for name, weights in SPREADS.items():
+        slow, expected = timed(recomputed, depths, weights, args.window)
+        fast, moments = timed(streamed, depths, weights, args.window)
+        assert np.allclose(moments, expected), f"{name} moments disagree"
+        print(f"{name:7s} recomputed {slow:7.2f} us/tick   SpreadStats {fast:6.2f} us/tick")
+
+    fixed = block_us(args.log)
+    bands = block_us(args.log, basket_bands="ew", pair_bands="ew", spread_window=args.window)
+    print(f"{'block':7s} {'fixed':>10s} {'z-score':>10s}   us/tick in round5.py")
+    for name in ("basket", "pair"):
+        print(f"{name:7s} {fixed[name]:10.1f} {bands[name]:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+tickhistory.TickHistory against a growing Python list of rows (the shape of
+the DataFrame.append history pearls.py had, without pandas): per-tick cost of
+appending a row and taking the mean of the last 1000 mid prices, and the memory
+held after N ticks. The windows of both must agree.
+
+    python benchmarks/bench_tickhistory.py [--ticks N] [--capacity N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+from tickhistory import TickHistory  # noqa: E402
+
+WINDOW = 1000
+
+
+def rows(n):
+    rng = random.Random(0)
+    mid = 5000.0
+    for t in range(n):
+        mid += rng.choice((-1.0, -0.5, 0.0, 0.5, 1.0))
+        yield [t * 100, mid, mid - 1, mid + 1, 0]
+
+
+def with_list(data):
+    history = []
+    means = []
+    for row in data:
+        history.append(tuple(row))
+        window = np.array([r[1] for r in history[-WINDOW:]])
+        means.append(window.mean())
+    return history, means
+
+
+def with_tickhistory(data, capacity):
+    history = TickHistory(capacity)
+    means = []
+    for row in data:
+        history.append(*row)
+        means.append(history.window("mid_price", WINDOW).mean())
+    return history, means
+
+
+def measure(fn, *args):
+    start = time.perf_counter()
+    _, means = fn(*args)
+    elapsed = time.perf_counter() - start
+    # memory in a separate pass: tracemalloc slows the timed one down
+    tracemalloc.start()
+    held, means_again = fn(*args)
+    del means_again
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, memory, means
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ring-buffer tick history vs a growing list of rows.")
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--capacity", type=int, default=3000)
+    args = parser.parse_args()
+
+    data = list(rows(args.ticks))
+    slow, slow_memory, expected = measure(with_list, data)
+    fast, fast_memory, means = measure(with_tickhistory, data, args.capacity)
+    assert np.allclose(means, expected), "windows disagree"
+    print(f"{args.ticks} ticks, mean of the last {WINDOW} mid prices every tick")
+    print(f"list of rows  {slow / args.ticks * 1e6:8.2f} us/tick  {slow_memory / 1024:9.0f} KiB held")
+    print(f"TickHistory   {fast / args.ticks * 1e6:8.2f} us/tick  {fast_memory / 1024:9.0f} KiB held "
+          f"(capacity {args.capacity})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Converts sandbox logs to binary tick logs and compares random access to a
+timestamp (and a full pass) against re-parsing the JSON lines.
+
+    python benchmarks/bench_ticklog.py [sandbox.log ...]
+"""
+import glob
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ticklog import TickLogReader, compress_logged, convert  # noqa: E402
+
+
+def json_seek(path: str, timestamp: int):
+    """What finding a tick in a sandbox log costs without an index."""
+    with open(path) as f:
+        next(f)
+        for line in f:
+            if line.startswith("Submission logs:"):
+                return None
+            prefix, _, payload = line.partition(" ")
+            if not payload.startswith("{"):
+                continue
+            try:
+                raw = json.loads(payload)
+            except ValueError:
+                continue
+            if int(prefix) >= timestamp:
+                return raw
+    return None
+
+
+def main() -> None:
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(ROOT, "*.log")))
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in paths:
+            out = os.path.join(tmp, os.path.basename(path) + ".ticks")
+            start = time.perf_counter()
+            ticks = convert(path, out)
+            convert_time = time.perf_counter() - start
+            if not ticks:
+                print(f"{os.path.basename(path)}: no ticks")
+                continue
+
+            with TickLogReader(out) as reader:
+                targets = [random.randrange(0, reader.timestamps[len(reader) - 1] + 1) for _ in range(200)]
+                for target in targets[:5]:
+                    expected = json_seek(path, target)
+                    if expected is not None and "d" not in expected["state"]:
+                        assert reader.seek(target).state["od"].keys() == compress_logged(expected).state["od"].keys()
+
+                start = time.perf_counter()
+                for target in targets:
+                    reader.seek(target)
+                seek_time = (time.perf_counter() - start) / len(targets)
+
+                start = time.perf_counter()
+                for target in targets[:5]:
+                    json_seek(path, target)
+                json_seek_time = (time.perf_counter() - start) / 5
+
+                start = time.perf_counter()
+                for _ in reader:
+                    pass
+                scan_time = time.perf_counter() - start
+
+            print(f"{os.path.basename(path)}: {ticks} ticks, {os.path.getsize(path) / 1e6:.1f} MB log -> "
+                  f"{os.path.getsize(out) / 1e6:.2f} MB ticks (convert {convert_time:.2f} s)")
+            print(f"    seek: tick log {seek_time * 1e6:8.1f} us   json scan {json_seek_time * 1e6:10.1f} us   "
+                  f"full pass {ticks / scan_time:8.0f} ticks/s")
+
+
+if __name__ == "__main__":
+    main()
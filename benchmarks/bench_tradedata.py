@@ -0,0 +1,73 @@
+"""
+tradedata.load_trades and TradeTable.select against a csv module loop over the
+same files and a list comprehension scan, with a check that both return the
+same trades for every query.
+
+    python benchmarks/bench_tradedata.py
+"""
+import csv
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tradedata import load_trades, trade_files  # noqa: E402
+
+QUERIES = [
+    ("PICNIC_BASKET", 2, 100000, 200000),
+    ("BANANAS", None, None, None),
+    ("PEARLS", 1, 0, 50000),
+    ("COCONUTS", None, 500000, 600000),
+    (None, 3, 900000, None),
+]
+
+
+def csv_load(files):
+    rows = []
+    for day, path in sorted(files.items()):
+        with open(path, newline="") as f:
+            reader = csv.reader(f, delimiter=";")
+            next(reader)
+            for timestamp, buyer, seller, symbol, currency, price, quantity in reader:
+                rows.append((day, int(timestamp), symbol, buyer, seller, currency, float(price), int(quantity)))
+    return rows
+
+
+def csv_select(rows, symbol, day, start, end):
+    return [row for row in rows
+            if (symbol is None or row[2] == symbol) and (day is None or row[0] == day)
+            and (start is None or row[1] >= start) and (end is None or row[1] < end)]
+
+
+def best_of(fn, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    files = trade_files()
+    rows, csv_time = best_of(lambda: csv_load(files), 5)
+    trades, load_time = best_of(lambda: load_trades(files), 5)
+    assert len(rows) == len(trades)
+    print(f"{len(trades)} trades over days {sorted(files)}")
+    print(f"load    csv {csv_time * 1000:8.2f} ms   tradedata {load_time * 1000:8.2f} ms   "
+          f"({csv_time / load_time:.1f}x)")
+
+    for query in QUERIES:
+        expected, scan_time = best_of(lambda: csv_select(rows, *query), 20)
+        selected, select_time = best_of(lambda: trades.select(*query), 200)
+        assert sorted((row[0], row[1], row[2], row[6], row[7]) for row in expected) == sorted(zip(
+            selected.day.tolist(), selected.timestamp.tolist(), [trades.symbols[s] for s in selected.symbol.tolist()],
+            selected.price.tolist(), selected.quantity.tolist())), query
+        print(f"select {str(query):42s} {len(selected):6d} rows   scan {scan_time * 1e6:8.1f} us   "
+              f"indexed {select_time * 1e6:7.1f} us   ({scan_time / select_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+round5.py under shrinking time budgets: replays a sandbox day with
+backtest.run for every budget and reports the PnL, how often each block was
+dropped by the timeguard.Watchdog, and the p99 / max run() time. A budget
+below the cost of a tick stands in for a heavy tick on the exchange: the basket
+and pair blocks should go first and every tick should still return its orders.
+
+    python benchmarks/bench_watchdog.py [path/to/sandbox.log] [--budgets none,1,0.05,0.02]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG, MarketDay, load_strategy, run  # noqa: E402
+
+
+def timed_runs(trader):
+    samples = []
+    inner = trader.run
+
+    def wrapper(state):
+        start = time.perf_counter_ns()
+        result = inner(state)
+        samples.append(time.perf_counter_ns() - start)
+        assert isinstance(result, dict)
+        return result
+
+    trader.run = wrapper
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="round5.py under shrinking Trader.run time budgets.")
+    parser.add_argument("log", nargs="?", default=DEFAULT_LOG)
+    parser.add_argument("--budgets", default="none,1,0.05,0.03,0.02,0.01")
+    args = parser.parse_args()
+
+    trader_class = load_strategy(os.path.join(ROOT, "round5.py")).Trader
+    market = MarketDay.from_log(args.log)
+    print(f"{os.path.basename(args.log)}: {len(market)} ticks")
+    print(f"{'budget ms':>9s} {'PnL':>10s} {'fills':>6s} {'p99 us':>8s} {'max us':>8s}  dropped")
+    for budget in args.budgets.split(","):
+        budget_ms = None if budget == "none" else float(budget)
+        trader = trader_class(time_budget_ms=budget_ms)
+        samples = timed_runs(trader)
+        result = run(trader, market)
+        samples.sort()
+        dropped = ", ".join(f"{name} {count}" for name, count in sorted(trader.watchdog.dropped.items()))
+        errors = sum(trader.watchdog.errors.values())
+        print(f"{budget:>9s} {result.total[-1]:10.1f} {len(result.trades):6d} "
+              f"{samples[int(0.99 * len(samples))] / 1000:8.1f} {samples[-1] / 1000:8.1f}  {dropped or '-'}"
+              + (f"  ({errors} errors)" if errors else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Single-file submissions. The exchange takes one strategy file and provides
+only its own datamodel module, so a strategy that imports repository modules
+(logger.py, spreadstats.py, ...) has to be bundled before it is uploaded:
+bundle() inlines every repository module the strategy imports at module level,
+and the ones those import, above the strategy's own source in dependency order.
+
+- Module-level imports of the inlined modules are dropped (from x import a as b
+  becomes b = a); every other module-level import, datamodel included, is moved
+  to the top of the bundle once.
+- if __name__ == "__main__": blocks of the inlined modules are dropped.
+- Two modules binding the same top-level name to different things is an error,
+  as one would silently replace the other in the bundle.
+
+Imports inside functions are left alone: they are the backtest-only paths
+(e.g. Logger(tick_log=...)) and fail on the exchange as they would without the
+bundle.
+
+    python bundle.py round5.py [pairtrading.py ...] [--out dist]
+"""
+import argparse
+import ast
+import os
+import sys
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DIST = os.path.join(ROOT, "dist")
+# modules the exchange provides itself
+EXCHANGE_MODULES = {"datamodel"}
+
+
+class _Module(NamedTuple):
+    name: str
+    path: str
+    lines: List[str]
+    tree: ast.Module
+
+
+def _local_path(module: Optional[str]) -> Optional[str]:
+    if not module or "." in module or module in EXCHANGE_MODULES:
+        return None
+    path = os.path.join(ROOT, module + ".py")
+    return path if os.path.exists(path) else None
+
+
+def _parse(path: str) -> _Module:
+    with open(path) as f:
+        source = f.read()
+    name = os.path.splitext(os.path.basename(path))[0]
+    return _Module(name, path, source.splitlines(), ast.parse(source, path))
+
+
+def _local_imports(module: _Module) -> List[str]:
+    paths = []
+    for node in module.tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if _local_path(alias.name):
+                    raise ValueError(f"{module.name}.py: import {alias.name} cannot be inlined, "
+                                     f"use from {alias.name} import ...")
+        elif isinstance(node, ast.ImportFrom) and not node.level and _local_path(node.module):
+            paths.append(_local_path(node.module))
+    return paths
+
+
+def _modules(path: str) -> List[_Module]:
+    """The strategy and the repository modules it imports, each after the modules it imports."""
+    order: List[_Module] = []
+    done: Set[str] = set()
+    visiting: List[str] = []
+
+    def visit(path: str) -> None:
+        if path in done:
+            return
+        if path in visiting:
+            cycle = visiting[visiting.index(path):] + [path]
+            raise ValueError("import cycle: " + " -> ".join(os.path.basename(p) for p in cycle))
+        visiting.append(path)
+        module = _parse(path)
+        for dependency in _local_imports(module):
+            visit(dependency)
+        visiting.pop()
+        done.add(path)
+        order.append(module)
+
+    visit(os.path.abspath(path))
+    return order
+
+
+def _is_main_block(node: ast.stmt) -> bool:
+    return (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+            and isinstance(node.test.left, ast.Name) and node.test.left.id == "__name__"
+            and len(node.test.comparators) == 1 and isinstance(node.test.comparators[0], ast.Constant)
+            and node.test.comparators[0].value == "__main__")
+
+
+def _targets(node: ast.stmt) -> List[str]:
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+        targets = [node.target]
+    else:
+        return []
+    return [name.id for target in targets for name in ast.walk(target) if isinstance(name, ast.Name)]
+
+
+def bundle(path: str) -> Tuple[str, List[str]]:
+    """(source of the single-file strategy, names of the inlined files, the strategy last)."""
+    modules = _modules(path)
+    # from-import source (None for import x) -> imported names, in the order first seen
+    imports: Dict[Optional[str], Dict[str, None]] = {}
+    # top-level name -> (module that binds it, what it is bound to)
+    bindings: Dict[str, Tuple[str, str]] = {}
+
+    def bind(name: str, module: str, value: str) -> None:
+        previous = bindings.setdefault(name, (module, value))
+        if previous[1] != value:
+            raise ValueError(f"{name} is bound in both {previous[0]}.py and {module}.py")
+
+    bodies = []
+    for module in modules:
+        lines: List[Optional[str]] = list(module.lines)
+        for node in module.tree.body:
+            first, last = node.lineno - 1, node.end_lineno
+            replacement: List[str] = []
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                if isinstance(node, ast.ImportFrom) and not node.level and _local_path(node.module):
+                    replacement = [f"{alias.asname} = {alias.name}" for alias in node.names if alias.asname]
+                    for alias in node.names:
+                        if alias.asname:
+                            bind(alias.asname, module.name, f"{node.module}.{alias.name}")
+                else:
+                    source = "." * node.level + (node.module or "") if isinstance(node, ast.ImportFrom) else None
+                    for alias in node.names:
+                        imports.setdefault(source, {})[ast.unparse(alias)] = None
+                        if source:
+                            bind(alias.asname or alias.name, module.name, f"{source}.{alias.name}")
+                        else:
+                            # import a.b binds a, import a.b as c binds c to a.b
+                            top = alias.name.split(".")[0]
+                            bind(alias.asname or top, module.name, alias.name if alias.asname else top)
+            elif module is not modules[-1] and _is_main_block(node):
+                pass
+            else:
+                for name in _targets(node):
+                    bind(name, module.name, f"{module.name}.{name}")
+                continue
+            if any(lines[i] is None for i in range(first, last)):
+                raise ValueError(f"{module.name}.py:{node.lineno}: one statement per line expected")
+            lines[first:last] = replacement + [None] * (last - first - len(replacement))
+        body = "\n".join(line for line in lines if line is not None).strip("\n")
+        bodies.append(f"# ---- {module.name}.py ----\n\n{body}\n")
+
+    statements = [f"import {name}" for name in imports.pop(None, {})]
+    statements += [f"from {source} import {', '.join(names)}" for source, names in imports.items()]
+    statements.sort(key=lambda statement: not statement.startswith("from __future__ "))
+    names = [os.path.basename(module.path) for module in modules]
+    header = f"# Bundled by bundle.py from {', '.join(names)}; edit those files, not this one.\n"
+    source = header + "\n".join(statements) + "\n\n\n" + "\n\n".join(bodies)
+    compile(source, names[-1], "exec")
+    return source, names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bundle strategies into single files for upload.")
+    parser.add_argument("strategies", nargs="+")
+    parser.add_argument("--out", default=DIST, help="directory of the bundled files")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    for strategy in args.strategies:
+        try:
+            source, names = bundle(strategy)
+        except ValueError as e:
+            sys.exit(f"{strategy}: {e}")
+        out = os.path.join(args.out, os.path.basename(strategy))
+        with open(out, "w") as f:
+            f.write(source)
+        print(f"{out}: {len(source)} chars from {', '.join(names)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Cold-start profile of strategy files, as the lambda sees them after a fresh
+start: every measurement runs in a new interpreter (python -X importtime -c) that
+imports the strategy module, constructs its Trader and runs it on the first
+two recorded states of a sandbox log. Reported per strategy, as the median over
+the repeats:
+
+    import       executing the strategy module, with everything it imports
+    Trader()     constructing the Trader
+    first run    run() on the first state, cold caches and lazy imports included
+    second run   run() on the next state, for comparison
+
+with the heaviest imports of the module (cumulative ms, from -X importtime).
+A strategy whose run() raises on either state is reported as failed, with the
+exception, instead of timed.
+
+    python coldstart.py [strategy.py ...] [--log path] [--repeat N] [--eager]
+
+--eager sets LAZY_IMPORTS=0 (see lazyimport.py), to compare with eager imports.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_LOG = os.path.join(ROOT, "4c7a1701-ea04-4fd2-967b-4582ec0b953c.log")
+STRATEGIES = ["round5.py", "round4_v2.py", "ETF.py", "pairtrading.py", "berries.py", "banana.py", "banana_ma.py",
+              "movingAverage.py", "testtest.py", "pearls.py", "example-program.py"]
+MARKER = "coldstart: strategy import"
+PHASES = ("import_ms", "construct_ms", "first_run_ms", "second_run_ms")
+
+
+# Runs in the fresh interpreter with python -c: only sys, os, time and importlib.util are loaded
+# before the strategy, so everything else it imports (json, re, typing, ...) counts towards it.
+_CHILD = """
+import importlib.util, os, sys, time
+root, strategy, log, marker = sys.argv[1:5]
+sys.path.insert(0, root)
+stdout = sys.stdout
+sys.stdout = open(os.devnull, "w")
+sys.stderr.write(marker + " begin\\n")
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("_coldstart_strategy", strategy)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+imported = time.perf_counter()
+sys.stderr.write(marker + " end\\n")
+trader = module.Trader()
+constructed = time.perf_counter()
+from sandboxlog import ticks
+states = []
+for tick in ticks(log):
+    states.append(tick.state)
+    if len(states) == 2:
+        break
+runs = []
+for state in states:
+    start_run = time.perf_counter()
+    try:
+        trader.run(state)
+    except Exception as e:
+        sys.stderr.write("run() raised on the state at %d: %s: %s\\n" % (state.timestamp, type(e).__name__, e))
+        sys.exit(1)
+    runs.append(time.perf_counter() - start_run)
+stdout.write("%f %f %f %f\\n" % ((imported - start) * 1000, (constructed - imported) * 1000,
+                                  runs[0] * 1000, runs[1] * 1000))
+"""
+
+
+def _heaviest_imports(importtime: str, top: int) -> List[Tuple[str, float]]:
+    """Direct imports of the strategy module by cumulative time, from -X importtime output."""
+    imports = []
+    inside = False
+    for line in importtime.splitlines():
+        if line.startswith(MARKER):
+            inside = line.endswith("begin")
+            continue
+        if not inside or not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  ") and cumulative.strip().isdigit():
+            imports.append((name.strip(), int(cumulative) / 1000))
+    return sorted(imports, key=lambda item: -item[1])[:top]
+
+
+def profile(strategy: str, log: str = DEFAULT_LOG, repeat: int = 5,
+            eager: bool = False) -> Tuple[Dict[str, float], List[Tuple[str, float]]]:
+    """Median of every phase over repeat fresh interpreters, and the heaviest imports of the last one."""
+    env = dict(os.environ, LAZY_IMPORTS="0" if eager else "1")
+    samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    imports: List[Tuple[str, float]] = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", _CHILD, ROOT, strategy, log, MARKER],
+                                   capture_output=True, text=True, env=env)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+        for phase, value in zip(PHASES, completed.stdout.split()):
+            samples[phase].append(float(value))
+        imports = _heaviest_imports(completed.stderr, 3)
+    return {phase: statistics.median(values) for phase, values in samples.items()}, imports
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Cold-start profile of strategy files.")
+    parser.add_argument("strategies", nargs="*")
+    parser.add_argument("--log", default=DEFAULT_LOG)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="LAZY_IMPORTS=0: import lazy modules eagerly")
+    args = parser.parse_args(argv)
+
+    print(f"{'strategy':20s} {'import':>8s} {'Trader()':>9s} {'first run':>10s} {'second run':>11s}  "
+          f"heaviest imports (ms)")
+    for strategy in args.strategies or [os.path.join(ROOT, name) for name in STRATEGIES]:
+        try:
+            phases, imports = profile(strategy, args.log, args.repeat, args.eager)
+        except RuntimeError as e:
+            print(f"{os.path.basename(strategy):20s} failed: {e}")
+            continue
+        print(f"{os.path.basename(strategy):20s} {phases['import_ms']:8.1f} {phases['construct_ms']:9.2f} "
+              f"{phases['first_run_ms']:10.2f} {phases['second_run_ms']:11.2f}  "
+              + ", ".join(f"{name} {ms:.1f}" for name, ms in imports))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ Observation = int
 
 
 class Listing:
+    __slots__ = ("symbol", "product", "denomination")
+
     def __init__(self, symbol: Symbol, product: Product, denomination: Product):
         self.symbol = symbol
         self.product = product
@@ -18,6 +20,8 @@ class Listing:
 
 
 class Order:
+    __slots__ = ("symbol", "price", "quantity")
+
     def __init__(self, symbol: Symbol, price: int, quantity: int) -> None:
         self.symbol = symbol
         self.price = price
@@ -31,12 +35,16 @@ class Order:
 
 
 class OrderDepth:
+    __slots__ = ("buy_orders", "sell_orders")
+
     def __init__(self):
         self.buy_orders: Dict[int, int] = {}
         self.sell_orders: Dict[int, int] = {}
 
 
 class Trade:
+    __slots__ = ("symbol", "price", "quantity", "buyer", "seller", "timestamp")
+
     def __init__(self, symbol: Symbol, price: int, quantity: int, buyer: UserId = None, seller: UserId = None,
                  timestamp: int = 0) -> None:
         self.symbol = symbol
@@ -47,6 +55,14 @@ class Trade:
         self.timestamp = timestamp
 
 
+def as_dict(o) -> dict:
+    """Attribute dict of a datamodel object; the __slots__ classes have no __dict__."""
+    try:
+        return o.__dict__
+    except AttributeError:
+        return {name: getattr(o, name) for name in o.__slots__}
+
+
 class TradingState(object):
     def __init__(self,
                  timestamp: Time,
@@ -65,9 +81,9 @@ class TradingState(object):
         self.observations = observations
 
     def toJSON(self):
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True)
+        return json.dumps(self, default=as_dict, sort_keys=True)
 
 
 class ProsperityEncoder(JSONEncoder):
     def default(self, o):
-        return o.__dict__
\ No newline at end of file
+        return as_dict(o)
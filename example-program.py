@@ -1,6 +1,4 @@
 import json
-import pandas as pd
-import numpy as np
 from datamodel import Order, ProsperityEncoder, Symbol, TradingState, OrderDepth
 from typing import Dict, List, Any
 
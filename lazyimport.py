@@ -0,0 +1,49 @@
+"""
+Lazy imports for strategy modules, so a cold start only pays for what the
+Trader actually uses: lazy_import(name) returns the module at once, but it is
+executed on first attribute access (importlib.util.LazyLoader). A module that
+is already imported is returned as is.
+
+    np = lazy_import("numpy")     # module level, costs a spec lookup
+    prewarm(np)                   # e.g. in Trader.__init__, to keep it out of the first run()
+
+prewarm loads lazy modules now, so a dependency the first run() needs is
+imported while the Trader is constructed instead of inside the timed tick.
+LAZY_IMPORTS=0 in the environment imports everything eagerly, for comparison.
+Only worth it for a heavy dependency: a stdlib module such as tracemalloc
+imports in well under the run-to-run noise of a cold start.
+"""
+import importlib
+import importlib.util
+import os
+import sys
+import time
+from types import ModuleType
+
+EAGER = os.environ.get("LAZY_IMPORTS", "1") == "0"
+
+
+def lazy_import(name: str) -> ModuleType:
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if EAGER:
+        return importlib.import_module(name)
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def prewarm(*modules: ModuleType) -> float:
+    """Finish loading modules from lazy_import; returns the seconds it took."""
+    start = time.perf_counter()
+    for module in modules:
+        # any attribute access makes LazyLoader execute the module
+        getattr(module, "__dict__")
+    return time.perf_counter() - start
@@ -0,0 +1,421 @@
+import json
+from typing import Any, Dict, List, Optional
+
+from datamodel import Order, ProsperityEncoder, Symbol, Trade, TradingState
+
+
+class Logger:
+    """
+    Buffers everything printed during a tick and writes it together with the
+    state and the orders as one JSON line on flush().
+
+    Output can be bounded and sampled so logging can stay on for a whole run:
+
+    - max_tick_chars caps what print() keeps per tick; the rest is replaced by a
+      "[truncated N chars]" marker.
+    - max_run_chars caps the total size of the flushed lines. With last_timestamp
+      set the budget is paced over the run (plus a burst allowance), so ticks are
+      thinned out evenly instead of the tail of the run being cut off. Without it
+      logging stops once the budget is spent, with a single marker line.
+    - every logs only every Nth tick, only_with_orders only ticks with orders.
+      Ticks that are not logged are counted and reported in the next logged tick.
+
+    With compress=True (the default) a line is the compact schema, plain lists
+    and dicts that json.dumps writes without an encoder class or sorted keys:
+
+        {"state": {"t": timestamp,
+                   "l": [[symbol, product, denomination], ...],
+                   "od": {symbol: [{price: volume, ...} buy, {price: volume, ...} sell], ...},
+                   "ot"/"mt": [[symbol, buyer, seller, price, quantity, timestamp], ...],
+                   "p": {product: position}, "o": {product: observation}},
+         "orders": [[symbol, price, quantity], ...],
+         "logs": printed text}
+
+    sandboxlog.to_trading_state reads it back. compress=False writes the
+    datamodel objects through ProsperityEncoder instead, with sorted keys.
+
+    With delta=True (implies compress) only every keyframe_every-th logged tick
+    carries the full compressed state. The ticks in between carry "d": 1 and
+    only what changed since the previously logged tick, so ticks left out by
+    sampling or budgets do not break the chain; see compress_state and
+    StateDecoder for the format.
+
+    With tick_log set to a path every tick is also written, in full and
+    regardless of sampling and budgets, to a binary tick log (see ticklog.py).
+
+    Strategies import it from here; bundle.py inlines it into the single file
+    that is uploaded.
+    """
+
+    def __init__(self, compress: bool = True, max_tick_chars: Optional[int] = None,
+                 max_run_chars: Optional[int] = None, last_timestamp: Optional[int] = None,
+                 burst_chars: int = 10000, every: int = 1, only_with_orders: bool = False,
+                 delta: bool = False, keyframe_every: int = 100, tick_log: Optional[str] = None) -> None:
+        self.compress = compress or delta
+        self.delta = delta
+        self.keyframe_every = keyframe_every
+        self.tick_log = None
+        if tick_log is not None:
+            from ticklog import TickLogWriter
+
+            self.tick_log = TickLogWriter(tick_log)
+        self.max_tick_chars = max_tick_chars
+        self.max_run_chars = max_run_chars
+        self.last_timestamp = last_timestamp
+        self.burst_chars = burst_chars
+        self.every = every
+        self.only_with_orders = only_with_orders
+
+        self.run_chars = 0
+        self.ticks = 0
+        self.skipped_ticks = 0
+        self._unreported_skips = 0
+        self._exhausted = False
+        self._previous: Optional[Dict[str, Any]] = None
+        self._pending: Optional[Dict[str, Any]] = None
+        self._pending_keyframe = False
+        self._since_keyframe = 0
+        self._reset_tick()
+
+    def _reset_tick(self) -> None:
+        self._chunks: List[str] = []
+        self._tick_chars = 0
+        self._truncated_chars = 0
+        self._sampled = self.ticks % self.every == 0
+
+    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
+        if not self._sampled:
+            return
+
+        chunk = sep.join(map(str, objects)) + end
+        if self._truncated_chars:
+            self._truncated_chars += len(chunk)
+            return
+
+        if self.max_tick_chars is not None and self._tick_chars + len(chunk) > self.max_tick_chars:
+            keep = max(self.max_tick_chars - self._tick_chars, 0)
+            self._truncated_chars = len(chunk) - keep
+            chunk = chunk[:keep]
+
+        self._chunks.append(chunk)
+        self._tick_chars += len(chunk)
+
+    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
+        if self.tick_log is not None:
+            self.tick_log.write(self._full_state(state), self.compress_orders(orders), "".join(self._chunks))
+
+        if self._should_log(orders):
+            line = self._line(state, orders, self._take_logs())
+            if self._within_budget(state.timestamp, len(line)):
+                print(line)
+                self.run_chars += len(line)
+                self._unreported_skips = 0
+                if self.delta:
+                    self._previous = self._pending
+                    self._since_keyframe = 0 if self._pending_keyframe else self._since_keyframe + 1
+            else:
+                self._skip()
+        else:
+            self._skip()
+
+        self.ticks += 1
+        self._reset_tick()
+
+    def _should_log(self, orders: dict[Symbol, list[Order]]) -> bool:
+        if not self._sampled:
+            return False
+        if self.only_with_orders:
+            return any(orders.values())
+        return True
+
+    def _skip(self) -> None:
+        self.skipped_ticks += 1
+        self._unreported_skips += 1
+
+    def _take_logs(self) -> str:
+        logs = "".join(self._chunks)
+        if self._truncated_chars:
+            logs += "[truncated " + str(self._truncated_chars) + " chars]\n"
+        if self._unreported_skips:
+            logs = "[" + str(self._unreported_skips) + " ticks not logged]\n" + logs
+        return logs
+
+    def _within_budget(self, timestamp: int, size: int) -> bool:
+        if self.max_run_chars is None:
+            return True
+        if self._exhausted:
+            return False
+
+        if self.last_timestamp is not None:
+            elapsed = min((timestamp + 1) / (self.last_timestamp + 1), 1)
+            return self.run_chars + size <= self.max_run_chars * elapsed + self.burst_chars \
+                and self.run_chars + size <= self.max_run_chars
+
+        if self.run_chars + size <= self.max_run_chars:
+            return True
+        self._exhausted = True
+        print("[log budget of " + str(self.max_run_chars) + " chars exhausted at " + str(timestamp) + "]")
+        return False
+
+    def _line(self, state: TradingState, orders: dict[Symbol, list[Order]], logs: str) -> str:
+        if self.compress:
+            return json.dumps({
+                "state": self.compress_state(state),
+                "orders": self.compress_orders(orders),
+                "logs": logs,
+            }, separators=(",", ":"))
+        return json.dumps({
+            "state": state,
+            "orders": orders,
+            "logs": logs,
+        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True)
+
+    def compress_state(self, state: TradingState) -> dict[str, Any]:
+        """
+        Compressed state. In delta mode a tick after a keyframe is encoded against
+        the previously logged tick instead:
+
+            {"t": timestamp, "d": 1,
+             "od": [[buy_side, sell_side] or 0 if unchanged, ...],
+             "mt"/"ot": {symbol: [[buyer, seller, price, quantity, timestamp], ...] or null},
+             "p": {product: position or null}, "o": {product: observation or null},
+             "l": listings}
+
+        Only changed entries are present, and keys with no changes are left out.
+        "od" is positional: one entry per symbol of the previous state, in sorted
+        symbol order. A change in the set of symbols forces a keyframe. A book side
+        is an int k when it is the previous side with every price moved by k and
+        the same volumes (0 = unchanged). Otherwise it is a flat
+        [price offset, volume, price offset, volume, ...] list, ascending by price.
+        The first offset is relative to the lowest price of the previous side, and
+        each later one to the level before it. Trades are replaced per symbol. If
+        that cannot reproduce the trade list exactly, "mt"/"ot" hold the full
+        compressed list.
+        """
+        if not self.delta:
+            return self._full_state(state)
+
+        listings = self._listings(state)
+        current = {
+            "l": listings,
+            "od": {symbol: (_side(order_depth.buy_orders), _side(order_depth.sell_orders))
+                   for symbol, order_depth in state.order_depths.items()},
+            "ot": self.compress_trades(state.own_trades),
+            "mt": self.compress_trades(state.market_trades),
+            "p": dict(state.position),
+            "o": dict(state.observations),
+        }
+        self._pending = current
+
+        previous = self._previous
+        self._pending_keyframe = previous is None or self._since_keyframe + 1 >= self.keyframe_every \
+            or previous["od"].keys() != current["od"].keys()
+        if self._pending_keyframe:
+            keyframe = {"t": state.timestamp}
+            keyframe.update(current)
+            keyframe["od"] = {symbol: [dict(buy_side), dict(sell_side)]
+                              for symbol, (buy_side, sell_side) in current["od"].items()}
+            return keyframe
+
+        order_depths = []
+        changed = False
+        for symbol in sorted(current["od"]):
+            buy_side, sell_side = current["od"][symbol]
+            previous_buy_side, previous_sell_side = previous["od"][symbol]
+            buy_delta = _side_delta(previous_buy_side, buy_side)
+            sell_delta = _side_delta(previous_sell_side, sell_side)
+            if buy_delta != 0 or sell_delta != 0:
+                order_depths.append([buy_delta, sell_delta])
+                changed = True
+            else:
+                order_depths.append(0)
+
+        compressed = {"t": state.timestamp, "d": 1}
+        if changed:
+            compressed["od"] = order_depths
+        for key in ("ot", "mt"):
+            if current[key] != previous[key]:
+                compressed[key] = _trades_delta(previous[key], current[key])
+        for key in ("p", "o"):
+            changes = _dict_delta(previous[key], current[key])
+            if changes:
+                compressed[key] = changes
+        if current["l"] != previous["l"]:
+            compressed["l"] = current["l"]
+        return compressed
+
+    def _listings(self, state: TradingState) -> list[list[Any]]:
+        listings = []
+        for listing in state.listings.values():
+            if isinstance(listing, dict):
+                listings.append([listing["symbol"], listing["product"], listing["denomination"]])
+            else:
+                listings.append([listing.symbol, listing.product, listing.denomination])
+        return listings
+
+    def _full_state(self, state: TradingState) -> dict[str, Any]:
+        order_depths = {}
+        for symbol, order_depth in state.order_depths.items():
+            order_depths[symbol] = [order_depth.buy_orders, order_depth.sell_orders]
+
+        return {
+            "t": state.timestamp,
+            "l": self._listings(state),
+            "od": order_depths,
+            "ot": self.compress_trades(state.own_trades),
+            "mt": self.compress_trades(state.market_trades),
+            "p": state.position,
+            "o": state.observations,
+        }
+
+    def compress_trades(self, trades: dict[Symbol, list[Trade]]) -> list[list[Any]]:
+        compressed = []
+        for arr in trades.values():
+            for trade in arr:
+                compressed.append([
+                    trade.symbol,
+                    trade.buyer,
+                    trade.seller,
+                    trade.price,
+                    trade.quantity,
+                    trade.timestamp,
+                ])
+
+        return compressed
+
+    def compress_orders(self, orders: dict[Symbol, list[Order]]) -> list[list[Any]]:
+        compressed = []
+        for arr in orders.values():
+            for order in arr:
+                compressed.append([order.symbol, order.price, order.quantity])
+
+        return compressed
+
+
+def _side(levels: dict) -> tuple:
+    return tuple([(price, levels[price]) for price in sorted(levels)])
+
+
+def _side_delta(previous: tuple, current: tuple):
+    if len(previous) == len(current):
+        if not current:
+            return 0
+        shift = current[0][0] - previous[0][0]
+        for (price, volume), (previous_price, previous_volume) in zip(current, previous):
+            if price - previous_price != shift or volume != previous_volume:
+                break
+        else:
+            return shift
+
+    reference = previous[0][0] if previous else 0
+    flat = []
+    for price, volume in current:
+        flat.append(price - reference)
+        flat.append(volume)
+        reference = price
+    return flat
+
+
+def _group_trades(trades: list) -> dict:
+    groups = {}
+    for trade in trades:
+        groups.setdefault(trade[0], []).append(trade)
+    return groups
+
+
+def _trades_delta(previous: list, current: list):
+    previous_groups = _group_trades(previous)
+    current_groups = _group_trades(current)
+    changes = {symbol: [trade[1:] for trade in trades] for symbol, trades in current_groups.items()
+               if previous_groups.get(symbol) != trades}
+    for symbol in previous_groups:
+        if symbol not in current_groups:
+            changes[symbol] = None
+    if _apply_trades(previous, changes) != current:
+        return current
+    return changes
+
+
+def _apply_trades(previous: list, changes) -> list:
+    if isinstance(changes, list):
+        return changes
+    groups = _group_trades(previous)
+    for symbol, trades in changes.items():
+        if trades is None:
+            groups.pop(symbol, None)
+        else:
+            groups[symbol] = [[symbol] + trade for trade in trades]
+    return [trade for trades in groups.values() for trade in trades]
+
+
+def _apply_side(previous: dict, side) -> dict:
+    if isinstance(side, list):
+        reference = min([int(price) for price in previous]) if previous else 0
+        levels = {}
+        for i in range(0, len(side), 2):
+            reference += side[i]
+            levels[str(reference)] = side[i + 1]
+        return levels
+    if side == 0:
+        return previous
+    return {str(int(price) + side): volume for price, volume in previous.items()}
+
+
+def _dict_delta(previous: dict, current: dict) -> dict:
+    """Changed or added keys with their new value, removed keys with None."""
+    changes = {key: value for key, value in current.items() if key not in previous or previous[key] != value}
+    for key in previous:
+        if key not in current:
+            changes[key] = None
+    return changes
+
+
+def _apply_delta(previous: dict, changes: dict) -> dict:
+    current = dict(previous)
+    for key, value in changes.items():
+        if value is None:
+            current.pop(key, None)
+        else:
+            current[key] = value
+    return current
+
+
+class StateDecoder:
+    """
+    Rebuilds full compressed states from a sequence of logged states written by
+    Logger(delta=True). Keyframes pass through unchanged; delta states are applied
+    to the previous state. Feed the states in log order. Unchanged parts of
+    consecutive states are shared, so treat the results as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._state: Optional[Dict[str, Any]] = None
+
+    def decode(self, compressed: Dict[str, Any]) -> Dict[str, Any]:
+        if "d" not in compressed:
+            self._state = compressed
+            return compressed
+
+        previous = self._state
+        if previous is None:
+            raise ValueError("delta state at " + str(compressed.get("t")) + " before the first keyframe")
+
+        order_depths = previous["od"]
+        if "od" in compressed:
+            order_depths = dict(order_depths)
+            for symbol, sides in zip(sorted(order_depths), compressed["od"]):
+                if sides != 0:
+                    buy_orders, sell_orders = order_depths[symbol]
+                    order_depths[symbol] = [_apply_side(buy_orders, sides[0]), _apply_side(sell_orders, sides[1])]
+
+        state = {
+            "t": compressed["t"],
+            "l": compressed.get("l", previous["l"]),
+            "od": order_depths,
+            "ot": _apply_trades(previous["ot"], compressed["ot"]) if "ot" in compressed else previous["ot"],
+            "mt": _apply_trades(previous["mt"], compressed["mt"]) if "mt" in compressed else previous["mt"],
+            "p": _apply_delta(previous["p"], compressed["p"]) if "p" in compressed else previous["p"],
+            "o": _apply_delta(previous["o"], compressed["o"]) if "o" in compressed else previous["o"],
+        }
+        self._state = state
+        return state
@@ -0,0 +1,115 @@
+"""
+Order matching for local simulation, with the exchange's position limits.
+
+Orders are matched against the book of the tick they were sent at: a buy takes
+every ask level priced at or below it, best level first, until it is filled or
+the book runs out, and a sell does the same against the bids. Volume taken by
+one order is gone for the next order in the same tick. Any remainder is
+cancelled at the end of the tick.
+
+Before matching, the orders of every product are checked against its limit the
+way the exchange does it: if the position plus all buy quantities would exceed
+the limit, or the position plus all sell quantities would go below -limit, every
+order for that product is rejected, not just the excess.
+"""
+from typing import Dict, List, Tuple
+
+from datamodel import Order, Product, Symbol, Trade
+
+SUBMISSION = "SUBMISSION"
+
+# Position limits of the 2023 products; the strategies repeat them as constants.
+LIMITS: Dict[Product, int] = {
+    "PEARLS": 20,
+    "BANANAS": 20,
+    "COCONUTS": 600,
+    "PINA_COLADAS": 300,
+    "BERRIES": 250,
+    "DIVING_GEAR": 50,
+    "BAGUETTE": 150,
+    "DIP": 300,
+    "UKULELE": 70,
+    "PICNIC_BASKET": 70,
+}
+
+Levels = List[Tuple[int, int]]
+
+
+class MatchingEngine:
+    """
+    Keeps our position per product across ticks. match() takes the orders of one
+    tick and the book as (bids, asks) lists of (price, volume) per symbol, best
+    level first and ask volumes negative, and returns our fills. The book lists
+    are not modified. Products missing from limits have no limit.
+    """
+
+    def __init__(self, limits: Dict[Product, int] = LIMITS) -> None:
+        self.limits = limits
+        self.position: Dict[Product, int] = {}
+        self.rejected: Dict[Product, int] = {}
+
+    def within_limits(self, symbol: Symbol, orders: List[Order]) -> bool:
+        limit = self.limits.get(symbol)
+        if limit is None:
+            return True
+        position = self.position.get(symbol, 0)
+        buys = sells = 0
+        for order in orders:
+            quantity = int(order.quantity)
+            if quantity > 0:
+                buys += quantity
+            else:
+                sells += quantity
+        return position + buys <= limit and position + sells >= -limit
+
+    def match(self, orders: Dict[Symbol, List[Order]], books: Dict[Symbol, Tuple[Levels, Levels]],
+              timestamp: int) -> List[Trade]:
+        fills: List[Trade] = []
+        position = self.position
+        for symbol, symbol_orders in orders.items():
+            book = books.get(symbol)
+            if book is None or not symbol_orders:
+                continue
+            if not self.within_limits(symbol, symbol_orders):
+                self.rejected[symbol] = self.rejected.get(symbol, 0) + 1
+                continue
+
+            bids, asks = book
+            bid_level = ask_level = 0
+            bid_taken = ask_taken = 0
+            held = position.get(symbol, 0)
+            traded = False
+            for order in symbol_orders:
+                quantity = int(order.quantity)
+                price = order.price
+                if quantity > 0:
+                    while quantity and ask_level < len(asks):
+                        level_price, volume = asks[ask_level]
+                        if level_price > price:
+                            break
+                        filled = min(quantity, -volume - ask_taken)
+                        fills.append(Trade(symbol, level_price, filled, SUBMISSION, "", timestamp))
+                        traded = True
+                        held += filled
+                        quantity -= filled
+                        ask_taken += filled
+                        if ask_taken == -volume:
+                            ask_level += 1
+                            ask_taken = 0
+                elif quantity < 0:
+                    while quantity and bid_level < len(bids):
+                        level_price, volume = bids[bid_level]
+                        if level_price < price:
+                            break
+                        filled = min(-quantity, volume - bid_taken)
+                        fills.append(Trade(symbol, level_price, filled, "", SUBMISSION, timestamp))
+                        traded = True
+                        held -= filled
+                        quantity += filled
+                        bid_taken += filled
+                        if bid_taken == volume:
+                            bid_level += 1
+                            bid_taken = 0
+            if traded:
+                position[symbol] = held
+        return fills
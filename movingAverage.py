@@ -1,25 +1,10 @@
 # Changed
-import json
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState
-from typing import Dict, List, Any
+from datamodel import Order, Symbol, TradingState
+from logger import Logger
+from rolling import RollingWindow
+from typing import Dict, List
 
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": state,
-            "orders": orders,
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-logger = Logger()
+logger = Logger(compress=False)
 
 class Trader:
 
@@ -27,6 +12,10 @@ class Trader:
         self.symbol = 'PEARLS'
         self.ma1_period = 1000  # short-term moving average period
         self.ma2_period = 3000  # long-term moving average period
+        # market trade prices of every product, and the timestamp of the latest trades added
+        self.ma1: Dict[Symbol, RollingWindow] = {}
+        self.ma2: Dict[Symbol, RollingWindow] = {}
+        self.last_trade: Dict[Symbol, int] = {}
 
     def run(self, state: TradingState) -> Dict[str, List[Order]]:
         result = {}
@@ -34,21 +23,29 @@ class Trader:
         for product in state.order_depths.keys():
             self.symbol = product
 
-            # Retrieve historical price data for the selected symbol
-
-            trades = state.market_trades[self.symbol]
-            if len(trades) >= self.ma2_period + 1:
-                trades = state.market_trades[self.symbol][-self.ma2_period - 1:]
-                prices = [trade.price for trade in trades]
+            # Add the market trades not seen yet to the historical price data for the selected symbol
+            if self.symbol not in self.ma1:
+                self.ma1[self.symbol] = RollingWindow(self.ma1_period)
+                self.ma2[self.symbol] = RollingWindow(self.ma2_period)
+            window1 = self.ma1[self.symbol]
+            window2 = self.ma2[self.symbol]
+            last = self.last_trade.get(self.symbol, -1)
+            for trade in state.market_trades.get(self.symbol, []):
+                if trade.timestamp > last:
+                    window1.push(trade.price)
+                    window2.push(trade.price)
+                    self.last_trade[self.symbol] = max(self.last_trade.get(self.symbol, -1), trade.timestamp)
 
+            if window2.count >= self.ma2_period + 1:
                 # Compute the short-term moving average (MA1) and the long-term moving average (MA2) using the historical data
-                ma1 = sum(prices[-self.ma1_period:]) / self.ma1_period
-                ma2 = sum(prices[-self.ma2_period:]) / self.ma2_period
-                ma1_prev = sum(prices[(-self.ma1_period - 1):-1]) / self.ma1_period
-                ma2_prev = sum(prices[(-self.ma2_period - 1):-1]) / self.ma2_period
+                ma1 = window1.mean
+                ma2 = window2.mean
+                ma1_prev = window1.prev_mean
+                ma2_prev = window2.prev_mean
 
                 # Determine the current position in the market (long or short) based on the relationship between MA1 and MA2
                 position_prev = None
+                position = None
                 if ma1_prev > ma2_prev:
                     position_prev = 'long'
                 elif ma1_prev < ma2_prev:
@@ -61,13 +58,13 @@ class Trader:
                 if position_prev == 'long' and position == 'trade':
                     # If the current position is long, we want to buy if there are more sell orders than buy orders at the best ask
                     best_ask = min(order_depth.sell_orders.keys())
-                    volume = - 20 - self.position[product]
+                    volume = - 20 - state.position.get(product, 0)
                     orders = [Order(self.symbol, best_ask, volume)]
                     result[self.symbol] = orders
                 elif position_prev == 'short' and position == 'trade':
                     # If the current position is short, we want to sell if there are more buy orders than sell orders at the best bid
                     best_bid = max(order_depth.buy_orders.keys())
-                    volume = 20 - self.position[product]
+                    volume = 20 - state.position.get(product, 0)
                     orders = [Order(self.symbol, best_bid, volume)]
                     result[self.symbol] = orders
 
@@ -1,71 +1,26 @@
-import json
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState, Trade
-from typing import Dict, List, Any
-
-
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": self.compress_state(state),
-            "orders": self.compress_orders(orders),
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-    def compress_state(self, state: TradingState) -> dict[str, Any]:
-        listings = []
-        for listing in state.listings.values():
-            listings.append([listing["symbol"], listing["product"], listing["denomination"]])
-
-        order_depths = {}
-        for symbol, order_depth in state.order_depths.items():
-            order_depths[symbol] = [order_depth.buy_orders, order_depth.sell_orders]
-
-        return {
-            "t": state.timestamp,
-            "l": listings,
-            "od": order_depths,
-            "ot": self.compress_trades(state.own_trades),
-            "mt": self.compress_trades(state.market_trades),
-            "p": state.position,
-            "o": state.observations,
-        }
-
-    def compress_trades(self, trades: dict[Symbol, list[Trade]]) -> list[list[Any]]:
-        compressed = []
-        for arr in trades.values():
-            for trade in arr:
-                compressed.append([
-                    trade.symbol,
-                    trade.buyer,
-                    trade.seller,
-                    trade.price,
-                    trade.quantity,
-                    trade.timestamp,
-                ])
-
-        return compressed
-
-    def compress_orders(self, orders: dict[Symbol, list[Order]]) -> list[list[Any]]:
-        compressed = []
-        for arr in orders.values():
-            for order in arr:
-                compressed.append([order.symbol, order.price, order.quantity])
-
-        return compressed
-
-logger = Logger()
+from datamodel import Order, TradingState
+from hedgeratio import make_hedge
+from logger import Logger
+from typing import Dict, List
+
+
+logger = Logger(delta=True)
 
 
 class Trader:
 
+    def __init__(self, band: float = 5, coco_size_divisor: float = 50, pc_size_divisor: float = 94,
+                 pina_coconut_ratio: float = 15 / 8, hedge: str = "fixed") -> None:
+        # trade when the best price is more than band away from the fair price; the order size scales
+        # with that distance and reaches the full position at size_divisor
+        self.band = band
+        self.coco_size_divisor = coco_size_divisor
+        self.pc_size_divisor = pc_size_divisor
+        self.pina_coconut_ratio = pina_coconut_ratio
+        # the fair prices use pina_coconut_ratio as is ("fixed") or as the start of an online estimate
+        # ("kalman", see hedgeratio.py)
+        self.hedge = make_hedge(hedge, pina_coconut_ratio)
+
     def run(self, state: TradingState) -> Dict[str, List[Order]]:
         """
         Only method required. It takes all buy and sell orders for all symbols as an input,
@@ -109,32 +64,32 @@ class Trader:
                 coco_mid_price = (coco_best_ask + coco_best_bid) / 2
                 pc_mid_price = (pc_best_ask + pc_best_bid) / 2
 
-                # use fading to determine the fair price
-                coco_fair_price = (coco_mid_price + pc_mid_price / 15 * 8) / 2
-                pc_fair_price = (pc_mid_price + coco_mid_price * 15 / 8) / 2
+                # use fading to determine the fair price, with the hedge ratio learnt up to the last tick
+                coco_fair_price, pc_fair_price = self.hedge.fair_prices(coco_mid_price, pc_mid_price)
+                self.hedge.update(coco_mid_price, pc_mid_price)
 
                 # sell coco if above the fair price
-                if coco_best_bid > coco_fair_price+5:
+                if coco_best_bid > coco_fair_price+self.band:
                     # obtain the max number of coco that can be sold given the max position
-                    volume_max = (coco_max_position + coco_position)*min(1,(coco_best_bid-coco_fair_price)/50) //1
+                    volume_max = (coco_max_position + coco_position)*min(1,(coco_best_bid-coco_fair_price)/self.coco_size_divisor) //1
                     coco_sell_quantity = min(volume_max, coco_order_depth.buy_orders[coco_best_bid])
                     result['COCONUTS'] = [Order('COCONUTS', coco_best_bid, - coco_sell_quantity)]
 
-                if coco_best_ask < coco_fair_price-5:
+                if coco_best_ask < coco_fair_price-self.band:
                     # obtain the max number of coco that can be bought given the max position
-                    volume_max = (coco_max_position - coco_position)*min(1,(coco_fair_price-coco_best_ask)/50) //1
+                    volume_max = (coco_max_position - coco_position)*min(1,(coco_fair_price-coco_best_ask)/self.coco_size_divisor) //1
                     coco_buy_quantity = min(volume_max, - coco_order_depth.sell_orders[coco_best_ask])
                     result['COCONUTS'] = [Order('COCONUTS', coco_best_ask, coco_buy_quantity)]
 
-                if pc_best_bid > pc_fair_price+5:
+                if pc_best_bid > pc_fair_price+self.band:
                     # obtain the max number of pc that can be sold given the max position
-                    volume_max = (pc_max_position + pc_position)*min(1,(pc_best_bid-pc_fair_price)/94) //1
+                    volume_max = (pc_max_position + pc_position)*min(1,(pc_best_bid-pc_fair_price)/self.pc_size_divisor) //1
                     pc_sell_quantity = min(volume_max, pc_order_depth.buy_orders[pc_best_bid])
                     result['PINA_COLADAS'] = [Order('PINA_COLADAS', pc_best_bid, - pc_sell_quantity)]
 
-                if pc_best_ask < pc_fair_price-5:
+                if pc_best_ask < pc_fair_price-self.band:
                     # obtain the max number of pc that can be bought given the max position
-                    volume_max = (pc_max_position - pc_position)*min(1,(pc_fair_price-pc_best_ask)/94) //1
+                    volume_max = (pc_max_position - pc_position)*min(1,(pc_fair_price-pc_best_ask)/self.pc_size_divisor) //1
                     pc_buy_quantity = min(volume_max, - pc_order_depth.sell_orders[pc_best_ask])
                     result['PINA_COLADAS'] = [Order('PINA_COLADAS', pc_best_ask, pc_buy_quantity)]
 
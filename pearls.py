@@ -1,27 +1,9 @@
-import json
-import pandas as pd
-import numpy as np
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState, OrderDepth
-from typing import Dict, List, Any
+from datamodel import Order, TradingState, OrderDepth
+from logger import Logger
+from typing import Dict, List
 
 
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": state,
-            "orders": orders,
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-logger = Logger()
+logger = Logger(compress=False)
 
 
 class Trader:
@@ -37,17 +19,6 @@ class Trader:
         self.max_position_size_PINA_COLADAS = 300
         self.ma1_period = 1000  # short-term moving average period
         self.ma2_period = 3000  # long-term moving average period
-        # Initialize the dataframes to store the order book updates
-        # store the order book updates in two dataframes for each asset respectively: include
-        # the timestamp, TradingState, mid_price
-        self.df_DIVING_GEAR = pd.DataFrame(columns=['timestamp', 'state', 'mid_price'])
-        self.df_BERRIES = pd.DataFrame(columns=['timestamp', 'state', 'mid_price'])
-        self.df_BANANAS = pd.DataFrame(columns=['timestamp', 'state', 'mid_price'])
-        self.df_COCONUTS = pd.DataFrame(columns=['timestamp', 'state', 'mid_price'])
-        self.df_DOLPHIN_SIGHTINGS = pd.DataFrame(columns=['timestamp', 'state', 'mid_price'])
-        self.df_PEARLS = pd.DataFrame(columns=['timestamp', 'state', 'mid_price'])
-        self.df_PINA_COLADAS = pd.DataFrame(columns=['timestamp', 'state', 'mid_price'])
-
 
     def run(self, state: TradingState) -> Dict[str, List[Order]]:
         """
@@ -63,17 +34,10 @@ class Trader:
             # Check if the current product is the 'PEARLS' product, only then run the order logic
             if product == 'PEARLS':
 
-                # calculate the mid_price of the order book and if we do not have both buy_orders and sell_orders, set it to 10000
-                # if len(state.order_depths[product].buy_orders) == 0 or len(state.order_depths[product].sell_orders) == 0:
-                #     mid_price = 10000
-                # else:
-                #     mid_price = (min(state.order_depths[product].sell_orders.keys()) + max(state.order_depths[product].buy_orders.keys())) / 2
-                # # update the order book dataframe
-                # self.df_PEARLS = self.df_PEARLS.append({'timestamp': state.timestamp, 'state': state, 'mid_price': mid_price}, ignore_index=True)
-
-
                 # Retrieve the Order Depth containing all the market BUY and SELL orders for PEARLS
                 order_depth: OrderDepth = state.order_depths[product]
+                # the position is left out of the state while it is 0
+                position = state.position.get(product, 0)
 
                 # Initialize the list of Orders to be sent as an empty list
                 orders: list[Order] = []
@@ -99,11 +63,11 @@ class Trader:
                         # with the same quantity
                         # We expect this order to trade with the sell order
                         # check whether we have checked we can buy
-                        if state.position[product] < self.max_position_size_PEARLS:
+                        if position < self.max_position_size_PEARLS:
                             # obtain the max volume of PEARLS we can buy,
                             # make sure our new position is not greater than the max position size
 
-                            max_volume = self.max_position_size_PEARLS - state.position[product]
+                            max_volume = self.max_position_size_PEARLS - position
                             # check whether the max volume is greater than the best ask volume
                             if max_volume > best_ask_volume:
                                 # if so, buy the best ask volume
@@ -121,7 +85,7 @@ class Trader:
                 # This is an opportunity to sell at a premium
                 if len(order_depth.buy_orders) != 0:
                     best_bid = max(order_depth.buy_orders.keys())
-                    best_bid_volume = max(order_depth.buy_orders[best_bid], -20 - state.position[product])
+                    best_bid_volume = max(order_depth.buy_orders[best_bid], -20 - position)
                     if best_bid > acceptable_price:
                         print("SELL", str(best_bid_volume) + "x", best_bid)
                         orders.append(Order(product, best_bid, -best_bid_volume))
@@ -0,0 +1,130 @@
+"""
+Incremental PnL and inventory per product, O(1) per fill.
+
+Each product keeps its position, the average cost of that position, realized
+PnL (from fills that reduce the position, against the average cost), traded
+volume and turnover (traded notional), and the last mark price. Unrealized PnL
+is position * (mark - average cost); realized + unrealized equals cash plus the
+position marked to market.
+
+Only the backtester uses it so far: it books its fills with on_fill and marks
+with mark. No Trader is wired to it. update(state) reads the books with dict
+operations only, so a strategy can use it on the exchange as well. Feed it
+the state once per tick; own trades repeat in every state until the next fill,
+so only trades newer than the last ones seen are booked:
+
+    self.pnl = PnLTracker()                    # in __init__
+    self.pnl.update(state)                     # first thing in run
+    self.pnl.realized("COCONUTS"), self.pnl.unrealized("PINA_COLADAS"), self.pnl.total()
+"""
+from typing import Dict, Optional
+
+from datamodel import Product, Symbol, TradingState
+
+SUBMISSION = "SUBMISSION"
+
+
+class Inventory:
+    __slots__ = ("position", "average_cost", "realized", "volume", "turnover", "mark")
+
+    def __init__(self) -> None:
+        self.position = 0
+        self.average_cost = 0.0
+        self.realized = 0.0
+        self.volume = 0
+        self.turnover = 0.0
+        self.mark: Optional[float] = None
+
+    def fill(self, price: float, quantity: int) -> None:
+        """Book a fill of quantity (negative for a sell) at price."""
+        if not quantity:
+            return
+        position = self.position
+        self.volume += abs(quantity)
+        self.turnover += abs(quantity) * price
+        if position == 0 or (position > 0) == (quantity > 0):
+            self.average_cost = (self.average_cost * abs(position) + price * abs(quantity)) / abs(position + quantity)
+            self.position = position + quantity
+            return
+
+        closed = min(abs(quantity), abs(position))
+        self.realized += closed * (price - self.average_cost) * (1 if position > 0 else -1)
+        self.position = position + quantity
+        if self.position == 0:
+            self.average_cost = 0.0
+        elif (self.position > 0) != (position > 0):
+            self.average_cost = price
+
+    @property
+    def unrealized(self) -> float:
+        if not self.position or self.mark is None:
+            return 0.0
+        return self.position * (self.mark - self.average_cost)
+
+    @property
+    def total(self) -> float:
+        return self.realized + self.unrealized
+
+
+class PnLTracker:
+    def __init__(self) -> None:
+        self.products: Dict[Product, Inventory] = {}
+        self._last_fill: Dict[Symbol, int] = {}
+
+    def __getitem__(self, product: Product) -> Inventory:
+        inventory = self.products.get(product)
+        if inventory is None:
+            inventory = self.products[product] = Inventory()
+        return inventory
+
+    def on_fill(self, product: Product, price: float, quantity: int) -> None:
+        self[product].fill(price, quantity)
+
+    def mark(self, product: Product, price: float) -> None:
+        self[product].mark = price
+
+    def update(self, state: TradingState) -> None:
+        """Book the own trades of state not seen yet and mark every book at its mid price."""
+        for symbol, trades in state.own_trades.items():
+            last = self._last_fill.get(symbol, -1)
+            newest = last
+            for trade in trades:
+                if trade.timestamp <= last:
+                    continue
+                if trade.buyer == SUBMISSION:
+                    self.on_fill(symbol, trade.price, trade.quantity)
+                elif trade.seller == SUBMISSION:
+                    self.on_fill(symbol, trade.price, -trade.quantity)
+                newest = max(newest, trade.timestamp)
+            self._last_fill[symbol] = newest
+
+        for symbol, order_depth in state.order_depths.items():
+            if order_depth.buy_orders and order_depth.sell_orders:
+                self.mark(symbol, (max(order_depth.buy_orders) + min(order_depth.sell_orders)) / 2)
+
+    def position(self, product: Product) -> int:
+        inventory = self.products.get(product)
+        return inventory.position if inventory is not None else 0
+
+    def average_cost(self, product: Product) -> float:
+        inventory = self.products.get(product)
+        return inventory.average_cost if inventory is not None else 0.0
+
+    def realized(self, product: Optional[Product] = None) -> float:
+        if product is None:
+            return sum(inventory.realized for inventory in self.products.values())
+        inventory = self.products.get(product)
+        return inventory.realized if inventory is not None else 0.0
+
+    def unrealized(self, product: Optional[Product] = None) -> float:
+        if product is None:
+            return sum(inventory.unrealized for inventory in self.products.values())
+        inventory = self.products.get(product)
+        return inventory.unrealized if inventory is not None else 0.0
+
+    def total(self, product: Optional[Product] = None) -> float:
+        return self.realized(product) + self.unrealized(product)
+
+    def turnover(self, product: Product) -> float:
+        inventory = self.products.get(product)
+        return inventory.turnover if inventory is not None else 0.0
@@ -0,0 +1,110 @@
+"""
+Per-block timing inside Trader.run: wrap each strategy block in
+profiler.block(name), or decorate a helper with profiler.timed(name), and call
+profiler.end_tick(timestamp) once per run. Every block's wall time (and, with
+allocations=True, the peak memory allocated inside it, via tracemalloc) is
+recorded per tick; end_tick returns the tick as one "profile {...}" line for
+the Logger, appends it to path as a JSON line if one is given, and adds it to
+the running totals that summary() prints.
+
+A disabled profiler hands out one shared no-op context manager, so the hooks
+cost a method call and an empty with statement per block.
+
+Blocks should not be nested when allocations are tracked: each block resets the
+tracemalloc peak.
+"""
+import json
+import time
+import tracemalloc
+from contextlib import nullcontext
+from functools import wraps
+from typing import Dict, List, Optional
+
+_DISABLED = nullcontext()
+
+
+class _Block:
+    __slots__ = ("profiler", "name", "start", "memory")
+
+    def __init__(self, profiler: "BlockProfiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        if self.profiler.allocations:
+            tracemalloc.reset_peak()
+            self.memory = tracemalloc.get_traced_memory()[0]
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter_ns() - self.start
+        allocated = tracemalloc.get_traced_memory()[1] - self.memory if self.profiler.allocations else 0
+        tick = self.profiler._tick
+        previous = tick.get(self.name)
+        if previous is None:
+            tick[self.name] = [elapsed, allocated]
+        else:
+            previous[0] += elapsed
+            previous[1] = max(previous[1], allocated)
+
+
+class BlockProfiler:
+    def __init__(self, enabled: bool = False, allocations: bool = False, path: Optional[str] = None) -> None:
+        self.enabled = enabled
+        self.allocations = enabled and allocations
+        self.path = path
+        self._tick: Dict[str, List[int]] = {}
+        self._blocks: Dict[str, _Block] = {}
+        # name -> [ticks, total ns, max ns, total bytes]
+        self.totals: Dict[str, List[int]] = {}
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def block(self, name: str):
+        if not self.enabled:
+            return _DISABLED
+        block = self._blocks.get(name)
+        if block is None:
+            block = self._blocks[name] = _Block(self, name)
+        return block
+
+    def timed(self, name: str):
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.block(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def end_tick(self, timestamp: int) -> Optional[str]:
+        """Close the tick: returns its "profile" line (None when disabled or nothing ran)."""
+        if not self.enabled or not self._tick:
+            return None
+        tick = self._tick
+        self._tick = {}
+        for name, (elapsed, allocated) in tick.items():
+            total = self.totals.get(name)
+            if total is None:
+                self.totals[name] = [1, elapsed, elapsed, allocated]
+            else:
+                total[0] += 1
+                total[1] += elapsed
+                total[2] = max(total[2], elapsed)
+                total[3] += allocated
+
+        record = {name: [round(elapsed / 1000, 1), allocated] if self.allocations else round(elapsed / 1000, 1)
+                  for name, (elapsed, allocated) in tick.items()}
+        line = json.dumps({"t": timestamp, "us": record}, separators=(",", ":"))
+        if self.path is not None:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+        return "profile " + line
+
+    def summary(self) -> str:
+        lines = [f"{'block':16s} {'ticks':>6s} {'mean us':>9s} {'max us':>9s}"
+                 + (f" {'mean KiB':>9s}" if self.allocations else "")]
+        for name, (ticks, total, peak, allocated) in sorted(self.totals.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{name:16s} {ticks:6d} {total / ticks / 1000:9.1f} {peak / 1000:9.1f}"
+                         + (f" {allocated / ticks / 1024:9.2f}" if self.allocations else ""))
+        return "\n".join(lines)
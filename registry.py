@@ -0,0 +1,64 @@
+"""
+Strategy registry for Trader.run. A strategy is a function
+fn(trader, state, result) that adds its orders to result, registered under a
+name with the products whose order depths it needs:
+
+    strategies = Registry()
+
+    @strategies.register("pair", "COCONUTS", "PINA_COLADAS")
+    def pair(trader, state, result):
+        ...
+
+run() then calls only the strategies whose products are all in the tick:
+
+    for strategy in strategies.plan(state.order_depths):
+        strategy.fn(self, state, result)
+
+The plan for a set of products is worked out once and cached, so a tick costs
+one lookup whatever the number of products and strategies. Registries compose:
+Registry(a, b) or include() takes the strategies of registries defined in other
+modules, in order.
+"""
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Tuple
+
+from datamodel import Product, TradingState
+
+StrategyFn = Callable[[object, TradingState, dict], None]
+
+
+class Strategy(NamedTuple):
+    name: str
+    products: FrozenSet[Product]
+    fn: StrategyFn
+
+
+class Registry:
+    def __init__(self, *registries: "Registry") -> None:
+        self.strategies: List[Strategy] = []
+        self._plans: Dict[FrozenSet[Product], Tuple[Strategy, ...]] = {}
+        for registry in registries:
+            self.include(registry)
+
+    def add(self, name: str, products: Iterable[Product], fn: StrategyFn) -> None:
+        if any(strategy.name == name for strategy in self.strategies):
+            raise ValueError(f"strategy {name!r} is already registered")
+        self.strategies.append(Strategy(name, frozenset(products), fn))
+        self._plans.clear()
+
+    def register(self, name: str, *products: Product) -> Callable[[StrategyFn], StrategyFn]:
+        def decorator(fn: StrategyFn) -> StrategyFn:
+            self.add(name, products, fn)
+            return fn
+        return decorator
+
+    def include(self, registry: "Registry") -> None:
+        for strategy in registry.strategies:
+            self.add(*strategy)
+
+    def plan(self, products: Iterable[Product]) -> Tuple[Strategy, ...]:
+        """The strategies whose products are all in products, in registration order."""
+        key = products if isinstance(products, frozenset) else frozenset(products)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._plans[key] = tuple(strategy for strategy in self.strategies if strategy.products <= key)
+        return plan
@@ -0,0 +1,210 @@
+"""
+Deterministic replay of recorded sandbox states through a Trader, with the
+orders of every tick cached on disk, and a tick-by-tick diff of the orders of
+two strategy versions.
+
+Every state of a sandbox log is hashed (its JSON with sorted keys), and each
+tick is keyed by the chain of the hashes of all states up to it: a Trader keeps
+state between ticks, so its orders at a tick depend on everything it has seen
+before. The cache of a strategy version (its source, the sources of the local
+modules it imports, and its Trader parameters) maps these keys to the orders,
+so a version is run once per log and then read back. Only logs with a tick
+the version has not seen are replayed, from their first tick, with a fresh
+Trader. Replays assume run() depends only on the states it was given; a time
+budget that drops blocks (timeguard.Watchdog) breaks that on slow ticks.
+
+The states are the recorded ones, the same for both versions whatever they
+order, so the diff shows exactly where the code changes the orders.
+
+    python replay.py round4_v2.py "round4_v2(5).py" [sandbox.log ...] [--limit 20] [--no-cache]
+"""
+import argparse
+import ast
+import contextlib
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from backtest import _NULL, DEFAULT_LOG, ROOT, load_strategy
+from datamodel import Symbol
+from sandboxlog import raw_ticks, to_trading_state
+
+CACHE_DIR = os.path.join(ROOT, ".replay_cache")
+
+# {symbol: [[price, quantity], ...]} without empty lists
+Orders = Dict[Symbol, List[List[float]]]
+
+
+class TickOutput(NamedTuple):
+    timestamp: int
+    orders: Orders
+    error: Optional[str]
+
+
+class RecordedLog:
+    """The decoded states of a sandbox log and the chained hash of every tick."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.states: List[Dict[str, Any]] = [raw["state"] for raw in raw_ticks(path)]
+        self.timestamps = [state["t"] if "t" in state else state["timestamp"] for state in self.states]
+        self.keys: List[str] = []
+        chain = hashlib.blake2b(digest_size=16)
+        for state in self.states:
+            chain.update(json.dumps(state, sort_keys=True, separators=(",", ":")).encode())
+            self.keys.append(chain.copy().hexdigest())
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+
+def _local_imports(path: str, seen: Dict[str, bytes]) -> None:
+    with open(path, "rb") as f:
+        source = f.read()
+    seen[path] = source
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            module = os.path.join(ROOT, name.split(".")[0] + ".py")
+            if module not in seen and os.path.exists(module):
+                _local_imports(module, seen)
+
+
+def strategy_version(path: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Hash of the strategy source, the repository modules it imports and its Trader parameters."""
+    sources: Dict[str, bytes] = {}
+    _local_imports(os.path.abspath(path), sources)
+    digest = hashlib.blake2b(digest_size=16)
+    for module in sorted(sources):
+        digest.update(os.path.basename(module).encode() + b"\0" + sources[module] + b"\0")
+    digest.update(json.dumps(params or {}, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+def _orders(result) -> Orders:
+    return {symbol: [[order.price, order.quantity] for order in orders]
+            for symbol, orders in (result or {}).items() if orders}
+
+
+class Replay:
+    """
+    Orders of one strategy version on recorded logs. hits / runs count the
+    ticks read from the cache and the ticks run through Trader.run.
+    """
+
+    def __init__(self, strategy_path: str, params: Optional[Dict[str, Any]] = None,
+                 cache_dir: Optional[str] = CACHE_DIR) -> None:
+        self.strategy_path = strategy_path
+        self.params = params or {}
+        self.version = strategy_version(strategy_path, params)
+        stem = os.path.splitext(os.path.basename(strategy_path))[0]
+        self.cache_path = os.path.join(cache_dir, f"{stem}-{self.version}.json") if cache_dir else None
+        self.cache: Dict[str, list] = {}
+        self.hits = 0
+        self.runs = 0
+        self._dirty = False
+        if self.cache_path and os.path.exists(self.cache_path):
+            with open(self.cache_path) as f:
+                self.cache = json.load(f)
+
+    def replay(self, log: RecordedLog) -> List[TickOutput]:
+        if not all(key in self.cache for key in log.keys):
+            self._run(log)
+        else:
+            self.hits += len(log)
+        outputs = []
+        for timestamp, key in zip(log.timestamps, log.keys):
+            entry = self.cache[key]
+            outputs.append(TickOutput(timestamp, entry[0], entry[1] if len(entry) > 1 else None))
+        return outputs
+
+    def _run(self, log: RecordedLog) -> None:
+        trader = load_strategy(self.strategy_path).Trader(**self.params)
+        with contextlib.redirect_stdout(_NULL):
+            for state, key in zip(log.states, log.keys):
+                try:
+                    self.cache[key] = [_orders(trader.run(to_trading_state(state)))]
+                except Exception as e:
+                    self.cache[key] = [{}, f"{type(e).__name__}: {e}"]
+        self.runs += len(log)
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self.cache_path or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp = self.cache_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.cache, f, separators=(",", ":"))
+        os.replace(tmp, self.cache_path)
+        self._dirty = False
+
+
+class OrderDiff(NamedTuple):
+    timestamp: int
+    symbol: Symbol
+    a: List[List[float]]
+    b: List[List[float]]
+
+
+def diff(a: List[TickOutput], b: List[TickOutput]) -> List[OrderDiff]:
+    """Every (tick, symbol) whose orders differ; an error shows up as the symbol "error"."""
+    diffs = []
+    for tick_a, tick_b in zip(a, b):
+        if tick_a.orders != tick_b.orders:
+            for symbol in sorted(set(tick_a.orders) | set(tick_b.orders)):
+                orders_a = tick_a.orders.get(symbol, [])
+                orders_b = tick_b.orders.get(symbol, [])
+                if orders_a != orders_b:
+                    diffs.append(OrderDiff(tick_a.timestamp, symbol, orders_a, orders_b))
+        if tick_a.error != tick_b.error:
+            diffs.append(OrderDiff(tick_a.timestamp, "error", [[tick_a.error]], [[tick_b.error]]))
+    return diffs
+
+
+def _format_orders(orders: List[List[Any]]) -> str:
+    if orders and len(orders[0]) == 1:
+        return str(orders[0][0])
+    return " ".join(f"{quantity:+g}@{price:g}" for price, quantity in orders) or "-"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tick-by-tick order diff of two strategy versions.")
+    parser.add_argument("a")
+    parser.add_argument("b")
+    parser.add_argument("logs", nargs="*")
+    parser.add_argument("--limit", type=int, default=20, help="differing ticks to print per log")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cache_dir = None if args.no_cache else CACHE_DIR
+    replays = [Replay(args.a, cache_dir=cache_dir), Replay(args.b, cache_dir=cache_dir)]
+    total = 0
+    for path in args.logs or [DEFAULT_LOG]:
+        log = RecordedLog(path)
+        diffs = diff(*(replay.replay(log) for replay in replays))
+        total += len(diffs)
+        ticks = sorted({d.timestamp for d in diffs})
+        print(f"{os.path.basename(path)}: {len(log)} ticks, {len(ticks)} differ ({len(diffs)} symbol orders)")
+        shown = set(ticks[:args.limit])
+        for d in diffs:
+            if d.timestamp in shown:
+                print(f"  {d.timestamp:7d} {d.symbol:14s} {_format_orders(d.a):30s} | {_format_orders(d.b)}")
+    for replay in replays:
+        replay.save()
+    print(f"{time.perf_counter() - start:.2f}s; "
+          + "; ".join(f"{os.path.basename(r.strategy_path)}: {r.runs} ticks run, {r.hits} cached" for r in replays))
+    if total:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
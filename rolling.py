@@ -0,0 +1,110 @@
+"""
+Rolling statistics over the last size samples of a series, O(1) per push: a
+ring buffer holds the window plus the sample that just left it, and the sum,
+the variance (sliding Welford update) and an EMA are kept up to date, so
+nothing is re-summed. prev_sum / prev_mean are the same statistics one sample
+earlier (the window without the latest sample, with the one before it), which
+crossover rules compare against the current values.
+
+    window = RollingWindow(30)
+    window.push(mid_price)
+    if window.full:
+        window.mean, window.prev_mean, window.std, window.ema
+
+Sums of prices on a tick grid (integers and halves) are exact in floats, so
+mean matches sum(prices[-size:]) / size bit for bit.
+"""
+import math
+from typing import List, Optional
+
+
+class RollingWindow:
+    __slots__ = ("size", "alpha", "count", "sum", "_m2", "_mean", "ema", "_buffer", "_head")
+
+    def __init__(self, size: int, ema_alpha: Optional[float] = None) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        # default EMA weight: the usual 2 / (size + 1) span of a size-sample window
+        self.alpha = ema_alpha if ema_alpha is not None else 2 / (size + 1)
+        # samples pushed so far, window or not
+        self.count = 0
+        self.sum = 0.0
+        self._m2 = 0.0
+        self._mean = 0.0
+        self.ema: Optional[float] = None
+        # size + 1 slots: the window and the sample before it; _head is where the next push goes
+        self._buffer: List[float] = [0.0] * (size + 1)
+        self._head = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.size
+
+    def push(self, value: float) -> None:
+        buffer = self._buffer
+        head = self._head
+        size = self.size
+        buffer[head] = value
+        head = self._head = head + 1 if head < size else 0
+        count = self.count = self.count + 1
+        ema = self.ema
+        self.ema = value if ema is None else ema + self.alpha * (value - ema)
+
+        if count <= size:
+            self.sum += value
+            delta = value - self._mean
+            self._mean += delta / count
+            self._m2 += delta * (value - self._mean)
+            return
+
+        old = buffer[head]  # the sample that left the window, kept for prev_*
+        change = value - old
+        self.sum += change
+        mean = self._mean
+        new_mean = self._mean = mean + change / size
+        m2 = self._m2 + change * (value - new_mean + old - mean)
+        self._m2 = m2 if m2 > 0.0 else 0.0
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._buffer[self._head - 1] if self.count else None
+
+    @property
+    def mean(self) -> float:
+        if self.count >= self.size:
+            return self.sum / self.size
+        return self.sum / self.count if self.count else math.nan
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the window."""
+        n = len(self)
+        return self._m2 / n if n else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def prev_sum(self) -> float:
+        """Sum of the window as it was before the latest push (needs count > size)."""
+        if self.count <= self.size:
+            return math.nan
+        # the next push target still holds the sample that left the window with the latest push
+        buffer = self._buffer
+        head = self._head
+        return self.sum - buffer[head - 1] + buffer[head]
+
+    @property
+    def prev_mean(self) -> float:
+        return self.prev_sum / self.size
+
+    def values(self) -> List[float]:
+        """The window, oldest first."""
+        n = len(self)
+        buffer = self._buffer
+        return [buffer[(self._head - n + i) % len(buffer)] for i in range(n)]
@@ -1,24 +1,8 @@
-import json
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState, OrderDepth
-from typing import Dict, List, Any
+from datamodel import Order, TradingState
+from logger import Logger
+from typing import Dict, List
 
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": state,
-            "orders": orders,
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-logger = Logger()
+logger = Logger(compress=False)
 
 class Trader:
 
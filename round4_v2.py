@@ -1,27 +1,20 @@
-import json
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState, OrderDepth
-from typing import Dict, List, Any
+from datamodel import Order, TradingState, OrderDepth
+from logger import Logger
+from typing import Dict, List
 
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": state,
-            "orders": orders,
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-logger = Logger()
+logger = Logger(compress=False)
 
 class Trader:
 
+    def __init__(self, acceptable_buy: float = 370, acceptable_sell: float = 430, position_skew: float = 0.3,
+                 pina_coconut_ratio: float = 15 / 8) -> None:
+        # basket premium (basket minus its components) to buy below / sell above, moved down by
+        # position_skew per basket held, and the PINA_COLADAS / COCONUTS price ratio of the pair fair price
+        self.acceptable_buy = acceptable_buy
+        self.acceptable_sell = acceptable_sell
+        self.position_skew = position_skew
+        self.pina_coconut_ratio = pina_coconut_ratio
+
     def run(self, state: TradingState) -> Dict[str, List[Order]]:
         """
         Only method required. It takes all buy and sell orders for all symbols as an input,
@@ -95,8 +88,8 @@ class Trader:
             else:
                 pic_position = 0
 
-            acceptable_buy = 370 - (0.3*(pic_position)//1)
-            acceptable_sell = 430 - (0.3*(pic_position)//1)
+            acceptable_buy = self.acceptable_buy - (self.position_skew*(pic_position)//1)
+            acceptable_sell = self.acceptable_sell - (self.position_skew*(pic_position)//1)
             
 
             # buy basket
@@ -197,8 +190,8 @@ class Trader:
                 pc_mid_price = (pc_best_ask + pc_best_bid) / 2
 
                 # use fading to determine the fair price
-                coco_fair_price = (coco_mid_price + pc_mid_price / 15 * 8) / 2
-                pc_fair_price = (pc_mid_price + coco_mid_price * 15 / 8) / 2
+                coco_fair_price = (coco_mid_price + pc_mid_price / self.pina_coconut_ratio) / 2
+                pc_fair_price = (pc_mid_price + coco_mid_price * self.pina_coconut_ratio) / 2
 
                 # sell coco if above the fair price
                 if coco_best_bid > coco_fair_price:
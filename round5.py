@@ -1,320 +1,378 @@
-import json
-from datamodel import Order, ProsperityEncoder, Symbol, TradingState, OrderDepth, Trade
-from typing import Dict, List, Any
-
-
-class Logger:
-    def __init__(self) -> None:
-        self.logs = ""
-
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
-        self.logs += sep.join(map(str, objects)) + end
-
-    def flush(self, state: TradingState, orders: dict[Symbol, list[Order]]) -> None:
-        print(json.dumps({
-            "state": self.compress_state(state),
-            "orders": self.compress_orders(orders),
-            "logs": self.logs,
-        }, cls=ProsperityEncoder, separators=(",", ":"), sort_keys=True))
-
-        self.logs = ""
-
-    def compress_state(self, state: TradingState) -> dict[str, Any]:
-        listings = []
-        for listing in state.listings.values():
-            listings.append([listing["symbol"], listing["product"], listing["denomination"]])
-
-        order_depths = {}
-        for symbol, order_depth in state.order_depths.items():
-            order_depths[symbol] = [order_depth.buy_orders, order_depth.sell_orders]
-
-        return {
-            "t": state.timestamp,
-            "l": listings,
-            "od": order_depths,
-            "ot": self.compress_trades(state.own_trades),
-            "mt": self.compress_trades(state.market_trades),
-            "p": state.position,
-            "o": state.observations,
-        }
-
-    def compress_trades(self, trades: dict[Symbol, list[Trade]]) -> list[list[Any]]:
-        compressed = []
-        for arr in trades.values():
-            for trade in arr:
-                compressed.append([
-                    trade.symbol,
-                    trade.buyer,
-                    trade.seller,
-                    trade.price,
-                    trade.quantity,
-                    trade.timestamp,
-                ])
-
-        return compressed
-
-    def compress_orders(self, orders: dict[Symbol, list[Order]]) -> list[list[Any]]:
-        compressed = []
-        for arr in orders.values():
-            for order in arr:
-                compressed.append([order.symbol, order.price, order.quantity])
-
-        return compressed
-
-logger = Logger()
+from basketpricing import PICNIC_BASKET, basket_curves, np
+from datamodel import Order, TradingState, OrderDepth
+from hedgeratio import make_hedge
+from lazyimport import prewarm
+from logger import Logger
+from profiling import BlockProfiler
+from registry import Registry
+from spreadstats import BANDS, SpreadStats
+from timeguard import Watchdog
+from typing import Dict, List, Optional
+
+
+logger = Logger(delta=True)
+
+strategies = Registry()
+
+
+@strategies.register('BERRIES', 'BERRIES')
+def berries(trader, state: TradingState, result: Dict[str, List[Order]]) -> None:
+    product = 'BERRIES'
+    if 'BERRIES' in state.position.keys():
+        position = state.position[product]
+    else:
+        position = 0
+
+    order_depth: OrderDepth = state.order_depths[product]
+    # buy berries from time 100K to 200K
+    if len(order_depth.sell_orders) > 0 and 100000 < state.timestamp < 200000:
+        best_ask = min(order_depth.sell_orders.keys())
+        best_ask_volume = min(-order_depth.sell_orders[best_ask], 250 - position)
+        print("BUY", str(best_ask_volume) + "x", best_ask)
+        result[product] = [Order(product, best_ask, best_ask_volume)]
+
+    # sell berries from time 450K to 550K
+    if len(order_depth.buy_orders) > 0 and 450000 < state.timestamp < 550000:
+        best_bid = max(order_depth.buy_orders.keys())
+        best_bid_volume = min(order_depth.buy_orders[best_bid],  250 + position)
+        print("SELL", str(best_bid_volume) + "x", best_bid)
+        result[product] = [Order(product, best_bid, - best_bid_volume)]
+
+
+@strategies.register('BANANAS', 'BANANAS')
+def bananas(trader, state: TradingState, result: Dict[str, List[Order]]) -> None:
+    product = 'BANANAS'
+    if 'BANANAS' in state.position.keys():
+        position = state.position['BANANAS']
+    else:
+        position = 0
+
+    order_depth: OrderDepth = state.order_depths['BANANAS']
+
+    orders: list[Order] = []
+
+    if len(order_depth.sell_orders) > 0 and len(order_depth.buy_orders) > 0:
+        best_ask = min(order_depth.sell_orders.keys())
+        best_bid = max(order_depth.buy_orders.keys())
+        mid_price = (best_ask + best_bid) / 2
+        spread = best_ask - best_bid
+        if spread < 3:
+            if len(order_depth.buy_orders.keys()) > 1:
+                bid2 = sorted(order_depth.buy_orders)[-2]
+                if best_bid - bid2 > 2:
+                    # weighted average of bid1 and bid2
+                    # acceptable_price = (best_bid * order_depth.buy_orders[best_bid] + bid2 * order_depth.buy_orders[bid2]) / (order_depth.buy_orders[best_bid] + order_depth.buy_orders[bid2])
+                    # acceptable_price = (acceptable_price + best_ask) // 2
+                    # if best_bid > acceptable_price:
+                    best_bid_volume = min(order_depth.buy_orders[best_bid], 20 + position)
+                    orders.append(Order(product, best_bid, -best_bid_volume))
+
+            if len(order_depth.sell_orders.keys()) > 1:
+                ask2 = sorted(order_depth.sell_orders)[1]
+                if ask2 - best_ask > 2:
+                    # weighted average of ask1 and ask2
+                    # acceptable_price = (best_ask * order_depth.sell_orders[best_ask] + ask2 * order_depth.sell_orders[ask2]) / (order_depth.sell_orders[best_ask] + order_depth.sell_orders[ask2])
+                    # acceptable_price = (acceptable_price + best_bid) // 2
+                    # if best_ask < acceptable_price:
+                    best_ask_volume = min(-order_depth.sell_orders[best_ask], 20 - position)
+                    # we buy
+                    orders.append(Order(product, best_ask, best_ask_volume))
+    result[product] = orders
+
+
+@strategies.register('PEARLS', 'PEARLS')
+def pearls(trader, state: TradingState, result: Dict[str, List[Order]]) -> None:
+    product = 'PEARLS'
+    if 'PEARLS' in state.position.keys():
+        position = state.position[product]
+    else:
+        position = 0
+
+    order_depth: OrderDepth = state.order_depths[product]
+    orders: list[Order] = []
+    acceptable_price = 10000
+
+    if len(order_depth.sell_orders) > 0:
+
+        # Sort all the available sell orders by their price,
+        # and select only the sell order with the lowest price
+        best_ask = min(order_depth.sell_orders.keys())
+        best_ask_volume = min(-order_depth.sell_orders[best_ask], 20 - position)
+
+        if best_ask < acceptable_price:
+            # In case the lowest ask is lower than our fair value,
+            # This presents an opportunity for us to buy cheaply
+            # The code below therefore sends a BUY order at the price level of the ask,
+            # with the same quantity
+            # We expect this order to trade with the sell order
+            print("BUY", str(-best_ask_volume) + "x", best_ask)
+            orders.append(Order(product, best_ask, best_ask_volume))
+
+    if len(order_depth.buy_orders) > 0:
+        best_bid = max(order_depth.buy_orders.keys())
+        best_bid_volume = min(order_depth.buy_orders[best_bid], 20 + position)
+        if best_bid > acceptable_price:
+            print("SELL", str(best_bid_volume) + "x", best_bid)
+            orders.append(Order(product, best_bid, -best_bid_volume))
+    # Add all the above the orders to the result dict
+    result[product] = orders
+    orders = []
+    # Return the dict of orders
+    # These possibly contain buy or sell orders for PEARLS
+    # Depending on the logic above
+
+
+# Round 4 code starts here
+BASKET_LIMITS = {'PICNIC_BASKET': 70, 'BAGUETTE': 150, 'DIP': 300, 'UKULELE': 70}
+
+
+@strategies.register('basket', 'BAGUETTE', 'DIP', 'UKULELE', 'PICNIC_BASKET')
+def basket(trader, state: TradingState, result: Dict[str, List[Order]]) -> None:
+    if 'PICNIC_BASKET' in state.position.keys():
+        pic_position = state.position['PICNIC_BASKET']
+    else:
+        pic_position = 0
+
+    # fixed bands: buy below acceptable_buy, sell above acceptable_sell, full size 200 away from 400;
+    # z-score bands: the same around the mean basket price, trader.basket_z and basket_z_full std away
+    centre, acceptable_buy, acceptable_sell, full = 400, trader.acceptable_buy, trader.acceptable_sell, 200
+    if trader.basket_bands != 'fixed':
+        trader.basket_spread.update(state.order_depths)
+        if trader.basket_spread.ready:
+            centre, std = trader.basket_spread.moments(trader.basket_bands == 'ew')
+            acceptable_buy = centre - trader.basket_z * std
+            acceptable_sell = centre + trader.basket_z * std
+            full = max(trader.basket_z_full * std, 1)
+
+    acceptable_buy = acceptable_buy - (trader.position_skew * (pic_position) // 1)
+    acceptable_sell = acceptable_sell - (trader.position_skew * (pic_position) // 1)
+
+    if trader.basket_depth:
+        basket_levels(state, result, pic_position, centre, full, acceptable_buy, acceptable_sell)
+        return
+
+    BAG_order_depth = state.order_depths['BAGUETTE']
+    DIP_order_depth = state.order_depths['DIP']
+    UKU_order_depth = state.order_depths['UKULELE']
+    PIC_order_depth = state.order_depths['PICNIC_BASKET']
+
+    # buy basket
+    if (
+            (len(BAG_order_depth.buy_orders) > 0) and
+            (len(DIP_order_depth.buy_orders) > 0) and
+            (len(UKU_order_depth.buy_orders) > 0) and
+            (len(PIC_order_depth.sell_orders) > 0)
+    ):
+        best_pic_ask = min(PIC_order_depth.sell_orders.keys())
+        best_bag_bid = max(BAG_order_depth.buy_orders.keys())
+        best_dip_bid = max(DIP_order_depth.buy_orders.keys())
+        best_uku_bid = max(UKU_order_depth.buy_orders.keys())
+        volume_max = BASKET_LIMITS['PICNIC_BASKET'] - pic_position
+
+        basket_price = best_pic_ask - best_dip_bid * 4 - best_bag_bid * 2 - best_uku_bid
+
+        trade_volume = min(volume_max * (centre - basket_price) / full, volume_max) // 1
+
+        if basket_price < acceptable_buy:
+            result['PICNIC_BASKET'] = [Order('PICNIC_BASKET', best_pic_ask, trade_volume)]
+            result['BAGUETTE'] = [Order('BAGUETTE', best_bag_bid, (-trade_volume) * 2)]
+            result['DIP'] = [Order('DIP', best_dip_bid, (-trade_volume) * 4)]
+            result['UKULELE'] = [Order('UKULELE', best_uku_bid, (-trade_volume))]
+
+    # sell basket
+    if (
+            (len(BAG_order_depth.sell_orders) > 0) and
+            (len(DIP_order_depth.sell_orders) > 0) and
+            (len(UKU_order_depth.sell_orders) > 0) and
+            (len(PIC_order_depth.buy_orders) > 0)
+    ):
+        best_pic_bid = max(PIC_order_depth.buy_orders.keys())
+        best_bag_ask = min(BAG_order_depth.sell_orders.keys())
+        best_dip_ask = min(DIP_order_depth.sell_orders.keys())
+        best_uku_ask = min(UKU_order_depth.sell_orders.keys())
+        volume_max = BASKET_LIMITS['PICNIC_BASKET'] + pic_position
+
+        basket_price = best_pic_bid - best_dip_ask * 4 - best_bag_ask * 2 - best_uku_ask
+
+        trade_volume = min(volume_max * (basket_price - centre) / full, volume_max) // 1
+
+        if basket_price > acceptable_sell:
+            result['PICNIC_BASKET'] = [Order('PICNIC_BASKET', best_pic_bid, -trade_volume)]
+            result['BAGUETTE'] = [Order('BAGUETTE', best_bag_ask, trade_volume * 2)]
+            result['DIP'] = [Order('DIP', best_dip_ask, trade_volume * 4)]
+            result['UKULELE'] = [Order('UKULELE', best_uku_ask, trade_volume)]
+
+
+def basket_levels(state: TradingState, result: Dict[str, List[Order]], pic_position: int, centre: float,
+                  full: float, acceptable_buy: float, acceptable_sell: float) -> None:
+    """The basket block over every level of the books (trader.basket_depth), see basketpricing.py."""
+    # basket price (basket minus its components) of every basket the books can fill, all levels
+    sell_curve, buy_curve = basket_curves(state.order_depths)
+
+    # buy basket: as many baskets as are priced below acceptable_buy, at most the share of the
+    # position room set by the best basket price, and within every leg's position limit
+    if len(buy_curve) > 0:
+        volume_max = BASKET_LIMITS['PICNIC_BASKET'] - pic_position
+
+        basket_price = buy_curve.premiums[0]
+
+        trade_volume = min(volume_max * (centre - basket_price) / full, volume_max) // 1
+
+        volume = min(buy_curve.size_at(acceptable_buy), int(trade_volume), buy_curve.room(state.position, BASKET_LIMITS))
+        if volume > 0:
+            result.update(buy_curve.orders(volume))
+
+    # sell basket
+    if len(sell_curve) > 0:
+        volume_max = BASKET_LIMITS['PICNIC_BASKET'] + pic_position
+
+        basket_price = sell_curve.premiums[0]
+
+        trade_volume = min(volume_max * (basket_price - centre) / full, volume_max) // 1
+
+        volume = min(sell_curve.size_at(acceptable_sell), int(trade_volume), sell_curve.room(state.position, BASKET_LIMITS))
+        if volume > 0:
+            result.update(sell_curve.orders(volume))
+
+
+# coconut & pina colada pair trading starts here
+@strategies.register('pair', 'COCONUTS', 'PINA_COLADAS')
+def pair(trader, state: TradingState, result: Dict[str, List[Order]]) -> None:
+    coco_order_depth = state.order_depths['COCONUTS']
+    pc_order_depth = state.order_depths['PINA_COLADAS']
+
+    if 'COCONUTS' in state.position.keys():
+        coco_position = state.position['COCONUTS']
+    else:
+        coco_position = 0
+
+    if 'PINA_COLADAS' in state.position.keys():
+        pc_position = state.position['PINA_COLADAS']
+    else:
+        pc_position = 0
+
+    coco_max_position = 600
+    pc_max_position = 300
+
+    # coco_acceptable_price = 8000
+    # pc_acceptable_price = 15000
+
+    if (len(coco_order_depth.sell_orders) > 0 and
+        len(coco_order_depth.buy_orders) > 0 and
+        len(pc_order_depth.sell_orders) > 0 and
+        len(pc_order_depth.buy_orders) > 0):
+
+        coco_best_ask = min(coco_order_depth.sell_orders.keys())
+        coco_best_bid = max(coco_order_depth.buy_orders.keys())
+        pc_best_ask = min(pc_order_depth.sell_orders.keys())
+        pc_best_bid = max(pc_order_depth.buy_orders.keys())
+        coco_mid_price = (coco_best_ask + coco_best_bid) / 2
+        pc_mid_price = (pc_best_ask + pc_best_bid) / 2
+
+        # use fading to determine the fair price, with the hedge ratio learnt up to the last tick
+        ratio = trader.hedge.ratio
+        residual = pc_mid_price - trader.hedge.intercept - ratio * coco_mid_price
+        coco_fair_price, pc_fair_price = trader.hedge.fair_prices(coco_mid_price, pc_mid_price)
+        trader.hedge.update(coco_mid_price, pc_mid_price)
+
+        # z-score bands: the residual of the hedge, PINA_COLADAS - intercept - ratio * COCONUTS, fades to
+        # its mean instead of 0, and only once it is trader.pair_z std away from it (half of the move is
+        # priced in each leg); the fair prices already hold the intercept, so only the rest is added
+        coco_band = pc_band = 0
+        if trader.pair_bands != 'fixed':
+            trader.pair_spread.push(residual)
+            if trader.pair_spread.ready:
+                mean, std = trader.pair_spread.moments(trader.pair_bands == 'ew')
+                coco_fair_price -= mean / (2 * ratio)
+                pc_fair_price += mean / 2
+                pc_band = trader.pair_z * std / 2
+                coco_band = pc_band / ratio
+
+        # sell coco if above the fair price
+        if coco_best_bid > coco_fair_price + coco_band:
+            # obtain the max number of coco that can be sold given the max position
+            volume_max = coco_max_position + coco_position
+            coco_sell_quantity = min(volume_max, coco_order_depth.buy_orders[coco_best_bid])
+            result['COCONUTS'] = [Order('COCONUTS', coco_best_bid, - coco_sell_quantity)]
+
+        if coco_best_ask < coco_fair_price - coco_band:
+            # obtain the max number of coco that can be bought given the max position
+            volume_max = coco_max_position - coco_position
+            coco_buy_quantity = min(volume_max, - coco_order_depth.sell_orders[coco_best_ask])
+            result['COCONUTS'] = [Order('COCONUTS', coco_best_ask, coco_buy_quantity)]
+
+        if pc_best_bid > pc_fair_price + pc_band:
+            # obtain the max number of pc that can be sold given the max position
+            volume_max = pc_max_position + pc_position
+            pc_sell_quantity = min(volume_max, pc_order_depth.buy_orders[pc_best_bid])
+            result['PINA_COLADAS'] = [Order('PINA_COLADAS', pc_best_bid, - pc_sell_quantity)]
+
+        if pc_best_ask < pc_fair_price - pc_band:
+            # obtain the max number of pc that can be bought given the max position
+            volume_max = pc_max_position - pc_position
+            pc_buy_quantity = min(volume_max, - pc_order_depth.sell_orders[pc_best_ask])
+            result['PINA_COLADAS'] = [Order('PINA_COLADAS', pc_best_ask, pc_buy_quantity)]
 
 
 class Trader:
 
+    def __init__(self, acceptable_buy: float = 370, acceptable_sell: float = 430, position_skew: float = 0.3,
+                 pina_coconut_ratio: float = 15 / 8, hedge: str = "fixed", basket_bands: str = "fixed",
+                 basket_z: float = 3.0, basket_z_full: float = 4.0, pair_bands: str = "fixed", pair_z: float = 3.0,
+                 spread_window: int = 400, profile: bool = False, profile_allocations: bool = False,
+                 profile_path: Optional[str] = None, time_budget_ms: Optional[float] = 500,
+                 basket_cutoff: float = 0.6, pair_cutoff: float = 0.8, basket_depth: bool = False) -> None:
+        # basket premium (basket minus its components) to buy below / sell above, moved down by
+        # position_skew per basket held, and the PINA_COLADAS / COCONUTS price ratio of the pair fair price,
+        # fixed or estimated online from it ("kalman", see hedgeratio.py)
+        self.acceptable_buy = acceptable_buy
+        self.acceptable_sell = acceptable_sell
+        self.position_skew = position_skew
+        self.pina_coconut_ratio = pina_coconut_ratio
+        self.hedge = make_hedge(hedge, pina_coconut_ratio)
+        # price bands of both blocks: "fixed" as above, or z-scores of the mid spread over the last
+        # spread_window ticks ("window") or exponentially weighted ("ew"), see spreadstats.py
+        for bands in (basket_bands, pair_bands):
+            if bands not in BANDS:
+                raise ValueError(f"unknown bands {bands!r}, expected one of {', '.join(BANDS)}")
+        self.basket_bands = basket_bands
+        self.basket_z = basket_z
+        self.basket_z_full = basket_z_full
+        # trade the basket at the top of book, or over every level of the books (basketpricing.py);
+        # the levels lose in the backtest (74988 against 101321 over all days), so they are opt-in
+        self.basket_depth = basket_depth
+        if basket_depth:
+            # numpy (basketpricing.py) loads here rather than inside the first run()
+            prewarm(np)
+        self.pair_bands = pair_bands
+        self.pair_z = pair_z
+        self.basket_spread = SpreadStats(PICNIC_BASKET, spread_window)
+        # residuals of self.hedge, pushed by the pair block
+        self.pair_spread = SpreadStats(window=spread_window)
+        # per-block timings in the log ("profile" lines) and optionally in a JSON lines file
+        self.profiler = BlockProfiler(profile, profile_allocations, profile_path)
+        # blocks that would run past their fraction of the time budget are dropped for the tick,
+        # the basket arbitrage first; errors in a block only lose that block's orders
+        self.watchdog = Watchdog(time_budget_ms, {"basket": basket_cutoff, "pair": pair_cutoff})
+
     def run(self, state: TradingState) -> Dict[str, List[Order]]:
         """
         Only method required. It takes all buy and sell orders for all symbols as an input,
         and outputs a list of orders to be sent
         """
+        self.watchdog.start()
         result = {}
-        for product in state.order_depths.keys():
-            if product == 'BERRIES':
-                if 'BERRIES' in state.position.keys():
-                    position = state.position[product]
-                else:
-                    position = 0
-
-                order_depth: OrderDepth = state.order_depths[product]
-                # buy berries from time 100K to 200K
-                if len(order_depth.sell_orders) > 0 and 100000 < state.timestamp < 200000:
-                    best_ask = min(order_depth.sell_orders.keys())
-                    best_ask_volume = min(-order_depth.sell_orders[best_ask], 250 - position)
-                    print("BUY", str(best_ask_volume) + "x", best_ask)
-                    result[product] = [Order(product, best_ask, best_ask_volume)]
-
-                # sell berries from time 450K to 550K
-                if len(order_depth.buy_orders) > 0 and 450000 < state.timestamp < 550000:
-                    best_bid = max(order_depth.buy_orders.keys())
-                    best_bid_volume = min(order_depth.buy_orders[best_bid],  250 + position)
-                    print("SELL", str(best_bid_volume) + "x", best_bid)
-                    result[product] = [Order(product, best_bid, - best_bid_volume)]
-
-            if product == 'BANANAS':
-                if 'BANANAS' in state.position.keys():
-                    position = state.position['BANANAS']
-                else:
-                    position = 0
-
-                order_depth: OrderDepth = state.order_depths['BANANAS']
-
-                orders: list[Order] = []
-
-                if len(order_depth.sell_orders) > 0 and len(order_depth.buy_orders) > 0:
-                    best_ask = min(order_depth.sell_orders.keys())
-                    best_bid = max(order_depth.buy_orders.keys())
-                    mid_price = (best_ask + best_bid) / 2
-                    spread = best_ask - best_bid
-                    if spread < 3:
-                        if len(order_depth.buy_orders.keys()) > 1:
-                            bid2 = max([x for x in order_depth.buy_orders.keys() if x < best_bid])
-                            if best_bid - bid2 > 2:
-                                # weighted average of bid1 and bid2
-                                # acceptable_price = (best_bid * order_depth.buy_orders[best_bid] + bid2 * order_depth.buy_orders[bid2]) / (order_depth.buy_orders[best_bid] + order_depth.buy_orders[bid2])
-                                # acceptable_price = (acceptable_price + best_ask) // 2
-                                # if best_bid > acceptable_price:
-                                best_bid_volume = min(order_depth.buy_orders[best_bid], 20 + position)
-                                orders.append(Order(product, best_bid, -best_bid_volume))
-
-                        if len(order_depth.sell_orders.keys()) > 1:
-                            ask2 = min([x for x in order_depth.sell_orders.keys() if x > best_ask])
-                            if ask2 - best_ask > 2:
-                                # weighted average of ask1 and ask2
-                                # acceptable_price = (best_ask * order_depth.sell_orders[best_ask] + ask2 * order_depth.sell_orders[ask2]) / (order_depth.sell_orders[best_ask] + order_depth.sell_orders[ask2])
-                                # acceptable_price = (acceptable_price + best_bid) // 2
-                                # if best_ask < acceptable_price:
-                                best_ask_volume = min(-order_depth.sell_orders[best_ask], 20 - position)
-                                # we buy
-                                orders.append(Order(product, best_ask, best_ask_volume))
-                result[product] = orders
-
-            if product == 'PEARLS':
-                if 'PEARLS' in state.position.keys():
-                    position = state.position[product]
-                else:
-                    position = 0
-
-                order_depth: OrderDepth = state.order_depths[product]
-                orders: list[Order] = []
-                acceptable_price = 10000
-
-                if len(order_depth.sell_orders) > 0:
-
-                    # Sort all the available sell orders by their price,
-                    # and select only the sell order with the lowest price
-                    best_ask = min(order_depth.sell_orders.keys())
-                    best_ask_volume = min(-order_depth.sell_orders[best_ask], 20 - position)
-
-                    if best_ask < acceptable_price:
-                        # In case the lowest ask is lower than our fair value,
-                        # This presents an opportunity for us to buy cheaply
-                        # The code below therefore sends a BUY order at the price level of the ask,
-                        # with the same quantity
-                        # We expect this order to trade with the sell order
-                        print("BUY", str(-best_ask_volume) + "x", best_ask)
-                        orders.append(Order(product, best_ask, best_ask_volume))
-
-                if len(order_depth.buy_orders) > 0:
-                    best_bid = max(order_depth.buy_orders.keys())
-                    best_bid_volume = min(order_depth.buy_orders[best_bid], 20 + position)
-                    if best_bid > acceptable_price:
-                        print("SELL", str(best_bid_volume) + "x", best_bid)
-                        orders.append(Order(product, best_bid, -best_bid_volume))
-                # Add all the above the orders to the result dict
-                result[product] = orders
-                orders = []
-                # Return the dict of orders
-                # These possibly contain buy or sell orders for PEARLS
-                # Depending on the logic above
-
-        # Round 4 code starts here
-        if (
-                ('BAGUETTE' in state.order_depths.keys()) and
-                ('DIP' in state.order_depths.keys()) and
-                ('UKULELE' in state.order_depths.keys()) and
-                ('PICNIC_BASKET' in state.order_depths.keys())
-        ):
-            BAG_order_depth = state.order_depths['BAGUETTE']
-            DIP_order_depth = state.order_depths['DIP']
-            UKU_order_depth = state.order_depths['UKULELE']
-            PIC_order_depth = state.order_depths['PICNIC_BASKET']
-            if 'PICNIC_BASKET' in state.position.keys():
-                pic_position = state.position['PICNIC_BASKET']
-            else:
-                pic_position = 0
-
-            acceptable_buy = 370 - (0.3 * (pic_position) // 1)
-            acceptable_sell = 430 - (0.3 * (pic_position) // 1)
-
-            # buy basket
-            if (
-                    (len(BAG_order_depth.buy_orders) > 0) and
-                    (len(DIP_order_depth.buy_orders) > 0) and
-                    (len(UKU_order_depth.buy_orders) > 0) and
-                    (len(PIC_order_depth.sell_orders) > 0)
-            ):
-                best_pic_ask = min(PIC_order_depth.sell_orders.keys())
-                best_pic_ask_volume = PIC_order_depth.sell_orders[best_pic_ask]
-                best_bag_bid = max(BAG_order_depth.buy_orders.keys())
-                best_bag_bid_volume = BAG_order_depth.buy_orders[best_bag_bid]
-                best_dip_bid = max(DIP_order_depth.buy_orders.keys())
-                best_dip_bid_volume = DIP_order_depth.buy_orders[best_dip_bid]
-                best_uku_bid = max(UKU_order_depth.buy_orders.keys())
-                best_uku_bid_volume = UKU_order_depth.buy_orders[best_uku_bid]
-                # volume to trade (positive)
-                volume_market = min(best_bag_bid_volume // 2, best_dip_bid_volume // 4, best_uku_bid_volume,
-                                    -best_pic_ask_volume)
-                volume_max = 70 - pic_position
-
-                basket_price = best_pic_ask - best_dip_bid * 4 - best_bag_bid * 2 - best_uku_bid
-
-                trade_volume = min(volume_max * (400 - basket_price) / 200, volume_max) // 1
-
-                if basket_price < acceptable_buy:
-                    result['PICNIC_BASKET'] = [Order('PICNIC_BASKET', best_pic_ask, trade_volume)]
-                    result['BAGUETTE'] = [Order('BAGUETTE', best_bag_bid, (-trade_volume) * 2)]
-                    result['DIP'] = [Order('DIP', best_dip_bid, (-trade_volume) * 4)]
-                    result['UKULELE'] = [Order('UKULELE', best_uku_bid, (-trade_volume))]
-
-            # sell basket
-            if (
-                    (len(BAG_order_depth.sell_orders) > 0) and
-                    (len(DIP_order_depth.sell_orders) > 0) and
-                    (len(UKU_order_depth.sell_orders) > 0) and
-                    (len(PIC_order_depth.buy_orders) > 0)
-            ):
-                best_pic_bid = max(PIC_order_depth.buy_orders.keys())
-                best_pic_bid_volume = PIC_order_depth.buy_orders[best_pic_bid]
-                best_bag_ask = min(BAG_order_depth.sell_orders.keys())
-                best_bag_ask_volume = BAG_order_depth.sell_orders[best_bag_ask]
-                best_dip_ask = min(DIP_order_depth.sell_orders.keys())
-                best_dip_ask_volume = DIP_order_depth.sell_orders[best_dip_ask]
-                best_uku_ask = min(UKU_order_depth.sell_orders.keys())
-                best_uku_ask_volume = UKU_order_depth.sell_orders[best_uku_ask]
-                # volume to trade (positive)
-                volume_market = min((-best_bag_ask_volume) // 2, (-best_dip_ask_volume) // 4, -best_uku_ask_volume,
-                                    best_pic_bid_volume)
-                volume_max = 70 + pic_position
-
-                basket_price = best_pic_bid - best_dip_ask * 4 - best_bag_ask * 2 - best_uku_ask
-
-                trade_volume = min(volume_max * (basket_price - 400) / 200, volume_max) // 1
-
-                if basket_price > acceptable_sell:
-                    result['PICNIC_BASKET'] = [Order('PICNIC_BASKET', best_pic_bid, -trade_volume)]
-                    result['BAGUETTE'] = [Order('BAGUETTE', best_bag_ask, trade_volume * 2)]
-                    result['DIP'] = [Order('DIP', best_dip_ask, trade_volume * 4)]
-                    result['UKULELE'] = [Order('UKULELE', best_uku_ask, trade_volume)]
-
-                    # coconut & pina colada pair trading starts here
-        if (
-                ('COCONUTS' in state.order_depths.keys()) and
-                ('PINA_COLADAS' in state.order_depths.keys())
-        ):
-
-            coco_order_depth = state.order_depths['COCONUTS']
-            pc_order_depth = state.order_depths['PINA_COLADAS']
-
-            if 'COCONUTS' in state.position.keys():
-                coco_position = state.position['COCONUTS']
-            else:
-                coco_position = 0
-
-            if 'PINA_COLADAS' in state.position.keys():
-                pc_position = state.position['PINA_COLADAS']
-            else:
-                pc_position = 0
-
-            coco_max_position = 600
-            pc_max_position = 300
-
-            # coco_acceptable_price = 8000
-            # pc_acceptable_price = 15000
-
-            if (len(coco_order_depth.sell_orders) > 0 and
-                len(coco_order_depth.buy_orders) > 0 and
-                len(pc_order_depth.sell_orders) > 0 and
-                len(pc_order_depth.buy_orders) > 0):
-
-                coco_best_ask = min(coco_order_depth.sell_orders.keys())
-                coco_best_bid = max(coco_order_depth.buy_orders.keys())
-                pc_best_ask = min(pc_order_depth.sell_orders.keys())
-                pc_best_bid = max(pc_order_depth.buy_orders.keys())
-                coco_mid_price = (coco_best_ask + coco_best_bid) / 2
-                pc_mid_price = (pc_best_ask + pc_best_bid) / 2
-
-                # use fading to determine the fair price
-                coco_fair_price = (coco_mid_price + pc_mid_price / 15 * 8) / 2
-                pc_fair_price = (pc_mid_price + coco_mid_price * 15 / 8) / 2
-
-                # sell coco if above the fair price
-                if coco_best_bid > coco_fair_price:
-                    # obtain the max number of coco that can be sold given the max position
-                    volume_max = coco_max_position + coco_position
-                    coco_sell_quantity = min(volume_max, coco_order_depth.buy_orders[coco_best_bid])
-                    result['COCONUTS'] = [Order('COCONUTS', coco_best_bid, - coco_sell_quantity)]
-
-                if coco_best_ask < coco_fair_price:
-                    # obtain the max number of coco that can be bought given the max position
-                    volume_max = coco_max_position - coco_position
-                    coco_buy_quantity = min(volume_max, - coco_order_depth.sell_orders[coco_best_ask])
-                    result['COCONUTS'] = [Order('COCONUTS', coco_best_ask, coco_buy_quantity)]
-
-                if pc_best_bid > pc_fair_price:
-                    # obtain the max number of pc that can be sold given the max position
-                    volume_max = pc_max_position + pc_position
-                    pc_sell_quantity = min(volume_max, pc_order_depth.buy_orders[pc_best_bid])
-                    result['PINA_COLADAS'] = [Order('PINA_COLADAS', pc_best_bid, - pc_sell_quantity)]
-
-                if pc_best_ask < pc_fair_price:
-                    # obtain the max number of pc that can be bought given the max position
-                    volume_max = pc_max_position - pc_position
-                    pc_buy_quantity = min(volume_max, - pc_order_depth.sell_orders[pc_best_ask])
-                    result['PINA_COLADAS'] = [Order('PINA_COLADAS', pc_best_ask, pc_buy_quantity)]
-
+        # only the strategies whose products are all listed this tick
+        for strategy in strategies.plan(state.order_depths):
+            if self.watchdog.allow(strategy.name):
+                with self.watchdog.guard(strategy.name, result), self.profiler.block(strategy.name):
+                    strategy.fn(self, state, result)
+
+        profile = self.profiler.end_tick(state.timestamp)
+        if profile is not None:
+            logger.print(profile)
+        watchdog = self.watchdog.end_tick(state.timestamp)
+        if watchdog is not None:
+            logger.print(watchdog)
         logger.flush(state, result)
-        return result
\ No newline at end of file
+        return result
@@ -0,0 +1,192 @@
+"""
+Streaming reader for the .log files the sandbox produces. A log has three
+sections:
+
+    Sandbox logs:       one "<timestamp> {json}" line per tick, printed by Logger.flush
+    Submission logs:    everything else the Trader printed, and Lambda errors
+    Activities log:     the order book / PnL csv of the day
+
+Everything here is a generator reading one line at a time, so memory stays
+constant however long the log is. Ticks written by any Logger are turned back
+into datamodel.TradingState: the full-state format is read as is, the
+compressed format ({"t", "l", "od", "ot", "mt", "p", "o"}) is expanded and
+delta states are decoded with logger.StateDecoder on the way. Lines that are
+not a complete tick (truncated output, Lambda END / REPORT lines) are skipped.
+
+    python sandboxlog.py <sandbox.log>
+"""
+import json
+import sys
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+from datamodel import Listing, Order, OrderDepth, Symbol, Trade, TradingState
+
+SANDBOX = "Sandbox logs"
+SUBMISSION = "Submission logs"
+ACTIVITIES = "Activities log"
+
+_HEADERS = {SANDBOX + ":\n": SANDBOX, SUBMISSION + ":\n": SUBMISSION, ACTIVITIES + ":\n": ACTIVITIES}
+
+
+class LogTick(NamedTuple):
+    timestamp: int
+    state: TradingState
+    orders: Dict[Symbol, List[Order]]
+    logs: str
+
+
+def sections(path: str) -> Iterator[Tuple[str, str]]:
+    """(section, line) for every non-empty line of the log, without the trailing newline."""
+    section = None
+    with open(path) as f:
+        for line in f:
+            header = _HEADERS.get(line)
+            if header is not None:
+                section = header
+                continue
+            if section is not None and line != "\n":
+                yield section, line.rstrip("\n")
+
+
+def raw_ticks(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    The {"state", "orders", "logs"} payload of every tick in the Sandbox logs
+    section, as parsed from JSON. Delta states come back decoded, as the
+    compressed state they stand for.
+    """
+    from logger import StateDecoder
+
+    decoder = StateDecoder()
+    with open(path) as f:
+        if f.readline() != SANDBOX + ":\n":
+            return
+        for line in f:
+            if line.startswith(SUBMISSION):
+                return
+            _, _, payload = line.partition(" ")
+            if not payload.startswith("{"):
+                continue
+            try:
+                raw = json.loads(payload)
+            except ValueError:
+                continue
+            state = raw.get("state") if type(raw) is dict else None
+            if type(state) is not dict:
+                continue
+            if "t" in state:
+                raw["state"] = decoder.decode(state)
+            yield raw
+
+
+def ticks(path: str) -> Iterator[LogTick]:
+    """Every tick of the Sandbox logs section as TradingState and orders."""
+    for raw in raw_ticks(path):
+        state = to_trading_state(raw["state"])
+        yield LogTick(state.timestamp, state, to_orders(raw["orders"]), raw["logs"])
+
+
+def submission_logs(path: str) -> Iterator[str]:
+    for section, line in sections(path):
+        if section == SUBMISSION:
+            yield line
+
+
+def activities(path: str) -> Iterator[Dict[str, str]]:
+    """Rows of the Activities log keyed by the csv header; empty cells are empty strings."""
+    header = None
+    for section, line in sections(path):
+        if section != ACTIVITIES:
+            continue
+        if header is None:
+            header = line.split(";")
+            continue
+        yield dict(zip(header, line.split(";")))
+
+
+def _levels(levels: Dict[str, int]) -> Dict[int, int]:
+    return {int(price): volume for price, volume in levels.items()}
+
+
+def _trades_by_symbol(rows: List[List[Any]]) -> Dict[Symbol, List[Trade]]:
+    trades: Dict[Symbol, List[Trade]] = {}
+    for symbol, buyer, seller, price, quantity, timestamp in rows:
+        trade = Trade(symbol, price, quantity, buyer, seller, timestamp)
+        arr = trades.get(symbol)
+        if arr is None:
+            trades[symbol] = [trade]
+        else:
+            arr.append(trade)
+    return trades
+
+
+def _trades(raw: Dict[Symbol, List[dict]]) -> Dict[Symbol, List[Trade]]:
+    return {symbol: [Trade(t["symbol"], t["price"], t["quantity"], t["buyer"], t["seller"], t["timestamp"])
+                     for t in arr]
+            for symbol, arr in raw.items()}
+
+
+def to_trading_state(state: Dict[str, Any]) -> TradingState:
+    """TradingState of a logged state in either the full or the compressed format."""
+    order_depths = {}
+    if "t" in state:
+        for symbol, (buy_orders, sell_orders) in state["od"].items():
+            order_depth = OrderDepth()
+            order_depth.buy_orders = _levels(buy_orders)
+            order_depth.sell_orders = _levels(sell_orders)
+            order_depths[symbol] = order_depth
+        return TradingState(
+            state["t"],
+            {symbol: Listing(symbol, product, denomination) for symbol, product, denomination in state["l"]},
+            order_depths,
+            _trades_by_symbol(state["ot"]),
+            _trades_by_symbol(state["mt"]),
+            dict(state["p"]),
+            dict(state["o"]),
+        )
+
+    for symbol, depth in state["order_depths"].items():
+        order_depth = OrderDepth()
+        order_depth.buy_orders = _levels(depth["buy_orders"])
+        order_depth.sell_orders = _levels(depth["sell_orders"])
+        order_depths[symbol] = order_depth
+    return TradingState(
+        state["timestamp"],
+        {symbol: Listing(l["symbol"], l["product"], l["denomination"]) for symbol, l in state["listings"].items()},
+        order_depths,
+        _trades(state["own_trades"]),
+        _trades(state["market_trades"]),
+        state["position"],
+        state["observations"],
+    )
+
+
+def to_orders(orders) -> Dict[Symbol, List[Order]]:
+    """Orders of a logged tick, either {symbol: [order, ...]} or [[symbol, price, quantity], ...]."""
+    if isinstance(orders, dict):
+        return {symbol: [Order(o["symbol"], o["price"], o["quantity"]) for o in arr]
+                for symbol, arr in orders.items()}
+    result: Dict[Symbol, List[Order]] = {}
+    for symbol, price, quantity in orders:
+        result.setdefault(symbol, []).append(Order(symbol, price, quantity))
+    return result
+
+
+def main(argv: List[str]) -> None:
+    if len(argv) != 2:
+        print(__doc__.strip().splitlines()[-1].strip())
+        raise SystemExit(2)
+    path = argv[1]
+    count = 0
+    first = last = None
+    for tick in ticks(path):
+        if first is None:
+            first = tick.timestamp
+        last = tick.timestamp
+        count += 1
+    submission = sum(1 for _ in submission_logs(path))
+    rows = sum(1 for _ in activities(path))
+    print(f"{path}: {count} ticks ({first} - {last}), {submission} submission log lines, {rows} activity rows")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
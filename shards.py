@@ -0,0 +1,183 @@
+"""
+Sharded backtests: every available day, split into independent product groups,
+replayed in parallel on a process pool and merged into one PnL report per day
+and per product.
+
+A shard is one day restricted to one group of GROUPS (MarketDay.restrict): the
+strategies trade the basket, the coconut / pina colada pair and the single
+products independently, and position limits are per product, so replaying the
+groups apart gives the same fills as replaying the whole day, in smaller tasks
+that spread evenly over the cores. A strategy whose decisions couple groups
+should be run with groups=None.
+
+Days come from the Activities logs of the sandbox logs; the island-data-bottle
+trades of the same day are added as market trades. The trade csvs carry no
+order books, so their other days (0 - 2) cannot be replayed on their own.
+
+    python shards.py <strategy.py> [sandbox.log ...] [--processes N] [--whole-days]
+"""
+import argparse
+import glob
+import multiprocessing
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from backtest import ROOT, BacktestResult, MarketDay, load_strategy, run
+from datamodel import Product, Symbol
+
+GROUPS: Dict[str, Sequence[Symbol]] = {
+    "basket": ("BAGUETTE", "DIP", "UKULELE", "PICNIC_BASKET"),
+    "pair": ("COCONUTS", "PINA_COLADAS"),
+    "PEARLS": ("PEARLS",),
+    "BANANAS": ("BANANAS",),
+    "BERRIES": ("BERRIES",),
+    "DIVING_GEAR": ("DIVING_GEAR",),
+}
+
+_markets: List[MarketDay] = []
+_trader_class = None
+_params: dict = {}
+
+
+def default_logs() -> List[str]:
+    return sorted(glob.glob(os.path.join(ROOT, "*.log")))
+
+
+def make_shards(markets: List[MarketDay], groups: Optional[Dict[str, Sequence[Symbol]]]) -> List[Tuple[int, str]]:
+    """(market index, group name) of every shard with at least one symbol; "all" for whole days."""
+    if groups is None:
+        return [(i, "all") for i in range(len(markets))]
+    shards = []
+    for i, market in enumerate(markets):
+        for name, symbols in groups.items():
+            if set(symbols) & set(market.symbols):
+                shards.append((i, name))
+        rest = set(market.symbols).difference(*groups.values())
+        if rest:
+            shards.append((i, "other"))
+    # longest first, so the last tasks to start are the short ones
+    return sorted(shards, key=lambda shard: -len(markets[shard[0]]))
+
+
+def _symbols(market: MarketDay, group: str, groups: Optional[Dict[str, Sequence[Symbol]]]) -> List[Symbol]:
+    if group == "all":
+        return market.symbols
+    if group == "other":
+        return sorted(set(market.symbols).difference(*groups.values()))
+    return list(groups[group])
+
+
+def _init(strategy_path: str, markets: List[MarketDay], params: dict) -> None:
+    global _markets, _trader_class, _params
+    _markets = markets
+    _trader_class = load_strategy(strategy_path).Trader
+    _params = params
+
+
+def _run_shard(task: Tuple[int, str, List[Symbol]]) -> Tuple[int, str, Optional[BacktestResult], str]:
+    i, group, symbols = task
+    market = _markets[i] if group == "all" else _markets[i].restrict(symbols)
+    try:
+        return i, group, run(_trader_class(**_params), market), ""
+    except Exception as e:
+        return i, group, None, type(e).__name__ + ": " + str(e)
+
+
+class ShardReport:
+    """
+    pnl[(source, day)][product] is the final PnL of every product of every day;
+    errors lists the shards whose strategy raised.
+    """
+
+    def __init__(self) -> None:
+        self.pnl: Dict[Tuple[str, int], Dict[Product, float]] = {}
+        self.fills: Dict[Tuple[str, int], int] = {}
+        self.errors: List[str] = []
+        self.wall_seconds = 0.0
+        self.shard_seconds = 0.0
+
+    def add(self, market: MarketDay, group: str, result: Optional[BacktestResult], error: str) -> None:
+        key = (market.source, market.day)
+        day_pnl = self.pnl.setdefault(key, {})
+        if result is None:
+            self.errors.append(f"{market.source} day {market.day} {group}: {error}")
+            return
+        for product, pnl in result.final_pnl().items():
+            if product in market.symbols:
+                day_pnl[product] = day_pnl.get(product, 0.0) + pnl
+        self.fills[key] = self.fills.get(key, 0) + len(result.trades)
+        self.shard_seconds += result.seconds
+
+    def products(self) -> List[Product]:
+        return sorted({product for day_pnl in self.pnl.values() for product, pnl in day_pnl.items() if pnl})
+
+    def total(self) -> float:
+        return sum(sum(day_pnl.values()) for day_pnl in self.pnl.values())
+
+    def format(self) -> str:
+        products = self.products()
+        width = max([len(product) for product in products] + [9])
+        lines = [f"{'day':30s}" + "".join(f"{product:>{width + 1}s}" for product in products) + f"{'total':>12s}"]
+        for (source, day), day_pnl in sorted(self.pnl.items(), key=lambda item: (item[0][1], item[0][0])):
+            lines.append(f"{str(day) + ' ' + source[:26]:30s}"
+                         + "".join(f"{day_pnl.get(product, 0.0):{width + 1}.1f}" for product in products)
+                         + f"{sum(day_pnl.values()):12.1f}")
+        lines.append(f"{'all days':30s}"
+                     + "".join(f"{sum(p.get(product, 0.0) for p in self.pnl.values()):{width + 1}.1f}"
+                               for product in products)
+                     + f"{self.total():12.1f}")
+        lines.extend("failed: " + error for error in self.errors)
+        return "\n".join(lines)
+
+
+def run_sharded(strategy_path: str, markets: List[MarketDay],
+                groups: Optional[Dict[str, Sequence[Symbol]]] = GROUPS, processes: Optional[int] = None,
+                params: Optional[dict] = None) -> ShardReport:
+    """Replay every shard of markets on a process pool and merge the results."""
+    params = params or {}
+    shards = make_shards(markets, groups)
+    tasks = [(i, group, _symbols(markets[i], group, groups)) for i, group in shards]
+    processes = min(processes or os.cpu_count() or 1, len(tasks)) or 1
+
+    report = ShardReport()
+    start = time.perf_counter()
+    if processes == 1:
+        _init(strategy_path, markets, params)
+        results = map(_run_shard, tasks)
+        for i, group, result, error in results:
+            report.add(markets[i], group, result, error)
+    else:
+        context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+        with context.Pool(processes, _init, (strategy_path, markets, params)) as pool:
+            for i, group, result, error in pool.imap_unordered(_run_shard, tasks):
+                report.add(markets[i], group, result, error)
+    report.wall_seconds = time.perf_counter() - start
+    return report
+
+
+def load_markets(logs: List[str]) -> List[MarketDay]:
+    """MarketDay of every log that has an Activities log, with the trades of its day."""
+    from activities import load_activities
+    from tradedata import load_trades
+
+    trades = load_trades()
+    return [MarketDay.from_log(log, trades) for log in logs if load_activities(log)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backtest a strategy over every day, sharded across cores.")
+    parser.add_argument("strategy")
+    parser.add_argument("logs", nargs="*")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--whole-days", action="store_true", help="one shard per day instead of per product group")
+    args = parser.parse_args()
+
+    markets = load_markets(args.logs or default_logs())
+    report = run_sharded(args.strategy, markets, None if args.whole_days else GROUPS, args.processes)
+    print(report.format())
+    print(f"{len(markets)} days in {report.wall_seconds:.2f}s wall, {report.shard_seconds:.2f}s of replays")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Streaming statistics of a spread, a linear combination of product mid prices
+such as the basket premium (PICNIC_BASKET - 2 BAGUETTE - 4 DIP - UKULELE) or
+PINA_COLADAS - 15 / 8 COCONUTS, for z-score bands instead of fixed price ones.
+
+Both a windowed mean and standard deviation (rolling.RollingWindow over the
+last window spreads) and exponentially weighted ones are kept, updated in O(1)
+time and memory per tick. moments(ew) returns the pair a band is built from,
+and zscore(value, ew) scores any price against it, e.g. the executable premium
+of a basket rather than its mid:
+
+    spread = SpreadStats({"PINA_COLADAS": 1, "COCONUTS": -15 / 8}, window=200)
+    spread.update(state.order_depths)
+    if spread.ready:
+        mean, std = spread.moments(ew=False)
+        z = spread.zscore()
+
+A tick where a book of the combination has no bid or no ask is skipped.
+Without weights there is no combination to read from the books, and values
+computed elsewhere, e.g. the residual of a hedgeratio estimate, are pushed:
+
+    residual = SpreadStats(window=200)
+    residual.push(pc_mid_price - hedge.intercept - hedge.ratio * coco_mid_price)
+"""
+import math
+from typing import Mapping, Optional, Tuple
+
+from datamodel import OrderDepth, Symbol
+from rolling import RollingWindow
+
+# band kinds of the strategies: fixed prices, or z-scores over the window or exponentially weighted
+BANDS = ("fixed", "window", "ew")
+
+
+class SpreadStats:
+    def __init__(self, weights: Optional[Mapping[Symbol, float]] = None, window: int = 200,
+                 ew_alpha: Optional[float] = None) -> None:
+        self.weights = tuple(weights.items()) if weights else ()
+        self.window = RollingWindow(window, ew_alpha)
+        self.value = math.nan
+        # exponentially weighted mean is the window's EMA; its variance is kept here
+        self._ew_variance = 0.0
+
+    @property
+    def ready(self) -> bool:
+        """Whether the window is full, so both statistics cover window spreads."""
+        return self.window.full
+
+    def spread(self, order_depths: Mapping[Symbol, OrderDepth]) -> Optional[float]:
+        """The spread of the mid prices, None if a book is missing a side or there are no weights."""
+        if not self.weights:
+            return None
+        spread = 0.0
+        for symbol, weight in self.weights:
+            order_depth = order_depths.get(symbol)
+            if order_depth is None or not order_depth.buy_orders or not order_depth.sell_orders:
+                return None
+            spread += weight * (max(order_depth.buy_orders) + min(order_depth.sell_orders)) / 2
+        return spread
+
+    def push(self, value: float) -> None:
+        window = self.window
+        ema = window.ema
+        window.push(value)
+        if ema is not None:
+            # EW variance around the previous mean: v <- (1 - alpha) * (v + alpha * d^2)
+            delta = value - ema
+            self._ew_variance = (1 - window.alpha) * (self._ew_variance + window.alpha * delta * delta)
+        self.value = value
+
+    def update(self, order_depths: Mapping[Symbol, OrderDepth]) -> Optional[float]:
+        """Push the spread of this tick, if every book has both sides; returns it."""
+        value = self.spread(order_depths)
+        if value is not None:
+            self.push(value)
+        return value
+
+    @property
+    def mean(self) -> float:
+        return self.window.mean
+
+    @property
+    def std(self) -> float:
+        return self.window.std
+
+    @property
+    def ew_mean(self) -> float:
+        ema = self.window.ema
+        return math.nan if ema is None else ema
+
+    @property
+    def ew_std(self) -> float:
+        return math.sqrt(self._ew_variance) if self.window.count else math.nan
+
+    def moments(self, ew: bool = False) -> Tuple[float, float]:
+        """(mean, standard deviation), exponentially weighted or over the window."""
+        if ew:
+            return self.ew_mean, self.ew_std
+        return self.mean, self.std
+
+    def zscore(self, value: Optional[float] = None, ew: bool = False) -> float:
+        """Z-score of value (the latest spread by default); 0 while the spread has not moved."""
+        mean, std = self.moments(ew)
+        if value is None:
+            value = self.value
+        return (value - mean) / std if std > 0 else 0.0
@@ -0,0 +1,156 @@
+"""
+Parameter sweep over the constructor arguments of a strategy's Trader, e.g.
+acceptable_buy / acceptable_sell / position_skew in round5.py or band and the
+sizing divisors in pairtrading.py.
+
+The market days are parsed once in the parent process and handed to the pool
+workers when they start (inherited, not re-read, where processes are forked);
+every task is then one parameter set replayed over every day with
+backtest.run. Results are ranked by total PnL, then by the worst drawdown.
+
+    python sweep.py round5.py acceptable_buy=350,370,390 acceptable_sell=410,430,450
+    python sweep.py pairtrading.py band=2:10 pc_size_divisor=60:120 --random 40 --seed 1
+    options: --logs a.log b.log   --processes N   --top N
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from backtest import DEFAULT_LOG, MarketDay, load_strategy, run
+
+Params = Dict[str, Any]
+
+_strategy_path: Optional[str] = None
+_markets: List[MarketDay] = []
+_trader_class = None
+
+
+class SweepResult:
+    def __init__(self, params: Params, pnl: List[float], drawdown: List[float], seconds: float) -> None:
+        self.params = params
+        self.pnl = pnl
+        self.drawdown = drawdown
+        self.seconds = seconds
+
+    @property
+    def total_pnl(self) -> float:
+        return sum(self.pnl)
+
+    @property
+    def max_drawdown(self) -> float:
+        return max(self.drawdown) if self.drawdown else 0.0
+
+
+def grid(space: Dict[str, Sequence[Any]]) -> List[Params]:
+    """Every combination of the values in space."""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_search(space: Dict[str, Tuple[Any, Any]], n: int, seed: Optional[int] = None) -> List[Params]:
+    """n parameter sets drawn uniformly from the (low, high) range of every name; ints stay ints."""
+    rng = random.Random(seed)
+    draws = []
+    for _ in range(n):
+        params = {}
+        for name, (low, high) in sorted(space.items()):
+            if isinstance(low, int) and isinstance(high, int):
+                params[name] = rng.randint(low, high)
+            else:
+                params[name] = rng.uniform(low, high)
+        draws.append(params)
+    return draws
+
+
+def _init(strategy_path: str, markets: List[MarketDay]) -> None:
+    global _strategy_path, _markets, _trader_class
+    _strategy_path = strategy_path
+    _markets = markets
+    _trader_class = load_strategy(strategy_path).Trader
+
+
+def _evaluate(params: Params) -> SweepResult:
+    start = time.perf_counter()
+    pnl = []
+    drawdown = []
+    for market in _markets:
+        result = run(_trader_class(**params), market)
+        total = result.total
+        pnl.append(float(total[-1]) if len(total) else 0.0)
+        drawdown.append(result.max_drawdown())
+    return SweepResult(params, pnl, drawdown, time.perf_counter() - start)
+
+
+def rank(results: List[SweepResult]) -> List[SweepResult]:
+    return sorted(results, key=lambda result: (-result.total_pnl, result.max_drawdown))
+
+
+def sweep(strategy_path: str, param_sets: List[Params], markets: List[MarketDay],
+          processes: Optional[int] = None) -> List[SweepResult]:
+    """Replay every parameter set over markets on a process pool and return the results ranked."""
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(param_sets) == 1:
+        _init(strategy_path, markets)
+        return rank([_evaluate(params) for params in param_sets])
+    context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+    with context.Pool(min(processes, len(param_sets)), _init, (strategy_path, markets)) as pool:
+        return rank(pool.map(_evaluate, param_sets, chunksize=1))
+
+
+def _value(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_space(args: List[str], ranges: bool) -> Dict[str, Any]:
+    """name=v1,v2,... for a grid, name=low:high for a random search."""
+    space = {}
+    for arg in args:
+        name, _, values = arg.partition("=")
+        if ranges:
+            low, _, high = values.partition(":")
+            space[name] = (_value(low), _value(high))
+        else:
+            space[name] = [_value(value) for value in values.split(",")]
+    return space
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parameter sweep of a strategy's Trader arguments.")
+    parser.add_argument("strategy")
+    parser.add_argument("params", nargs="+", help="name=v1,v2,... (grid) or name=low:high (--random)")
+    parser.add_argument("--logs", nargs="+", default=[DEFAULT_LOG])
+    parser.add_argument("--random", type=int, default=0, metavar="N", help="N random draws instead of a grid")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    from tradedata import load_trades
+
+    trades = load_trades()
+    markets = [MarketDay.from_log(log, trades) for log in args.logs]
+    if args.random:
+        param_sets = random_search(parse_space(args.params, True), args.random, args.seed)
+    else:
+        param_sets = grid(parse_space(args.params, False))
+
+    start = time.perf_counter()
+    results = sweep(args.strategy, param_sets, markets, args.processes)
+    elapsed = time.perf_counter() - start
+    print(f"{len(param_sets)} parameter sets x {len(markets)} days in {elapsed:.1f}s "
+          f"({sum(result.seconds for result in results):.1f}s of replays)")
+    for result in results[:args.top]:
+        params = " ".join(f"{name}={value:.4g}" if isinstance(value, float) else f"{name}={value}"
+                          for name, value in result.params.items())
+        print(f"PnL {result.total_pnl:10.1f}  drawdown {result.max_drawdown:9.1f}  {params}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+The bundled strategies import and trade with nothing but the exchange's own
+datamodel (tests/exchange/datamodel.py, plain dicts) on the path, and place
+the same orders as the unbundled strategies do in the repository.
+"""
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtest import DEFAULT_LOG, load_trader  # noqa: E402
+from bundle import bundle  # noqa: E402
+from sandboxlog import raw_ticks, to_trading_state  # noqa: E402
+
+EXCHANGE = os.path.join(ROOT, "tests", "exchange")
+TICKS = 30
+
+# Runs in a fresh isolated interpreter (no script directory, PYTHONPATH or user site) that only
+# has the bundle directory on its path; the states are built the way the exchange builds them.
+_CHILD = """
+import importlib, json, sys
+directory, module, params, states, out = sys.argv[1:6]
+sys.path.insert(0, directory)
+from datamodel import Listing, OrderDepth, Trade, TradingState
+
+def trades(raw):
+    return {symbol: [Trade(t["symbol"], t["price"], t["quantity"], t["buyer"], t["seller"], t["timestamp"])
+                     for t in arr] for symbol, arr in raw.items()}
+
+trader = importlib.import_module(module).Trader(**json.loads(params))
+orders = []
+with open(states) as f:
+    for state in json.load(f):
+        order_depths = {}
+        for symbol, depth in state["order_depths"].items():
+            order_depths[symbol] = OrderDepth()
+            order_depths[symbol].buy_orders = {int(p): v for p, v in depth["buy_orders"].items()}
+            order_depths[symbol].sell_orders = {int(p): v for p, v in depth["sell_orders"].items()}
+        listings = {symbol: Listing(l["symbol"], l["product"], l["denomination"])
+                    for symbol, l in state["listings"].items()}
+        result = trader.run(TradingState(state["timestamp"], listings, order_depths, trades(state["own_trades"]),
+                                         trades(state["market_trades"]), state["position"], state["observations"]))
+        orders.append([[o.symbol, o.price, o.quantity] for arr in result.values() for o in arr])
+assert "bundle" not in sys.modules and "logger" not in sys.modules
+with open(out, "w") as f:
+    json.dump(orders, f)
+"""
+
+
+def _orders(result):
+    return [[o.symbol, o.price, o.quantity] for arr in result.values() for o in arr]
+
+
+@pytest.mark.parametrize("strategy, params", [
+    ("round5.py", {"time_budget_ms": None}),
+    ("pairtrading.py", {}),
+])
+def test_bundle_runs_on_exchange_datamodel(tmp_path, strategy, params):
+    source, names = bundle(os.path.join(ROOT, strategy))
+    assert names[-1] == strategy and len(names) > 1
+    module = os.path.splitext(strategy)[0]
+    (tmp_path / strategy).write_text(source)
+    shutil.copy(os.path.join(EXCHANGE, "datamodel.py"), tmp_path / "datamodel.py")
+
+    states = [raw["state"] for raw in itertools.islice(raw_ticks(DEFAULT_LOG), TICKS)]
+    (tmp_path / "states.json").write_text(json.dumps(states))
+    out = tmp_path / "orders.json"
+    subprocess.run([sys.executable, "-I", "-c", _CHILD, str(tmp_path), module, json.dumps(params),
+                    str(tmp_path / "states.json"), str(out)],
+                   check=True, cwd=tmp_path, stdout=subprocess.DEVNULL)
+
+    trader = load_trader(os.path.join(ROOT, strategy), **params)
+    expected = [_orders(trader.run(to_trading_state(state)) or {}) for state in states]
+    assert json.loads(out.read_text()) == expected
+
+
+def test_bundle_rejects_name_collisions(tmp_path, monkeypatch):
+    import bundle as bundler
+
+    (tmp_path / "first.py").write_text("def helper():\n    return 1\n")
+    (tmp_path / "second.py").write_text("def helper():\n    return 2\n")
+    (tmp_path / "strategy.py").write_text("from first import helper\nfrom second import helper as other\n")
+    monkeypatch.setattr(bundler, "ROOT", str(tmp_path))
+    with pytest.raises(ValueError, match="helper is bound in both first.py and second.py"):
+        bundler.bundle(str(tmp_path / "strategy.py"))
@@ -0,0 +1,57 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from datamodel import Order  # noqa: E402
+from matching import SUBMISSION, MatchingEngine  # noqa: E402
+
+# bids and asks best first, ask volumes negative; deep enough to fill anything below the limit
+BOOK = {"PEARLS": ([(9998, 30), (9996, 30)], [(10002, -30), (10004, -30)])}
+
+
+def fills(trades):
+    return [(trade.price, trade.quantity if trade.buyer == SUBMISSION else -trade.quantity) for trade in trades]
+
+
+def test_a_set_over_the_limit_on_one_side_is_rejected_as_a_whole():
+    engine = MatchingEngine({"PEARLS": 20})
+    engine.position["PEARLS"] = 5
+    # 5 + 10 + 6 = 21 > 20: the first buy alone would fit, but nothing trades
+    orders = {"PEARLS": [Order("PEARLS", 10002, 10), Order("PEARLS", 10004, 6)]}
+    assert engine.match(orders, BOOK, 100) == []
+    assert engine.position["PEARLS"] == 5
+    assert engine.rejected == {"PEARLS": 1}
+
+
+def test_a_set_exactly_at_the_limit_passes():
+    engine = MatchingEngine({"PEARLS": 20})
+    engine.position["PEARLS"] = -5
+    # -5 + 25 = 20 on the buy side and -5 - 15 = -20 on the sell side, both exactly at the limit
+    orders = {"PEARLS": [Order("PEARLS", 10004, 25), Order("PEARLS", 9996, -15)]}
+    assert fills(engine.match(orders, BOOK, 100)) == [(10002, 25), (9998, -15)]
+    assert engine.position["PEARLS"] == 5
+    assert engine.rejected == {}
+
+
+def test_buys_and_sells_are_checked_independently():
+    engine = MatchingEngine({"PEARLS": 20})
+    # net 0, but the buys alone reach 25 > 20
+    orders = {"PEARLS": [Order("PEARLS", 10002, 25), Order("PEARLS", 9998, -25)]}
+    assert engine.match(orders, BOOK, 100) == []
+    assert engine.rejected == {"PEARLS": 1}
+
+    # 20 of buys and 20 of sells each fit, though together they move 40
+    orders = {"PEARLS": [Order("PEARLS", 10002, 20), Order("PEARLS", 9998, -20)]}
+    assert fills(engine.match(orders, BOOK, 200)) == [(10002, 20), (9998, -20)]
+    assert engine.position["PEARLS"] == 0
+
+
+def test_a_rejected_product_does_not_reject_the_others():
+    engine = MatchingEngine({"PEARLS": 20, "BANANAS": 20})
+    books = dict(BOOK, BANANAS=([(4998, 10)], [(5002, -10)]))
+    orders = {"PEARLS": [Order("PEARLS", 10002, 21)], "BANANAS": [Order("BANANAS", 5002, 4)]}
+    assert fills(engine.match(orders, books, 100)) == [(5002, 4)]
+    assert engine.position == {"BANANAS": 4}
+    assert engine.rejected == {"PEARLS": 1}
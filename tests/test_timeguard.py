@@ -0,0 +1,70 @@
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from datamodel import Order  # noqa: E402
+from timeguard import Watchdog  # noqa: E402
+
+
+def test_guard_restores_result_when_the_block_raises():
+    watchdog = Watchdog()
+    watchdog.start()
+    result = {"BERRIES": [Order("BERRIES", 3900, 5)]}
+    with watchdog.guard("basket", result):
+        result["PICNIC_BASKET"] = [Order("PICNIC_BASKET", 73000, 2)]
+        result["BERRIES"].append(Order("BERRIES", 3901, 1))
+        raise ValueError("second leg")
+
+    assert list(result) == ["BERRIES"]
+    assert [(order.price, order.quantity) for order in result["BERRIES"]] == [(3900, 5)]
+    assert watchdog.errors == {"basket": 1}
+    line = watchdog.end_tick(100)
+    assert json.loads(line[len("watchdog "):])["errors"] == ["basket: ValueError: second leg"]
+
+
+def test_guard_keeps_the_orders_of_a_clean_block():
+    watchdog = Watchdog()
+    watchdog.start()
+    result = {}
+    with watchdog.guard("pair", result):
+        result["COCONUTS"] = [Order("COCONUTS", 8000, -10)]
+    assert list(result) == ["COCONUTS"]
+    assert watchdog.errors == {}
+
+
+def test_allow_drops_a_block_over_its_cutoff():
+    watchdog = Watchdog(500, cutoffs={"basket": 0.6})
+    # the basket usually takes 400 ms, past its 300 ms share; the pair has the whole budget
+    watchdog.estimates.update({"basket": 0.4, "pair": 0.4})
+    watchdog.start()
+    assert not watchdog.allow("basket")
+    assert watchdog.allow("pair")
+    assert watchdog.dropped == {"basket": 1}
+    line = watchdog.end_tick(200)
+    assert json.loads(line[len("watchdog "):])["dropped"] == ["basket"]
+
+
+def test_allow_without_a_budget_never_drops():
+    watchdog = Watchdog(None, cutoffs={"basket": 0.6})
+    watchdog.estimates["basket"] = 10.0
+    watchdog.start()
+    assert watchdog.allow("basket")
+    assert watchdog.dropped == {}
+
+
+def test_end_tick_is_none_on_a_clean_tick():
+    watchdog = Watchdog()
+    watchdog.start()
+    assert watchdog.allow("basket")
+    with watchdog.guard("basket", {}):
+        pass
+    assert watchdog.end_tick(300) is None
+    # and the next tick starts clean after one with an error
+    with watchdog.guard("basket", {}):
+        raise KeyError("DIP")
+    assert watchdog.end_tick(400) is not None
+    watchdog.start()
+    assert watchdog.end_tick(500) is None
@@ -0,0 +1,57 @@
+"""
+Fixed-capacity per-product tick history backed by NumPy arrays.
+
+Every column is one float64 array of twice the capacity, and each append
+writes the row twice, at i and i + capacity. The latest n rows are therefore
+always contiguous, so window(column, n) is a slice (a view, no copy) whatever
+the position of the ring, and indicators can run NumPy on it directly. Appends
+are O(1), and memory is 2 * capacity * columns * 8 bytes however long the
+run is. Only numbers are stored, never the TradingState.
+
+    history = TickHistory(3000)
+    history.append(state.timestamp, mid_price, best_bid, best_ask, position)
+    history.window("mid_price", 1000).mean()
+"""
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+COLUMNS = ("timestamp", "mid_price", "best_bid", "best_ask", "position")
+
+
+class TickHistory:
+    def __init__(self, capacity: int, columns: Sequence[str] = COLUMNS) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.columns = tuple(columns)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.columns)}
+        self._data = np.full((len(self.columns), 2 * capacity), np.nan)
+        self._head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, *values: float) -> None:
+        """One row, a value per column in column order."""
+        head = self._head
+        data = self._data
+        data[:, head] = values
+        data[:, head + self.capacity] = values
+        self._head = head + 1 if head + 1 < self.capacity else 0
+        self.count += 1
+
+    def window(self, column: str, n: Optional[int] = None) -> np.ndarray:
+        """Read-only view of the latest n values of column (all that are kept by default), oldest first."""
+        size = len(self)
+        n = size if n is None else min(n, size)
+        end = self._head + self.capacity
+        view = self._data[self.index[column], end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def last(self, column: str) -> float:
+        if not self.count:
+            return np.nan
+        return float(self._data[self.index[column], self._head + self.capacity - 1])
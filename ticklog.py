@@ -0,0 +1,417 @@
+"""
+Binary tick log: one fixed-layout record per tick plus an index footer, so a
+reader can memory-map the file and jump to any timestamp with a binary search
+instead of parsing JSON for every line before it.
+
+Layout (little endian):
+
+    header   b"IMCTICK1"
+    record   u32 body length, i64 timestamp, body
+    body     u16 n, n * (u16 length, utf-8)                       strings first used here
+             u16 n, n * (u16 symbol, u8 bids, u8 asks, (bids + asks) * (i32 price, i32 volume))
+             u16 n, n * (u16 symbol, u16 buyer, u16 seller, f64 price, i32 quantity, i64 timestamp)  own trades
+             u16 n, same                                          market trades
+             u16 n, n * (u16 product, i32 position)
+             u16 n, n * (u16 product, f64 observation)
+             u16 n, n * (u16 symbol, f64 price, f64 quantity)     orders
+             u32 length, utf-8                                    logs
+    footer   n * (i64 timestamp, u64 record offset)               index, sorted by timestamp
+             u32 n, n * (u16 length, utf-8)                       string table
+             u32 length, JSON                                     {"listings": [...]}
+    trailer  u64 index offset, u32 n, u64 strings offset, u64 meta offset, b"IMCTEND1"
+
+Strings are stored once and referenced by id (0xFFFF is None). The footer is
+written on close(); a file without one (a run that was killed) is still readable,
+the reader then rebuilds the index with one pass over the record headers.
+Ticks come back in the compressed state format of Logger.compress_state, with
+int prices as the keys of the book levels.
+Observations and order prices / quantities come back as int when they are
+integral; trade prices stay float as in the sandbox logs.
+
+    python ticklog.py convert <sandbox.log> <out.ticks>
+    python ticklog.py show <file.ticks> <timestamp>
+"""
+import atexit
+import json
+import mmap
+import struct
+import sys
+from bisect import bisect_left
+from typing import Any, Dict, List, NamedTuple, Optional
+
+MAGIC = b"IMCTICK1"
+END_MAGIC = b"IMCTEND1"
+NO_STRING = 0xFFFF
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_RECORD_HEADER = struct.Struct("<Iq")
+_BOOK_HEADER = struct.Struct("<HBB")
+_LEVEL = struct.Struct("<ii")
+_TRADE = struct.Struct("<HHHdiq")
+_POSITION = struct.Struct("<Hi")
+_OBSERVATION = struct.Struct("<Hd")
+_ORDER = struct.Struct("<Hdd")
+_INDEX_ENTRY = struct.Struct("<qQ")
+_TRAILER = struct.Struct("<QIQQ8s")
+
+
+class Tick(NamedTuple):
+    timestamp: int
+    state: Dict[str, Any]
+    orders: List[List[Any]]
+    logs: str
+
+
+def _number(value: float):
+    return int(value) if value.is_integer() else value
+
+
+class TickLogWriter:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._strings: Dict[str, int] = {}
+        self._index: List[tuple] = []
+        self._listings: Optional[list] = None
+        self._closed = False
+        atexit.register(self.close)
+
+    def __enter__(self) -> "TickLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _string(self, value: Optional[str], new: List[bytes]) -> int:
+        if value is None:
+            return NO_STRING
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            if string_id >= NO_STRING:
+                raise ValueError("too many distinct strings for a tick log")
+            self._strings[value] = string_id
+            new.append(value.encode())
+        return string_id
+
+    def write(self, state: Dict[str, Any], orders: List[List[Any]], logs: str = "") -> None:
+        """Append one tick given as a compressed state and compressed orders (see Logger)."""
+        if self._listings is None:
+            self._listings = [list(listing) for listing in state["l"]]
+
+        new: List[bytes] = []
+        string = self._string
+        parts: List[bytes] = []
+
+        order_depths = state["od"]
+        parts.append(_U16.pack(len(order_depths)))
+        for symbol in sorted(order_depths):
+            buy_orders, sell_orders = order_depths[symbol]
+            bids = sorted((int(price), volume) for price, volume in buy_orders.items())
+            asks = sorted((int(price), volume) for price, volume in sell_orders.items())
+            parts.append(_BOOK_HEADER.pack(string(symbol, new), len(bids), len(asks)))
+            parts.extend([_LEVEL.pack(price, volume) for price, volume in bids])
+            parts.extend([_LEVEL.pack(price, volume) for price, volume in asks])
+
+        for trades in (state["ot"], state["mt"]):
+            parts.append(_U16.pack(len(trades)))
+            for symbol, buyer, seller, price, quantity, timestamp in trades:
+                parts.append(_TRADE.pack(string(symbol, new), string(buyer, new), string(seller, new),
+                                         price, quantity, timestamp))
+
+        parts.append(_U16.pack(len(state["p"])))
+        parts.extend([_POSITION.pack(string(product, new), position) for product, position in state["p"].items()])
+        parts.append(_U16.pack(len(state["o"])))
+        parts.extend([_OBSERVATION.pack(string(product, new), value) for product, value in state["o"].items()])
+        parts.append(_U16.pack(len(orders)))
+        parts.extend([_ORDER.pack(string(symbol, new), price, quantity) for symbol, price, quantity in orders])
+
+        encoded_logs = logs.encode()
+        parts.append(_U32.pack(len(encoded_logs)))
+        parts.append(encoded_logs)
+
+        header = [_U16.pack(len(new))]
+        for value in new:
+            header.append(_U16.pack(len(value)))
+            header.append(value)
+
+        body = b"".join(header + parts)
+        self._index.append((state["t"], self._offset))
+        self._file.write(_RECORD_HEADER.pack(len(body), state["t"]))
+        self._file.write(body)
+        self._offset += _RECORD_HEADER.size + len(body)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+
+        index_offset = self._offset
+        self._index.sort()
+        self._file.write(b"".join([_INDEX_ENTRY.pack(timestamp, offset) for timestamp, offset in self._index]))
+
+        strings_offset = index_offset + _INDEX_ENTRY.size * len(self._index)
+        table = [_U32.pack(len(self._strings))]
+        for value in self._strings:
+            encoded = value.encode()
+            table.append(_U16.pack(len(encoded)))
+            table.append(encoded)
+        table = b"".join(table)
+        self._file.write(table)
+
+        meta_offset = strings_offset + len(table)
+        meta = json.dumps({"listings": self._listings or []}).encode()
+        self._file.write(_U32.pack(len(meta)))
+        self._file.write(meta)
+        self._file.write(_TRAILER.pack(index_offset, len(self._index), strings_offset, meta_offset, END_MAGIC))
+        self._file.close()
+
+
+class _Timestamps:
+    """Sequence view over the timestamps of the on-disk index, for bisect."""
+
+    def __init__(self, buffer, offset: int, count: int) -> None:
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> int:
+        return _INDEX_ENTRY.unpack_from(self._buffer, self._offset + i * _INDEX_ENTRY.size)[0]
+
+
+class TickLogReader:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(path + " is not a tick log")
+
+        trailer = self._buffer[-_TRAILER.size:] if len(self._buffer) >= len(MAGIC) + _TRAILER.size else b""
+        if len(trailer) == _TRAILER.size and trailer.endswith(END_MAGIC):
+            index_offset, count, strings_offset, meta_offset, _ = _TRAILER.unpack(trailer)
+            self._index_buffer = self._buffer
+            self._index_offset = index_offset
+            self._count = count
+            self._strings = self._read_strings(strings_offset)
+            meta_length = _U32.unpack_from(self._buffer, meta_offset)[0]
+            self.listings = json.loads(self._buffer[meta_offset + 4:meta_offset + 4 + meta_length])["listings"]
+        else:
+            self._recover()
+        self.timestamps = _Timestamps(self._index_buffer, self._index_offset, self._count)
+
+    def __enter__(self) -> "TickLogReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._buffer.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> Tick:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        offset = _INDEX_ENTRY.unpack_from(self._index_buffer, self._index_offset + i * _INDEX_ENTRY.size)[1]
+        return self._decode(offset)
+
+    def find(self, timestamp: int) -> int:
+        """Index of the first tick at or after timestamp (len(self) if there is none)."""
+        return bisect_left(self.timestamps, timestamp)
+
+    def seek(self, timestamp: int) -> Optional[Tick]:
+        """The first tick at or after timestamp, None past the end."""
+        i = self.find(timestamp)
+        return self[i] if i < self._count else None
+
+    def _read_strings(self, offset: int) -> List[str]:
+        buffer = self._buffer
+        count = _U32.unpack_from(buffer, offset)[0]
+        offset += 4
+        strings = []
+        for _ in range(count):
+            length = _U16.unpack_from(buffer, offset)[0]
+            strings.append(buffer[offset + 2:offset + 2 + length].decode())
+            offset += 2 + length
+        return strings
+
+    def _recover(self) -> None:
+        """Rebuild index and string table of a file whose writer was never closed."""
+        buffer = self._buffer
+        entries = []
+        strings = []
+        offset = len(MAGIC)
+        while offset + _RECORD_HEADER.size <= len(buffer):
+            length, timestamp = _RECORD_HEADER.unpack_from(buffer, offset)
+            body = offset + _RECORD_HEADER.size
+            if body + length > len(buffer):
+                break
+            new = _U16.unpack_from(buffer, body)[0]
+            position = body + 2
+            for _ in range(new):
+                string_length = _U16.unpack_from(buffer, position)[0]
+                strings.append(buffer[position + 2:position + 2 + string_length].decode())
+                position += 2 + string_length
+            entries.append((timestamp, offset))
+            offset = body + length
+
+        entries.sort()
+        self._index_buffer = b"".join([_INDEX_ENTRY.pack(timestamp, offset) for timestamp, offset in entries])
+        self._index_offset = 0
+        self._count = len(entries)
+        self._strings = strings
+        self.listings = []
+
+    def _decode(self, offset: int) -> Tick:
+        buffer = self._buffer
+        strings = self._strings
+
+        def string(string_id: int) -> Optional[str]:
+            return None if string_id == NO_STRING else strings[string_id]
+
+        length, timestamp = _RECORD_HEADER.unpack_from(buffer, offset)
+        offset += _RECORD_HEADER.size
+        new = _U16.unpack_from(buffer, offset)[0]
+        offset += 2
+        for _ in range(new):
+            offset += 2 + _U16.unpack_from(buffer, offset)[0]
+
+        order_depths = {}
+        count = _U16.unpack_from(buffer, offset)[0]
+        offset += 2
+        for _ in range(count):
+            symbol, bids, asks = _BOOK_HEADER.unpack_from(buffer, offset)
+            offset += _BOOK_HEADER.size
+            buy_orders = {}
+            for _ in range(bids):
+                price, volume = _LEVEL.unpack_from(buffer, offset)
+                buy_orders[price] = volume
+                offset += _LEVEL.size
+            sell_orders = {}
+            for _ in range(asks):
+                price, volume = _LEVEL.unpack_from(buffer, offset)
+                sell_orders[price] = volume
+                offset += _LEVEL.size
+            order_depths[strings[symbol]] = [buy_orders, sell_orders]
+
+        trade_lists = []
+        for _ in range(2):
+            count = _U16.unpack_from(buffer, offset)[0]
+            offset += 2
+            trades = []
+            for _ in range(count):
+                symbol, buyer, seller, price, quantity, trade_timestamp = _TRADE.unpack_from(buffer, offset)
+                trades.append([strings[symbol], string(buyer), string(seller), price, quantity, trade_timestamp])
+                offset += _TRADE.size
+            trade_lists.append(trades)
+
+        position = {}
+        count = _U16.unpack_from(buffer, offset)[0]
+        offset += 2
+        for _ in range(count):
+            product, value = _POSITION.unpack_from(buffer, offset)
+            position[strings[product]] = value
+            offset += _POSITION.size
+
+        observations = {}
+        count = _U16.unpack_from(buffer, offset)[0]
+        offset += 2
+        for _ in range(count):
+            product, value = _OBSERVATION.unpack_from(buffer, offset)
+            observations[strings[product]] = _number(value)
+            offset += _OBSERVATION.size
+
+        orders = []
+        count = _U16.unpack_from(buffer, offset)[0]
+        offset += 2
+        for _ in range(count):
+            symbol, price, quantity = _ORDER.unpack_from(buffer, offset)
+            orders.append([strings[symbol], _number(price), _number(quantity)])
+            offset += _ORDER.size
+
+        logs_length = _U32.unpack_from(buffer, offset)[0]
+        logs = buffer[offset + 4:offset + 4 + logs_length].decode()
+
+        state = {
+            "t": timestamp,
+            "l": self.listings,
+            "od": order_depths,
+            "ot": trade_lists[0],
+            "mt": trade_lists[1],
+            "p": position,
+            "o": observations,
+        }
+        return Tick(timestamp, state, orders, logs)
+
+
+def compress_logged(raw: Dict[str, Any]) -> Tick:
+    """
+    Tick of a sandbox log line ({"state", "orders", "logs"}) written by either the
+    compressing or the full-state Logger, with the state in compressed form.
+    Delta states must be decoded with logger.StateDecoder first.
+    """
+    state = raw["state"]
+    orders = raw["orders"]
+    if "t" not in state:
+        state = {
+            "t": state["timestamp"],
+            "l": [[listing["symbol"], listing["product"], listing["denomination"]]
+                  for listing in state["listings"].values()],
+            "od": {symbol: [depth["buy_orders"], depth["sell_orders"]]
+                   for symbol, depth in state["order_depths"].items()},
+            "ot": [[t["symbol"], t["buyer"], t["seller"], t["price"], t["quantity"], t["timestamp"]]
+                   for trades in state["own_trades"].values() for t in trades],
+            "mt": [[t["symbol"], t["buyer"], t["seller"], t["price"], t["quantity"], t["timestamp"]]
+                   for trades in state["market_trades"].values() for t in trades],
+            "p": state["position"],
+            "o": state["observations"],
+        }
+    if isinstance(orders, dict):
+        orders = [[o["symbol"], o["price"], o["quantity"]] for arr in orders.values() for o in arr]
+    return Tick(state["t"], state, orders, raw["logs"])
+
+
+def convert(log_path: str, out_path: str) -> int:
+    """Convert the Sandbox logs section of a sandbox log to a tick log. Returns the number of ticks."""
+    from sandboxlog import raw_ticks
+
+    ticks = 0
+    with TickLogWriter(out_path) as writer:
+        for raw in raw_ticks(log_path):
+            tick = compress_logged(raw)
+            writer.write(tick.state, tick.orders, tick.logs)
+            ticks += 1
+    return ticks
+
+
+def main(argv: List[str]) -> None:
+    if len(argv) == 3 and argv[0] == "convert":
+        print(convert(argv[1], argv[2]), "ticks written to", argv[2])
+    elif len(argv) == 3 and argv[0] == "show":
+        with TickLogReader(argv[1]) as reader:
+            tick = reader.seek(int(argv[2]))
+            print(json.dumps(tick._asdict() if tick is not None else None))
+    else:
+        print(__doc__.rsplit("\n\n", 1)[-1])
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,112 @@
+"""
+Time budget for Trader.run: start() when the tick begins, ask allow(name)
+before every strategy block and run the block inside guard(name, result).
+
+A block is dropped for the tick when the time already spent plus what the block
+usually takes (a moving average of its past run times) would pass its cutoff, a
+fraction of the budget: low-priority blocks get a cutoff below 1 and are the
+first to go on a heavy tick, while the others still run and run() still returns
+its orders in time. guard also catches anything a block raises, so a bad tick
+loses that block's orders instead of failing the whole run. It snapshots the
+result dict on entry and puts it back if the block raises, so whatever the
+block wrote before failing (one leg of a basket) is not sent either. Each
+tick's drops and errors come back from end_tick as one "watchdog {...}" line
+for the Logger, and are counted in dropped / errors. The budget covers the
+blocks only, so it should leave room for what run() does after them
+(Logger.flush).
+
+    self.watchdog = Watchdog(500, cutoffs={"basket": 0.6})      # in __init__
+    self.watchdog.start()                                       # first thing in run
+    if self.watchdog.allow("basket"):
+        with self.watchdog.guard("basket", result):
+            ...
+    line = self.watchdog.end_tick(state.timestamp)              # before logger.flush
+"""
+import json
+import time
+from typing import Dict, List, Optional
+
+# weight of the latest run time in a block's moving average
+SMOOTHING = 0.2
+
+
+class _Guard:
+    __slots__ = ("watchdog", "name", "start", "result", "snapshot")
+
+    def __init__(self, watchdog: "Watchdog", name: str) -> None:
+        self.watchdog = watchdog
+        self.name = name
+        self.result: Optional[Dict[str, list]] = None
+        self.snapshot: Optional[Dict[str, list]] = None
+
+    def __enter__(self) -> None:
+        result = self.result
+        # copies of the order lists too, in case the block appends to one it did not create
+        self.snapshot = {symbol: list(orders) for symbol, orders in result.items()} if result is not None else None
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        watchdog = self.watchdog
+        elapsed = time.perf_counter() - self.start
+        previous = watchdog.estimates.get(self.name)
+        watchdog.estimates[self.name] = elapsed if previous is None else previous + SMOOTHING * (elapsed - previous)
+        if exc_type is None:
+            return False
+        if self.result is not None:
+            self.result.clear()
+            self.result.update(self.snapshot)
+        watchdog.errors[self.name] = watchdog.errors.get(self.name, 0) + 1
+        watchdog._tick_errors.append(f"{self.name}: {exc_type.__name__}: {exc}")
+        return True
+
+
+class Watchdog:
+    def __init__(self, budget_ms: Optional[float] = 500, cutoffs: Optional[Dict[str, float]] = None) -> None:
+        # budget_ms None never drops a block; guard still catches errors
+        self.budget = budget_ms / 1000 if budget_ms is not None else None
+        self.cutoffs = cutoffs or {}
+        self.estimates: Dict[str, float] = {}
+        self.dropped: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._guards: Dict[str, _Guard] = {}
+        self._start = time.perf_counter()
+        self._tick_dropped: List[str] = []
+        self._tick_errors: List[str] = []
+
+    def start(self) -> None:
+        self._start = time.perf_counter()
+        self._tick_dropped = []
+        self._tick_errors = []
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._start) * 1000
+
+    def allow(self, name: str) -> bool:
+        """Whether block name fits in what is left of its share of the budget."""
+        if self.budget is None:
+            return True
+        expected = time.perf_counter() - self._start + self.estimates.get(name, 0.0)
+        if expected <= self.budget * self.cutoffs.get(name, 1.0):
+            return True
+        self.dropped[name] = self.dropped.get(name, 0) + 1
+        self._tick_dropped.append(name)
+        return False
+
+    def guard(self, name: str, result: Optional[Dict[str, list]] = None) -> _Guard:
+        """Context manager timing block name and catching its errors, rolling result back on one."""
+        guard = self._guards.get(name)
+        if guard is None:
+            guard = self._guards[name] = _Guard(self, name)
+        guard.result = result
+        return guard
+
+    def end_tick(self, timestamp: int) -> Optional[str]:
+        """The tick's "watchdog" line, None when nothing was dropped and nothing raised."""
+        if not self._tick_dropped and not self._tick_errors:
+            return None
+        record = {"t": timestamp, "ms": round(self.elapsed_ms(), 3)}
+        if self._tick_dropped:
+            record["dropped"] = self._tick_dropped
+        if self._tick_errors:
+            record["errors"] = self._tick_errors
+        return "watchdog " + json.dumps(record, separators=(",", ":"))
@@ -0,0 +1,224 @@
+"""
+Bulk loader for the island-data-bottle trade csvs
+
+    timestamp;buyer;seller;symbol;currency;price;quantity
+
+into a TradeTable of numpy columns with a day column taken from the file name
+(trades_round_<round>_day_<day>_nn.csv). Rows are sorted by symbol, day and
+timestamp, and the table keeps the row range of every symbol and every
+(symbol, day), so select() answers "PICNIC_BASKET trades of day 2 between
+t=100000 and 200000" with a dict lookup and two binary searches instead of a
+pass over every row.
+
+Round 4 repeats the days of round 3 with more products, so trade_files() keeps
+the file of the latest round for each day.
+
+    from tradedata import load_trades
+    trades = load_trades()
+    baskets = trades.select("PICNIC_BASKET", day=2, start=100000, end=200000)
+    baskets.price, baskets.quantity
+
+    python tradedata.py [symbol] [day] [start] [end]
+"""
+import glob
+import os
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from datamodel import Symbol, Trade
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_DIRS = (os.path.join(ROOT, "island-data-bottle-round-3", "island-data-bottle-round-3"),
+             os.path.join(ROOT, "island-data-bottle-round-4"))
+
+_FILE_NAME = re.compile(r"trades_round_(\d+)_day_(-?\d+)_nn\.csv$")
+_HEADER = "timestamp;buyer;seller;symbol;currency;price;quantity"
+_FIELDS = 7
+
+
+def trade_files(directories: Iterable[str] = DATA_DIRS) -> Dict[int, str]:
+    """day -> csv of that day, from the latest round that has it."""
+    latest: Dict[int, Tuple[int, str]] = {}
+    for directory in directories:
+        for path in glob.glob(os.path.join(directory, "trades_round_*_day_*_nn.csv")):
+            match = _FILE_NAME.search(path)
+            if match is None:
+                continue
+            trading_round, day = int(match.group(1)), int(match.group(2))
+            if day not in latest or trading_round > latest[day][0]:
+                latest[day] = (trading_round, path)
+    return {day: path for day, (_, path) in sorted(latest.items())}
+
+
+def _read(path: str) -> Tuple[List[str], int]:
+    """Fields of the csv rows as one flat list, and the number of rows."""
+    with open(path) as f:
+        text = f.read()
+    header, _, body = text.partition("\n")
+    if header.strip() != _HEADER:
+        raise ValueError(path + ": unexpected header " + header.strip())
+    body = body.rstrip("\n")
+    if not body:
+        return [], 0
+    fields = body.replace("\n", ";").split(";")
+    if len(fields) % _FIELDS:
+        raise ValueError(path + ": rows with a field count other than " + str(_FIELDS))
+    return fields, len(fields) // _FIELDS
+
+
+def _numbers(fields: List[str], column: int, dtype) -> np.ndarray:
+    return np.fromstring(";".join(fields[column::_FIELDS]), dtype=dtype, sep=";")
+
+
+def _encode(columns: List[List[str]]) -> Tuple[List[np.ndarray], List[str]]:
+    """int16 codes for string columns sharing one table of names, numbered in sorted order."""
+    codes: Dict[str, int] = {}
+    setdefault = codes.setdefault
+    encoded = [np.array([setdefault(value, len(codes)) for value in column], dtype=np.int16) for column in columns]
+    names = sorted(codes)
+    remap = np.empty(len(names), dtype=np.int16)
+    remap[[codes[name] for name in names]] = np.arange(len(names), dtype=np.int16)
+    return [remap[column] if len(column) else column for column in encoded], names
+
+
+class TradeTable:
+    """
+    Trades as parallel numpy columns. symbol, buyer, seller and currency are int
+    codes into the symbols, traders and currencies lists (an empty buyer or
+    seller is ""). Tables returned by select() share the columns of the table
+    they come from when the rows are contiguous.
+    """
+
+    __slots__ = ("day", "timestamp", "symbol", "buyer", "seller", "currency", "price", "quantity",
+                 "symbols", "traders", "currencies", "_symbol_rows", "_day_rows")
+
+    def __init__(self, day: np.ndarray, timestamp: np.ndarray, symbol: np.ndarray, buyer: np.ndarray,
+                 seller: np.ndarray, currency: np.ndarray, price: np.ndarray, quantity: np.ndarray,
+                 symbols: List[Symbol], traders: List[str], currencies: List[str]) -> None:
+        self.day = day
+        self.timestamp = timestamp
+        self.symbol = symbol
+        self.buyer = buyer
+        self.seller = seller
+        self.currency = currency
+        self.price = price
+        self.quantity = quantity
+        self.symbols = symbols
+        self.traders = traders
+        self.currencies = currencies
+        self._symbol_rows: Optional[Dict[Symbol, Tuple[int, int]]] = None
+        self._day_rows: Optional[Dict[Tuple[Symbol, int], Tuple[int, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def _take(self, rows) -> "TradeTable":
+        return TradeTable(self.day[rows], self.timestamp[rows], self.symbol[rows], self.buyer[rows],
+                          self.seller[rows], self.currency[rows], self.price[rows], self.quantity[rows],
+                          self.symbols, self.traders, self.currencies)
+
+    def _index(self) -> None:
+        """Row ranges per symbol and per (symbol, day) of a table sorted by symbol, day, timestamp."""
+        n = len(self)
+        symbol_rows: Dict[Symbol, Tuple[int, int]] = {}
+        day_rows: Dict[Tuple[Symbol, int], Tuple[int, int]] = {}
+        if n:
+            symbol_starts = np.flatnonzero(np.diff(self.symbol)) + 1
+            bounds = np.concatenate(([0], symbol_starts, [n]))
+            for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                symbol_rows[self.symbols[self.symbol[lo]]] = (lo, hi)
+            group_starts = np.flatnonzero((np.diff(self.symbol) != 0) | (np.diff(self.day) != 0)) + 1
+            bounds = np.concatenate(([0], group_starts, [n]))
+            for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                day_rows[(self.symbols[self.symbol[lo]], int(self.day[lo]))] = (lo, hi)
+        self._symbol_rows = symbol_rows
+        self._day_rows = day_rows
+
+    def days(self) -> List[int]:
+        return sorted(set(day for _, day in self._day_rows))
+
+    def select(self, symbol: Optional[Symbol] = None, day: Optional[int] = None,
+               start: Optional[int] = None, end: Optional[int] = None) -> "TradeTable":
+        """
+        Trades of symbol (every symbol if None) on day (every day if None) with
+        start <= timestamp < end. Only tables from load_trades() are indexed.
+        """
+        if self._day_rows is None:
+            raise ValueError("select() needs a table from load_trades()")
+        if symbol is not None and day is None and start is None and end is None:
+            lo, hi = self._symbol_rows.get(symbol, (0, 0))
+            return self._take(slice(lo, hi))
+
+        groups = [(lo, hi) for (group_symbol, group_day), (lo, hi) in self._day_rows.items()
+                  if (symbol is None or group_symbol == symbol) and (day is None or group_day == day)]
+        ranges = []
+        for lo, hi in groups:
+            if start is not None or end is not None:
+                base = lo
+                timestamps = self.timestamp[lo:hi]
+                if start is not None:
+                    lo = base + int(np.searchsorted(timestamps, start, "left"))
+                if end is not None:
+                    hi = base + int(np.searchsorted(timestamps, end, "left"))
+            if lo < hi:
+                ranges.append((lo, hi))
+
+        if not ranges:
+            return self._take(slice(0, 0))
+        if len(ranges) == 1:
+            return self._take(slice(*ranges[0]))
+        return self._take(np.concatenate([np.arange(lo, hi) for lo, hi in ranges]))
+
+    def trades(self) -> List[Trade]:
+        """The rows as datamodel.Trade, with None for an empty buyer or seller."""
+        names = [name or None for name in self.traders]
+        symbols = self.symbols
+        return [Trade(symbols[symbol], price, quantity, names[buyer], names[seller], timestamp)
+                for symbol, price, quantity, buyer, seller, timestamp in zip(
+                    self.symbol.tolist(), self.price.tolist(), self.quantity.tolist(), self.buyer.tolist(),
+                    self.seller.tolist(), self.timestamp.tolist())]
+
+
+def load_trades(files: Optional[Dict[int, str]] = None) -> TradeTable:
+    """Every trade of files (day -> csv, trade_files() by default) in one indexed TradeTable."""
+    if files is None:
+        files = trade_files()
+    fields: List[str] = []
+    days = []
+    for day, path in sorted(files.items()):
+        file_fields, rows = _read(path)
+        fields.extend(file_fields)
+        days.append(np.full(rows, day, dtype=np.int16))
+
+    day = np.concatenate(days) if days else np.empty(0, dtype=np.int16)
+    timestamp = _numbers(fields, 0, np.int64)
+    price = _numbers(fields, 5, np.float64)
+    quantity = _numbers(fields, 6, np.int32)
+    (symbol,), symbols = _encode([fields[3::_FIELDS]])
+    (buyer, seller), traders = _encode([fields[1::_FIELDS], fields[2::_FIELDS]])
+    (currency,), currencies = _encode([fields[4::_FIELDS]])
+
+    order = np.lexsort((timestamp, day, symbol))
+    table = TradeTable(day[order], timestamp[order], symbol[order], buyer[order], seller[order], currency[order],
+                       price[order], quantity[order], symbols, traders, currencies)
+    table._index()
+    return table
+
+
+def main(argv: List[str]) -> None:
+    symbol = argv[1] if len(argv) > 1 else None
+    day, start, end = (int(arg) if arg != "-" else None for arg in (argv[2:] + ["-", "-", "-"])[:3])
+    trades = load_trades()
+    selected = trades.select(symbol, day, start, end)
+    print(f"{len(trades)} trades, days {trades.days()}, symbols {', '.join(trades.symbols)}")
+    print(f"selected {len(selected)} trades, {int(selected.quantity.sum())} lots")
+    if len(selected):
+        print(f"price {selected.price.min():.1f} - {selected.price.max():.1f}, "
+              f"vwap {float(np.dot(selected.price, selected.quantity) / selected.quantity.sum()):.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)